@@ -0,0 +1,18 @@
+from typing import Any
+
+from fastapi import Response, status
+
+from app.core.value_objects.validation import type_adapter
+
+
+def model_response(tp: Any, value: Any, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Validate ``value`` as ``tp`` and serialise it with pydantic-core straight to
+    JSON bytes. Routes return this instead of the model so FastAPI does not
+    validate and encode the result a second time against ``response_model``,
+    which is still declared for the OpenAPI schema. Values that already are
+    ``tp`` instances pass through without revalidation.
+    """
+    adapter = type_adapter(tp)
+    body = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    return Response(content=body, status_code=status_code, media_type="application/json")
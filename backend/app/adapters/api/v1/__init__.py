@@ -6,6 +6,9 @@ from .company import company_router
 from .permissions import permission_router
 from .roles import role_router
 from .legal_cases import legal_case_router
+from .metrics import metrics_router
+from .audit_logs import audit_log_router
+from .clients import client_router
 
 router = APIRouter(prefix="/v1")
 
@@ -14,4 +17,7 @@ router.include_router(auth_router)
 router.include_router(company_router)
 router.include_router(permission_router)
 router.include_router(role_router)
-router.include_router(legal_case_router)
\ No newline at end of file
+router.include_router(legal_case_router)
+router.include_router(metrics_router)
+router.include_router(audit_log_router)
+router.include_router(client_router)
\ No newline at end of file
@@ -0,0 +1,56 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+from fastapi import Depends, Query
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRouter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.api.responses import model_response
+from app.adapters.orm.replica import get_read_db
+from app.adapters.orm.models.user import User
+from app.adapters.orm.security.permissions import require_permission
+from app.core.use_cases.audit_log import list_audit_logs_use_case, stream_audit_logs_use_case
+from app.core.value_objects.audit_log import AuditLogFilters, AuditLogResponse
+from app.core.value_objects.pagination import CursorPage
+
+audit_log_router = APIRouter(prefix="/audit-logs", tags=["Audit Logs"])
+
+def audit_log_filters(
+    user_id: Optional[uuid.UUID] = None,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[uuid.UUID] = None,
+    action: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> AuditLogFilters:
+    return AuditLogFilters(
+        user_id=user_id,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        action=action,
+        since=since,
+        until=until,
+    )
+
+@audit_log_router.get("/", response_model=CursorPage[AuditLogResponse])
+async def get_audit_logs(
+    filters: AuditLogFilters = Depends(audit_log_filters),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(require_permission("audit_logs", "list"))
+):
+    page = await list_audit_logs_use_case(db, filters, cursor, limit)
+    return model_response(CursorPage[AuditLogResponse], page)
+
+@audit_log_router.get("/export")
+async def export_audit_logs(
+    filters: AuditLogFilters = Depends(audit_log_filters),
+    current_user: User = Depends(require_permission("audit_logs", "export"))
+):
+    return StreamingResponse(
+        stream_audit_logs_use_case(filters),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="audit-logs.ndjson"'},
+    )
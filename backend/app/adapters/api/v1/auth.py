@@ -1,4 +1,4 @@
-from fastapi import Cookie, Depends, HTTPException, Request, BackgroundTasks, Response
+from fastapi import Cookie, Depends, HTTPException, Request, Response
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.routing import APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,13 +12,12 @@ auth_router = APIRouter(prefix="/auth", tags=["Authentication"])
 @auth_router.post("/token", response_model=TokenResponse)
 async def login_for_access_token(
     request: Request,
-    background_tasks: BackgroundTasks,
     response: Response,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: AsyncSession = Depends(get_async_db),
 ):
     
-    token = await login_for_access_token_use_case(db, form_data, background_tasks, request)
+    token = await login_for_access_token_use_case(db, form_data, request)
 
     response.set_cookie(
         key="refresh_token",
@@ -38,14 +37,13 @@ async def login_for_access_token(
 async def refresh_access_token(
     request: Request,
     response: Response,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_async_db),
     refresh_token: str = Cookie(None)
 ):
     if not refresh_token:
         raise HTTPException(status_code=401, detail="No refresh token provided")
     
-    token = await refresh_access_token_use_case(refresh_token, db, background_tasks, request)
+    token = await refresh_access_token_use_case(refresh_token, db, request)
 
     response.set_cookie(
         key="refresh_token",
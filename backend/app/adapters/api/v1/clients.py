@@ -0,0 +1,24 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.api.responses import model_response
+from app.adapters.orm.replica import get_read_db
+from app.adapters.orm.models.user import User
+from app.adapters.orm.security.auth import get_current_user
+from app.core.use_cases.client import get_client_legal_cases_use_case
+from app.core.value_objects.legal_case import LegalCaseResponse
+from app.core.value_objects.pagination import CursorPage
+
+client_router = APIRouter(prefix="/clients", tags=["Clients"])
+
+@client_router.get("/{cpf}/legal-cases", response_model=CursorPage[LegalCaseResponse])
+async def get_client_legal_cases(
+    cpf: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    page = await get_client_legal_cases_use_case(cpf, db, cursor, limit)
+    return model_response(CursorPage[LegalCaseResponse], page)
@@ -1,75 +1,198 @@
+from datetime import datetime
 from typing import Optional
 import uuid
-from fastapi import APIRouter, BackgroundTasks, Depends, Request, status, HTTPException
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile, status, HTTPException
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.adapters.orm.database import get_async_db
+from app.adapters.orm.replica import get_read_db
+from app.adapters.api.responses import model_response
 from app.core.use_cases.legal_case import (
     create_legal_case_use_case,
     get_legal_case_use_case,
+    legal_cases_query,
     list_legal_cases_use_case,
     update_legal_case_use_case,
     delete_legal_case_use_case,
+    validate_legal_case_numbers_use_case,
 )
+from app.core.use_cases.legal_case_export import EXPORT_MEDIA_TYPES, stream_legal_cases_use_case
+from app.core.use_cases.legal_case_search import search_legal_cases_use_case
+from app.core.use_cases.legal_case_import import (
+    error_report_csv,
+    import_legal_cases_use_case,
+    read_import_rows,
+)
+from app.core.value_objects.cnj import CnjValidationRequest, CnjValidationResult
 from app.core.value_objects.legal_case import (
     LegalCaseCreate,
+    LegalCaseFilters,
+    LegalCaseImportResult,
     LegalCaseUpdate,
     LegalCaseResponse,
+    LegalCaseSearchResult,
 )
+from app.core.value_objects.pagination import CursorPage
 from app.adapters.orm.models.legal_case import LegalCase
 from app.adapters.orm.security.auth import get_current_user
+from app.adapters.orm.security.permissions import require_permission
 from app.adapters.orm.models.user import User
 
 legal_case_router = APIRouter(prefix="/legal-cases", tags=["Legal Cases"])
 
+def legal_case_filters(
+    state: Optional[str] = None,
+    jurisdiction: Optional[str] = None,
+    judicial_district: Optional[str] = None,
+    court: Optional[str] = None,
+    status: Optional[str] = None,
+    assignee_from_commercial_team_id: Optional[uuid.UUID] = None,
+    assignee_from_litigation_team_id: Optional[uuid.UUID] = None,
+    case_value_min: Optional[float] = None,
+    case_value_max: Optional[float] = None,
+    created_since: Optional[datetime] = None,
+    created_until: Optional[datetime] = None,
+    cnj_year: Optional[int] = None,
+    cnj_segment: Optional[int] = None,
+    cnj_tribunal: Optional[int] = None,
+    cnj_origin: Optional[int] = None,
+) -> LegalCaseFilters:
+    try:
+        return LegalCaseFilters(
+            state=state,
+            jurisdiction=jurisdiction,
+            judicial_district=judicial_district,
+            court=court,
+            status=status,
+            assignee_from_commercial_team_id=assignee_from_commercial_team_id,
+            assignee_from_litigation_team_id=assignee_from_litigation_team_id,
+            case_value_min=case_value_min,
+            case_value_max=case_value_max,
+            created_since=created_since,
+            created_until=created_until,
+            cnj_year=cnj_year,
+            cnj_segment=cnj_segment,
+            cnj_tribunal=cnj_tribunal,
+            cnj_origin=cnj_origin,
+        )
+    except ValidationError as e:
+        # Same 422 body as a malformed query parameter
+        raise RequestValidationError(
+            [{**error, "loc": ("query", *error["loc"])} for error in e.errors(include_url=False, include_context=False)]
+        )
+
 @legal_case_router.post("/", response_model=LegalCaseResponse, status_code=status.HTTP_201_CREATED)
 async def create_legal_case(
     legal_case_in: LegalCaseCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    legal_case = await create_legal_case_use_case(legal_case_in, background_tasks, request, db, current_user)
-    return LegalCaseResponse.model_validate(legal_case)
+    legal_case = await create_legal_case_use_case(legal_case_in, request, db, current_user)
+    return model_response(LegalCaseResponse, legal_case, status.HTTP_201_CREATED)
 
 
-@legal_case_router.get("/", response_model=list[LegalCaseResponse])
-async def get_legal_cases(
+@legal_case_router.post("/import", response_model=LegalCaseImportResult)
+async def import_legal_cases(
+    request: Request,
+    file: UploadFile = File(...),
+    report: str = Query("json", pattern="^(json|csv)$"),
     db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_permission("legal_cases", "import")),
 ):
-    cases = await list_legal_cases_use_case(db)
-    return [LegalCaseResponse.model_validate(case) for case in cases]
+    result = await import_legal_cases_use_case(
+        db,
+        read_import_rows(file.filename or "", file.file),
+        current_user.id,
+        ip_address=request.client.host if request.client else None,
+        source=file.filename,
+    )
+    if report == "csv":
+        return Response(
+            content=error_report_csv(result),
+            media_type="text/csv",
+            headers={
+                "Content-Disposition": 'attachment; filename="legal-case-import-errors.csv"',
+                "X-Import-Total": str(result.total_rows),
+                "X-Import-Inserted": str(result.inserted),
+                "X-Import-Updated": str(result.updated),
+                "X-Import-Failed": str(result.failed),
+            },
+        )
+    return result
+
+@legal_case_router.post("/numbers/validate", response_model=CnjValidationResult)
+async def validate_legal_case_numbers(
+    body: CnjValidationRequest,
+    current_user: User = Depends(get_current_user),
+):
+    return model_response(CnjValidationResult, validate_legal_case_numbers_use_case(body.numbers))
+
+@legal_case_router.get("/", response_model=CursorPage[LegalCaseResponse])
+async def get_legal_cases(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    include_total: bool = False,
+    filters: LegalCaseFilters = Depends(legal_case_filters),
+    db: AsyncSession = Depends(get_read_db),
+):
+    page = await list_legal_cases_use_case(db, cursor, limit, include_total, filters)
+    return model_response(CursorPage[LegalCaseResponse], page)
+
+@legal_case_router.get("/search", response_model=CursorPage[LegalCaseSearchResult])
+async def search_legal_cases(
+    q: str = Query(..., min_length=2, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    filters: LegalCaseFilters = Depends(legal_case_filters),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(require_permission("legal_cases", "list")),
+):
+    page = await search_legal_cases_use_case(db, q, cursor, limit, filters)
+    return model_response(CursorPage[LegalCaseSearchResult], page)
+
+@legal_case_router.get("/export")
+async def export_legal_cases(
+    format: str = Query("csv", pattern="^(csv|ndjson|xlsx)$"),
+    filters: LegalCaseFilters = Depends(legal_case_filters),
+    current_user: User = Depends(require_permission("legal_cases", "export")),
+):
+    return StreamingResponse(
+        stream_legal_cases_use_case(legal_cases_query(filters), format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="legal-cases.{format}"'},
+    )
 
 @legal_case_router.get("/{legal_case_id}", response_model=LegalCaseResponse)
 async def get_legal_case(
     legal_case_id: uuid.UUID,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     case = await get_legal_case_use_case(legal_case_id, db)
     if not case:
         raise HTTPException(status_code=404, detail="Legal case not found")
-    return LegalCaseResponse.model_validate(case)
+    return model_response(LegalCaseResponse, case)
 
 @legal_case_router.put("/{legal_case_id}", response_model=LegalCaseResponse)
 async def update_legal_case(
     legal_case_id: uuid.UUID,
     legal_case_update: LegalCaseUpdate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    case = await update_legal_case_use_case(legal_case_id, legal_case_update, background_tasks, current_user, db, request)
+    case = await update_legal_case_use_case(legal_case_id, legal_case_update, current_user, db, request)
     if not case:
         raise HTTPException(status_code=404, detail="Legal case not found")
-    return LegalCaseResponse.model_validate(case)
+    return model_response(LegalCaseResponse, case)
 
 @legal_case_router.delete("/{legal_case_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_legal_case(
     legal_case_id: uuid.UUID,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
-    await delete_legal_case_use_case(legal_case_id, background_tasks, db, current_user, request)
\ No newline at end of file
+    await delete_legal_case_use_case(legal_case_id, db, current_user, request)
\ No newline at end of file
@@ -0,0 +1,40 @@
+from fastapi import Depends
+from fastapi.routing import APIRouter
+
+from app.adapters.orm.database import async_engine, describe_engine, read_async_engine
+from app.adapters.orm.replica import replica_router
+from app.adapters.orm.models.user import User
+from app.adapters.orm.security.audit import audit_sink
+from app.adapters.orm.security.hashing import password_hasher
+from app.adapters.orm.security.permissions import require_permission
+from app.adapters.orm.security.principal_cache import principal_cache
+
+metrics_router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+@metrics_router.get("/principal-cache")
+async def get_principal_cache_metrics(
+    current_user: User = Depends(require_permission("metrics", "read"))
+):
+    return principal_cache.stats()
+
+@metrics_router.get("/password-hashing")
+async def get_password_hashing_metrics(
+    current_user: User = Depends(require_permission("metrics", "read"))
+):
+    return password_hasher.stats()
+
+@metrics_router.get("/audit")
+async def get_audit_metrics(
+    current_user: User = Depends(require_permission("metrics", "read"))
+):
+    return audit_sink.stats()
+
+@metrics_router.get("/database")
+async def get_database_metrics(
+    current_user: User = Depends(require_permission("metrics", "read"))
+):
+    return {
+        "primary": describe_engine(async_engine),
+        "replica": describe_engine(read_async_engine) if read_async_engine is not None else None,
+        "routing": replica_router.stats(),
+    }
@@ -1,11 +1,14 @@
-from fastapi import Depends, status, Request, BackgroundTasks
+from fastapi import Depends, Query, status, Request
 from fastapi.routing import APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import Optional
 
 from app.adapters.orm.database import get_async_db
+from app.adapters.orm.replica import get_read_db
+from app.adapters.api.responses import model_response
 from app.adapters.orm.models.user import User
 from app.adapters.orm.security.permissions import require_permission
+from app.core.value_objects.pagination import CursorPage
 from app.core.value_objects.permission import PermissionCreate, PermissionResponse
 from app.core.use_cases.permission import (
     create_permission_use_case,
@@ -22,32 +25,32 @@ permission_router = APIRouter(prefix="/permissions", tags=["Permission Managemen
 @permission_router.post("/", response_model=PermissionResponse, status_code=status.HTTP_201_CREATED)
 async def create_permission(
     permission: PermissionCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_permission("permissions", "create"))
 ):
     return await create_permission_use_case(
         permission=permission,
-        background_tasks=background_tasks,
         request=request,
         db=db,
         current_user=current_user
     )
 
-@permission_router.get("/", response_model=List[PermissionResponse])
+@permission_router.get("/", response_model=CursorPage[PermissionResponse])
 async def get_permissions(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_async_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("permissions", "list"))
 ):
-    return await get_permissions_use_case(db=db, skip=skip, limit=limit)
+    page = await get_permissions_use_case(db=db, cursor=cursor, limit=limit, include_total=include_total)
+    return model_response(CursorPage[PermissionResponse], page)
 
 @permission_router.get("/{permission_id}", response_model=PermissionResponse)
 async def get_permission(
     permission_id: int,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(require_permission("permissions", "read"))
 ):
     return await get_permission_use_case(permission_id=permission_id, db=db)
@@ -56,7 +59,6 @@ async def get_permission(
 async def update_permission(
     permission_id: int,
     permission_update: PermissionCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_permission("permissions", "update"))
@@ -64,7 +66,6 @@ async def update_permission(
     return await update_permission_use_case(
         permission_id=permission_id,
         permission_update=permission_update,
-        background_tasks=background_tasks,
         request=request,
         db=db,
         current_user=current_user
@@ -73,14 +74,12 @@ async def update_permission(
 @permission_router.delete("/{permission_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_permission(
     permission_id: int,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_permission("permissions", "delete"))
 ):
     return await delete_permission_use_case(
         permission_id=permission_id,
-        background_tasks=background_tasks,
         request=request,
         db=db,
         current_user=current_user
@@ -90,7 +89,6 @@ async def delete_permission(
 async def assign_permission_to_role(
     permission_id: int,
     role_id: int,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_permission("permissions", "assign"))
@@ -98,7 +96,6 @@ async def assign_permission_to_role(
     return await assign_permission_to_role_use_case(
         permission_id=permission_id,
         role_id=role_id,
-        background_tasks=background_tasks,
         request=request,
         db=db,
         current_user=current_user
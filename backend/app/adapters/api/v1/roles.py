@@ -1,4 +1,4 @@
-from fastapi import Depends, status, Request, BackgroundTasks
+from fastapi import Depends, status, Request
 from fastapi.routing import APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,14 +13,12 @@ role_router = APIRouter(prefix="/roles", tags=["Role Management"])
 @role_router.post("/", response_model=RoleResponse, status_code=status.HTTP_201_CREATED)
 async def create_role(
     role: RoleCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_permission("roles", "create"))
 ):
     return await create_role_use_case(
         role=role,
-        background_tasks=background_tasks,
         request=request,
         db=db,
         current_user=current_user
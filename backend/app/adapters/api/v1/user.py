@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, status, Request, BackgroundTasks
+from fastapi import APIRouter, Depends, Query, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import Optional
 from app.adapters.orm.models.user import User
 from app.core.use_cases.user import (
     create_user_use_case,
@@ -13,70 +13,71 @@ from app.core.use_cases.user import (
 from app.adapters.orm.security.permissions import require_permission
 from app.adapters.orm.security.auth import get_current_user
 from app.adapters.orm.database import get_async_db
+from app.adapters.orm.replica import get_read_db
+from app.adapters.api.responses import model_response
 from app.core.value_objects import UserCreate, UserResponse, UserUpdate
+from app.core.value_objects.pagination import CursorPage
 
 user_router = APIRouter(prefix="/users", tags=["User Management"])
 
 @user_router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user: UserCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     # current_user: User = Depends(require_permission("users", "create"))
 ):
-    db_user = await create_user_use_case(db, user, background_tasks, request)
-    return UserResponse.model_validate(db_user)
+    db_user = await create_user_use_case(db, user, request)
+    return model_response(UserResponse, db_user, status.HTTP_201_CREATED)
 
-@user_router.get("/", response_model=List[UserResponse])
+@user_router.get("/", response_model=CursorPage[UserResponse])
 async def get_users(
-    skip: int = 0,
-    limit: int = 100,
-    db: AsyncSession = Depends(get_async_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
     # current_user: User = Depends(require_permission("users", "list"))
 ):
-    users = await get_users_use_case(db, skip, limit)
-    return [UserResponse.model_validate(u) for u in users]
+    page = await get_users_use_case(db, cursor, limit, include_total)
+    return model_response(CursorPage[UserResponse], page)
 
 @user_router.get("/me", response_model=UserResponse)
 async def get_user_me(
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     db_user = await get_user_me_use_case(current_user.id, db)
-    return UserResponse.model_validate(db_user)
+    return model_response(UserResponse, db_user)
 
 @user_router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: int,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
     # current_user: User = Depends(require_permission("users", "view"))
 ):
     db_user = await get_user_use_case(user_id, db)
-    return UserResponse.model_validate(db_user)
+    return model_response(UserResponse, db_user)
 
 
 @user_router.put("/{user_id}", response_model=UserResponse)
 async def update_user(
     user_id: int,
     user_update: UserUpdate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_permission("users", "update"))
 ):
-    db_user = await update_user_use_case(user_id, user_update, background_tasks, current_user, db, request)
-    return UserResponse.model_validate(db_user)
+    db_user = await update_user_use_case(user_id, user_update, current_user, db, request)
+    return model_response(UserResponse, db_user)
 
 @user_router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
     user_id: int,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_permission("users", "delete"))
 ):
-    response = await delete_user_use_case(user_id, background_tasks, db, current_user, request)
+    response = await delete_user_use_case(user_id, db, current_user, request)
     return response
\ No newline at end of file
@@ -0,0 +1,30 @@
+from typing import Any, Iterable, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def create_staging_table(db: AsyncSession, name: str, like: str) -> None:
+    """
+    Temporary table shaped like ``like`` that disappears at commit, for loading
+    rows with COPY before merging them into the real table.
+    """
+    await db.execute(text(
+        f'CREATE TEMP TABLE "{name}" (LIKE "{like}" INCLUDING DEFAULTS) ON COMMIT DROP'
+    ))
+
+
+async def copy_records(
+    db: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    records: Iterable[Tuple[Any, ...]],
+) -> None:
+    """
+    Load ``records`` into ``table`` with the COPY protocol on the session's own
+    connection (and transaction). Values must already be in the driver's
+    representation, e.g. JSON columns take ``str``.
+    """
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(table, records=list(records), columns=list(columns))
@@ -0,0 +1,152 @@
+"""Hashed refresh tokens and monthly-partitioned audit_logs
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:01
+
+refresh_tokens switches from raw JWTs to SHA-256 hashes grouped in rotation
+families. Raw tokens cannot be mapped onto families, so the table is recreated
+and existing sessions have to log in again.
+
+audit_logs becomes PARTITION BY RANGE (timestamp); existing rows are copied
+into monthly partitions covering their whole time span.
+"""
+from datetime import datetime, timezone
+from typing import Iterator, Sequence, Tuple, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+AUDIT_COLUMNS = 'id, user_id, action, resource_type, resource_id, details, ip_address, timestamp, created_at, deleted_at, is_deleted'
+
+
+def _months_between(first: datetime, last: datetime) -> int:
+    return (last.year - first.year) * 12 + last.month - first.month + 1
+
+
+# Copied from security.audit_partitions as of this revision, so the migration
+# does not import the application (and its engine configuration)
+def _add_months(month_start: datetime, months: int) -> datetime:
+    index = month_start.year * 12 + (month_start.month - 1) + months
+    return month_start.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def monthly_partitions(first_month: datetime, count: int) -> Iterator[Tuple[str, datetime, datetime]]:
+    """Yield ``(name, lower, upper)`` for ``count`` consecutive months."""
+    first_month = first_month.astimezone(timezone.utc)
+    lower = datetime(first_month.year, first_month.month, 1, tzinfo=timezone.utc)
+    for _ in range(count):
+        upper = _add_months(lower, 1)
+        yield f"audit_logs_p{lower.year:04d}_{lower.month:02d}", lower, upper
+        lower = upper
+
+
+def upgrade() -> None:
+    op.drop_table('refresh_tokens')
+    op.create_table('refresh_tokens',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('token_hash', sa.String(length=64), nullable=False),
+    sa.Column('family_id', sa.UUID(), nullable=False),
+    sa.Column('replaced_by_id', sa.UUID(), nullable=True),
+    sa.Column('expires_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('revoked', sa.Boolean(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('deleted_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id'),
+    sa.UniqueConstraint('token_hash')
+    )
+    op.create_index(op.f('ix_refresh_tokens_expires_at'), 'refresh_tokens', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_refresh_tokens_family_id'), 'refresh_tokens', ['family_id'], unique=False)
+
+    # Constraint-backed index names are schema-wide, so free them up first
+    op.rename_table('audit_logs', 'audit_logs_legacy')
+    op.execute('ALTER TABLE audit_logs_legacy RENAME CONSTRAINT audit_logs_pkey TO audit_logs_legacy_pkey')
+
+    op.create_table('audit_logs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=True),
+    sa.Column('action', sa.String(length=50), nullable=False),
+    sa.Column('resource_type', sa.String(length=50), nullable=False),
+    sa.Column('resource_id', sa.UUID(), nullable=True),
+    sa.Column('details', sa.JSON(), nullable=True),
+    sa.Column('ip_address', sa.String(length=45), nullable=True),
+    sa.Column('timestamp', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('deleted_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id', 'timestamp'),
+    postgresql_partition_by='RANGE (timestamp)'
+    )
+    op.create_index('ix_audit_logs_resource_timestamp_id', 'audit_logs', ['resource_type', 'resource_id', 'timestamp', 'id'], unique=False)
+    op.create_index('ix_audit_logs_timestamp_id', 'audit_logs', ['timestamp', 'id'], unique=False)
+    op.create_index('ix_audit_logs_user_id_timestamp_id', 'audit_logs', ['user_id', 'timestamp', 'id'], unique=False)
+
+    now = datetime.now(timezone.utc)
+    if context.is_offline_mode():
+        # No data to look at when only rendering SQL: cover the current months
+        oldest = newest = None
+    else:
+        oldest, newest = op.get_bind().execute(
+            sa.text('SELECT min(timestamp), max(timestamp) FROM audit_logs_legacy')
+        ).one()
+    first = min(oldest or now, now)
+    last = max(newest or now, now)
+    for name, lower, upper in monthly_partitions(first, _months_between(first, last) + MONTHS_AHEAD):
+        op.execute(
+            f'CREATE TABLE "{name}" PARTITION OF audit_logs '
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+
+    op.execute(f'INSERT INTO audit_logs ({AUDIT_COLUMNS}) SELECT {AUDIT_COLUMNS} FROM audit_logs_legacy')
+    op.drop_table('audit_logs_legacy')
+
+
+def downgrade() -> None:
+    op.rename_table('audit_logs', 'audit_logs_partitioned')
+    op.execute('ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_partitioned_pkey')
+    op.create_table('audit_logs',
+    sa.Column('user_id', sa.UUID(), nullable=True),
+    sa.Column('action', sa.String(length=50), nullable=False),
+    sa.Column('resource_type', sa.String(length=50), nullable=False),
+    sa.Column('resource_id', sa.UUID(), nullable=True),
+    sa.Column('details', sa.JSON(), nullable=True),
+    sa.Column('ip_address', sa.String(length=45), nullable=True),
+    sa.Column('timestamp', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('deleted_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id')
+    )
+    op.execute(f'INSERT INTO audit_logs ({AUDIT_COLUMNS}) SELECT {AUDIT_COLUMNS} FROM audit_logs_partitioned')
+    op.drop_table('audit_logs_partitioned')
+
+    op.drop_table('refresh_tokens')
+    op.create_table('refresh_tokens',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('token', sa.String(), nullable=False),
+    sa.Column('expires_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('revoked', sa.Boolean(), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('deleted_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id'),
+    sa.UniqueConstraint('token')
+    )
@@ -0,0 +1,27 @@
+"""Composite (created_at, id) indexes for keyset pagination
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:02
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('users', 'legal_cases', 'company', 'permissions')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
@@ -0,0 +1,23 @@
+"""Index company_user by member for "my companies" paging
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:03
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_company_user_user_id_company_id', 'company_user', ['user_id', 'company_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_company_user_user_id_company_id', table_name='company_user')
@@ -0,0 +1,23 @@
+"""Index company_user by company for member listings and counts
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:04
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_company_user_company_id_user_id', 'company_user', ['company_id', 'user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_company_user_company_id_user_id', table_name='company_user')
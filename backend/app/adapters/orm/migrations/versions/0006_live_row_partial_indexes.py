@@ -0,0 +1,55 @@
+"""Partial unique and lookup indexes over live (not soft-deleted) rows
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:05
+
+Uniqueness of usernames, emails, CNPJs, legal case numbers and permission
+names now only applies among live rows, and the lookup and keyset indexes skip
+tombstones.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('is_deleted = false')
+UNIQUE_LOOKUPS = (
+    ('users', 'username'),
+    ('users', 'email'),
+    ('legal_cases', 'legal_case_number'),
+    ('permissions', 'name'),
+)
+KEYSET_TABLES = ('users', 'legal_cases', 'company', 'permissions')
+
+
+def upgrade() -> None:
+    for table, column in UNIQUE_LOOKUPS:
+        op.drop_index(f'ix_{table}_{column}', table_name=table)
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=True, postgresql_where=LIVE_ROWS)
+
+    op.drop_constraint('company_cnpj_key', 'company', type_='unique')
+    op.create_index('ix_company_cnpj', 'company', ['cnpj'], unique=True, postgresql_where=LIVE_ROWS)
+
+    for table in KEYSET_TABLES:
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'], unique=False, postgresql_where=LIVE_ROWS)
+
+
+def downgrade() -> None:
+    for table in KEYSET_TABLES:
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'], unique=False)
+
+    op.drop_index('ix_company_cnpj', table_name='company')
+    op.create_unique_constraint('company_cnpj_key', 'company', ['cnpj'])
+
+    for table, column in UNIQUE_LOOKUPS:
+        op.drop_index(f'ix_{table}_{column}', table_name=table)
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=True)
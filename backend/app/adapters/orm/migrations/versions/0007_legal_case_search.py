@@ -0,0 +1,54 @@
+"""Full-text and trigram search over legal cases
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:06
+
+Adds the generated ``search_vector`` column (Portuguese tsvector over
+defendant, client names, subject and attorney) with a GIN index, and a
+trigram GIN index for partial case number matches. Adding a stored generated
+column rewrites the table.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('is_deleted = false')
+SEARCH_DOCUMENT = (
+    "setweight(to_tsvector('portuguese', coalesce(defendant, '')), 'A') || "
+    "setweight(jsonb_to_tsvector('portuguese', "
+    "coalesce(jsonb_path_query_array(clients::jsonb, '$[*].name'), '[]'::jsonb), '[\"string\"]'), 'A') || "
+    "setweight(to_tsvector('portuguese', coalesce(case_subject, '')), 'B') || "
+    "setweight(to_tsvector('portuguese', coalesce(attorney, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.add_column(
+        'legal_cases',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_DOCUMENT, persisted=True), nullable=True),
+    )
+    op.create_index(
+        'ix_legal_cases_search_vector', 'legal_cases', ['search_vector'],
+        unique=False, postgresql_using='gin', postgresql_where=LIVE_ROWS,
+    )
+    op.create_index(
+        'ix_legal_cases_legal_case_number_trgm', 'legal_cases', ['legal_case_number'],
+        unique=False, postgresql_using='gin', postgresql_ops={'legal_case_number': 'gin_trgm_ops'},
+        postgresql_where=LIVE_ROWS,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_legal_cases_legal_case_number_trgm', table_name='legal_cases')
+    op.drop_index('ix_legal_cases_search_vector', table_name='legal_cases')
+    op.drop_column('legal_cases', 'search_vector')
@@ -0,0 +1,52 @@
+"""Indexes for the legal case listing filters
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:07
+
+Equality filters lead composite indexes ending in (created_at, id), so a
+filtered listing page is a single index range scan in listing order. Jurisdiction
+is too coarse to be worth an index of its own.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = 'is_deleted = false'
+INDEXES = (
+    ('ix_legal_cases_status_created_at_id', ['status', 'created_at', 'id'], LIVE_ROWS),
+    (
+        'ix_legal_cases_state_judicial_district_created_at_id',
+        ['state', 'judicial_district', 'created_at', 'id'],
+        LIVE_ROWS,
+    ),
+    ('ix_legal_cases_court_created_at_id', ['court', 'created_at', 'id'], LIVE_ROWS),
+    (
+        'ix_legal_cases_commercial_assignee_created_at_id',
+        ['assignee_from_commercial_team_id', 'created_at', 'id'],
+        f'{LIVE_ROWS} AND assignee_from_commercial_team_id IS NOT NULL',
+    ),
+    (
+        'ix_legal_cases_litigation_assignee_created_at_id',
+        ['assignee_from_litigation_team_id', 'created_at', 'id'],
+        f'{LIVE_ROWS} AND assignee_from_litigation_team_id IS NOT NULL',
+    ),
+    ('ix_legal_cases_case_value', ['case_value'], f'{LIVE_ROWS} AND case_value IS NOT NULL'),
+)
+
+
+def upgrade() -> None:
+    for name, columns, where in INDEXES:
+        op.create_index(name, 'legal_cases', columns, unique=False, postgresql_where=sa.text(where))
+
+
+def downgrade() -> None:
+    for name, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='legal_cases')
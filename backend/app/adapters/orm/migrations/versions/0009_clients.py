@@ -0,0 +1,142 @@
+"""Clients table, legal case links and backfill from legal_cases.clients
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 00:00:08
+
+Clients are keyed by normalised CPF (11 digits, unique among live rows).
+Existing ``legal_cases.clients`` entries are backfilled in id order, a batch at
+a time; entries without a valid CPF are skipped, as they are at runtime.
+"""
+import json
+import re
+import uuid
+from typing import Any, Dict, Optional, Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = '0009'
+down_revision: Union[str, None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('is_deleted = false')
+BATCH_SIZE = 1000
+
+clients = sa.table(
+    'clients',
+    sa.column('id', postgresql.UUID(as_uuid=True)),
+    sa.column('name', sa.String),
+    sa.column('cpf', sa.String),
+    sa.column('is_deleted', sa.Boolean),
+)
+legal_case_clients = sa.table(
+    'legal_case_clients',
+    sa.column('legal_case_id', postgresql.UUID(as_uuid=True)),
+    sa.column('client_id', postgresql.UUID(as_uuid=True)),
+)
+
+
+def normalize_cpf(value: Any) -> Optional[str]:
+    # Frozen copy of app.core.value_objects.client.normalize_cpf
+    digits = re.sub(r'\D', '', str(value or ''))
+    if 9 <= len(digits) < 11:
+        digits = digits.zfill(11)
+    if len(digits) != 11 or digits == digits[0] * 11:
+        return None
+    for size in (9, 10):
+        total = sum(int(digit) * weight for digit, weight in zip(digits, range(size + 1, 1, -1)))
+        if total * 10 % 11 % 10 != int(digits[size]):
+            return None
+    return digits
+
+
+def backfill() -> None:
+    conn = op.get_bind()
+    last_id = None
+    while True:
+        stmt = sa.text(
+            'SELECT id, clients FROM legal_cases '
+            'WHERE clients IS NOT NULL AND is_deleted = false'
+            + (' AND id > :last_id' if last_id is not None else '')
+            + ' ORDER BY id LIMIT :limit'
+        )
+        params: Dict[str, Any] = {'limit': BATCH_SIZE}
+        if last_id is not None:
+            params['last_id'] = last_id
+        rows = conn.execute(stmt, params).all()
+        if not rows:
+            return
+        last_id = rows[-1].id
+
+        names: Dict[str, str] = {}
+        links = set()
+        for row in rows:
+            entries = json.loads(row.clients) if isinstance(row.clients, str) else row.clients
+            for entry in entries or ():
+                if not isinstance(entry, dict):
+                    continue
+                cpf = normalize_cpf(entry.get('cpf'))
+                if cpf is None:
+                    continue
+                names[cpf] = (entry.get('name') or '').strip()[:255] or names.get(cpf, '')
+                links.add((row.id, cpf))
+        if not names:
+            continue
+
+        upsert = postgresql.insert(clients).values([
+            {'id': uuid.uuid4(), 'cpf': cpf, 'name': name, 'is_deleted': False}
+            for cpf, name in names.items()
+        ])
+        upsert = upsert.on_conflict_do_update(
+            index_elements=['cpf'],
+            index_where=LIVE_ROWS,
+            set_={'name': upsert.excluded.name},
+        ).returning(clients.c.id, clients.c.cpf)
+        client_ids = {row.cpf: row.id for row in conn.execute(upsert)}
+        conn.execute(
+            postgresql.insert(legal_case_clients).on_conflict_do_nothing(),
+            [{'legal_case_id': legal_case_id, 'client_id': client_ids[cpf]} for legal_case_id, cpf in links],
+        )
+
+
+def upgrade() -> None:
+    op.create_table(
+        'clients',
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('cpf', sa.String(length=11), nullable=False),
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('deleted_at', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column('is_deleted', sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('id'),
+    )
+    op.create_index('ix_clients_cpf', 'clients', ['cpf'], unique=True, postgresql_where=LIVE_ROWS)
+    op.create_table(
+        'legal_case_clients',
+        sa.Column('legal_case_id', sa.UUID(), nullable=False),
+        sa.Column('client_id', sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['legal_case_id'], ['legal_cases.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('legal_case_id', 'client_id'),
+    )
+    op.create_index(
+        'ix_legal_case_clients_client_id_legal_case_id', 'legal_case_clients',
+        ['client_id', 'legal_case_id'], unique=False,
+    )
+    if context.is_offline_mode():
+        # The backfill parses JSON in Python, so it needs a live connection
+        op.execute('-- clients backfill skipped in offline mode; populate clients with an online upgrade')
+    else:
+        backfill()
+
+
+def downgrade() -> None:
+    op.drop_index('ix_legal_case_clients_client_id_legal_case_id', table_name='legal_case_clients')
+    op.drop_table('legal_case_clients')
+    op.drop_index('ix_clients_cpf', table_name='clients')
+    op.drop_table('clients')
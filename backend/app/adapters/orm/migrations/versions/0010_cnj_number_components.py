@@ -0,0 +1,103 @@
+"""Stored CNJ case number components
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 00:00:09
+
+Year, justice segment, tribunal and origin court of each case number get
+their own columns and indexes. Existing numbers in the CNJ format with valid
+check digits get their components backfilled and are rewritten to the
+formatted layout (NNNNNNN-DD.AAAA.J.TR.OOOO); others keep NULL components.
+The downgrade leaves the rewritten numbers formatted.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '0010'
+down_revision: Union[str, None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('is_deleted = false')
+COLUMNS = ('cnj_year', 'cnj_segment', 'cnj_tribunal', 'cnj_origin')
+
+# Stored numbers in the CNJ format with valid check digits, whatever their
+# punctuation or the surrounding ASCII whitespace parse_cnj strips. m holds
+# sequence, check digits, year, segment, tribunal and origin; the check digits
+# are valid when
+# sequence|year|segment|tribunal|origin|check digits = 1 (mod 97).
+PARSED = r"""
+    SELECT id, is_deleted, created_at, m,
+           m[1] || '-' || m[2] || '.' || m[3] || '.' || m[4] || '.' || m[5] || '.' || m[6] AS formatted
+    FROM (
+        SELECT id, is_deleted, created_at, regexp_match(
+            btrim(legal_case_number, E' \t\n\r\f\x0b'),
+            '^(\d{7})-?(\d{2})\.?(\d{4})\.?(\d)\.?(\d{2})\.?(\d{4})$'
+        ) AS m
+        FROM legal_cases
+    ) AS matched
+    WHERE m IS NOT NULL
+      AND mod((m[1] || m[3] || m[4] || m[5] || m[6] || m[2])::numeric, 97) = 1
+"""
+
+
+def upgrade() -> None:
+    for column in COLUMNS:
+        op.add_column('legal_cases', sa.Column(column, sa.SmallInteger(), nullable=True))
+
+    op.execute(f"""
+        UPDATE legal_cases
+        SET cnj_year = parsed.m[3]::smallint,
+            cnj_segment = parsed.m[4]::smallint,
+            cnj_tribunal = parsed.m[5]::smallint,
+            cnj_origin = parsed.m[6]::smallint
+        FROM ({PARSED}) AS parsed
+        WHERE parsed.id = legal_cases.id
+    """)
+    # Writes store the formatted layout, so stored numbers are brought to it
+    # too; otherwise the unique index would let both spellings coexist. Of
+    # live rows spelling the same number, only the oldest is renamed, and only
+    # if the formatted number is not live already: the rest keep their text
+    # (and components) for a manual merge.
+    op.execute(f"""
+        WITH parsed AS ({PARSED}),
+        renamed AS (
+            SELECT id, formatted FROM parsed WHERE is_deleted
+            UNION ALL
+            (
+                SELECT DISTINCT ON (formatted) id, formatted
+                FROM parsed
+                WHERE NOT is_deleted
+                  AND NOT EXISTS (
+                      SELECT 1 FROM legal_cases AS taken
+                      WHERE taken.legal_case_number = parsed.formatted AND NOT taken.is_deleted
+                  )
+                ORDER BY formatted, created_at, id
+            )
+        )
+        UPDATE legal_cases
+        SET legal_case_number = renamed.formatted
+        FROM renamed
+        WHERE renamed.id = legal_cases.id
+          AND legal_cases.legal_case_number <> renamed.formatted
+    """)
+
+    op.create_index(
+        'ix_legal_cases_cnj_year_created_at_id', 'legal_cases', ['cnj_year', 'created_at', 'id'],
+        unique=False, postgresql_where=LIVE_ROWS,
+    )
+    op.create_index(
+        'ix_legal_cases_cnj_court_created_at_id', 'legal_cases',
+        ['cnj_segment', 'cnj_tribunal', 'cnj_origin', 'created_at', 'id'],
+        unique=False, postgresql_where=LIVE_ROWS,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_legal_cases_cnj_court_created_at_id', table_name='legal_cases')
+    op.drop_index('ix_legal_cases_cnj_year_created_at_id', table_name='legal_cases')
+    for column in reversed(COLUMNS):
+        op.drop_column('legal_cases', column)
@@ -0,0 +1,37 @@
+"""Drop unique constraints duplicating primary keys
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 00:00:10
+
+Base.id used to be declared unique as well as primary key. Postgres folds a
+UNIQUE (id) created in the same CREATE TABLE as PRIMARY KEY (id) into the
+primary key index, so databases built by these migrations have no
+<table>_id_key; one added separately (e.g. by hand) would be a second B-tree
+identical to the primary key index. Drop it where it exists. New keys are
+time-ordered UUIDv7 values generated by the application; existing keys are
+left as they are.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '0011'
+down_revision: Union[str, None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# audit_logs (partitioned) and legal_cases never declared the duplicate
+TABLES = ('groups', 'permissions', 'roles', 'users', 'company', 'refresh_tokens', 'clients')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_id_key')
+
+
+def downgrade() -> None:
+    # The primary key enforces the same uniqueness, and a schema built by
+    # 0001..0010 never had these constraints, so there is nothing to restore
+    pass
@@ -5,4 +5,8 @@ from .user import User
 from .permission import Permission
 from .group import Group
 from .audit_log import AuditLog
-from .association_tables import user_roles, role_permissions, user_permissions, user_groups, group_roles
\ No newline at end of file
+from .association_tables import user_roles, role_permissions, user_permissions, user_groups, group_roles, legal_case_clients
+from .company import Company
+from .legal_case import LegalCase
+from .clients import Client
+from .refresh_token import RefreshToken
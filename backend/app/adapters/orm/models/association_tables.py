@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Table, Column
+from sqlalchemy import ForeignKey, Index, Table, Column
 from sqlalchemy.dialects.postgresql import UUID
 
 from .base import Base
@@ -43,5 +43,19 @@ company_user = Table(
     'company_user',
     Base.metadata,
     Column('company_id', UUID(as_uuid=True), ForeignKey('company.id')),
-    Column('user_id', UUID(as_uuid=True), ForeignKey('users.id'))
-)
\ No newline at end of file
+    Column('user_id', UUID(as_uuid=True), ForeignKey('users.id')),
+    # "My companies" pages through a user's memberships, member listings and
+    # member counts through a company's
+    Index('ix_company_user_user_id_company_id', 'user_id', 'company_id'),
+    Index('ix_company_user_company_id_user_id', 'company_id', 'user_id'),
+)
+# Clients of each legal case, kept in step with LegalCase.clients by
+# use_cases.client.sync_legal_case_clients
+legal_case_clients = Table(
+    'legal_case_clients',
+    Base.metadata,
+    Column('legal_case_id', UUID(as_uuid=True), ForeignKey('legal_cases.id', ondelete='CASCADE'), primary_key=True),
+    Column('client_id', UUID(as_uuid=True), ForeignKey('clients.id', ondelete='CASCADE'), primary_key=True),
+    # CPF lookups go clients -> client_id -> legal_case_id
+    Index('ix_legal_case_clients_client_id_legal_case_id', 'client_id', 'legal_case_id'),
+)
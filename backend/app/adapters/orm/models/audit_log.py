@@ -1,23 +1,36 @@
 import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
-from sqlalchemy import ForeignKey, String, JSON, Integer, TIMESTAMP, func
+from sqlalchemy import ForeignKey, Index, String, JSON, Integer, TIMESTAMP, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
+from ..ids import uuid7
 from .base import Base
 
 class AuditLog(Base):
     __tablename__ = 'audit_logs'
+    # Range-partitioned by month, see security.audit_partitions. Unique
+    # constraints on a partitioned table must include the partition key, so
+    # the primary key is (id, timestamp) and id carries no separate unique index.
+    # The composite indexes back keyset pagination on (timestamp, id) for the
+    # filters the audit API supports.
+    __table_args__ = (
+        Index('ix_audit_logs_timestamp_id', 'timestamp', 'id'),
+        Index('ix_audit_logs_user_id_timestamp_id', 'user_id', 'timestamp', 'id'),
+        Index('ix_audit_logs_resource_timestamp_id', 'resource_type', 'resource_id', 'timestamp', 'id'),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
+    )
 
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
     action: Mapped[str] = mapped_column(String(50))
     resource_type: Mapped[str] = mapped_column(String(50))
     resource_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
     details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
-    timestamp: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
+    timestamp: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), primary_key=True, server_default=func.now())
 
     user: Mapped[Optional["User"]] = relationship(back_populates="audit_logs")
 
-from .user import User
\ No newline at end of file
+from .user import User
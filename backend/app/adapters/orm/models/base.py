@@ -3,17 +3,22 @@ from sqlalchemy.orm import DeclarativeBase
 
 
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import Boolean, TIMESTAMP, func
+from sqlalchemy import Boolean, TIMESTAMP, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
 
+from app.adapters.orm.ids import uuid7
+
+# Predicate for partial indexes that only cover live (not soft-deleted) rows;
+# queries get the matching filter from orm.soft_delete.
+LIVE_ROWS = text("is_deleted = false")
+
 class Base(DeclarativeBase):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        unique=True,
+        default=uuid7,
         nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), server_default=func.now())
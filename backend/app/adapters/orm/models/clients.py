@@ -1,7 +1,15 @@
-from sqlalchemy import Column, Integer, String
-from .base import BaseModel
+from sqlalchemy import Index, String
+from sqlalchemy.orm import Mapped, mapped_column
 
-class Client(BaseModel):
+from .base import Base, LIVE_ROWS
+
+class Client(Base):
     __tablename__ = "clients"
+    # One live client per CPF; see value_objects.client.normalize_cpf for the
+    # stored form (11 digits, no punctuation)
+    __table_args__ = (
+        Index('ix_clients_cpf', 'cpf', unique=True, postgresql_where=LIVE_ROWS),
+    )
 
-    name = Column(String(255), nullable=False, unique=True)
\ No newline at end of file
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    cpf: Mapped[str] = mapped_column(String(11), nullable=False)
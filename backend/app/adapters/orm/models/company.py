@@ -1,17 +1,22 @@
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 import uuid
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy.orm import relationship, Mapped, mapped_column, query_expression
 from typing import List, Optional
 
-from .base import Base
+from .base import Base, LIVE_ROWS
 from .association_tables import company_user
 
 class Company(Base):
     __tablename__ = 'company'
+    # Backs keyset pagination in creation order, see orm.pagination
+    __table_args__ = (
+        Index('ix_company_created_at_id', 'created_at', 'id', postgresql_where=LIVE_ROWS),
+        Index('ix_company_cnpj', 'cnpj', unique=True, postgresql_where=LIVE_ROWS),
+    )
 
     name: Mapped[str] = mapped_column(String, nullable=False)
-    cnpj: Mapped[str] = mapped_column(String(18), unique=True, nullable=False)
+    cnpj: Mapped[str] = mapped_column(String(18), nullable=False)
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
     owner_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('users.id'), nullable=False)
     owner: Mapped['User'] = relationship('User', foreign_keys=[owner_id])
@@ -19,11 +24,15 @@ class Company(Base):
     created_by: Mapped['User'] = relationship('User', foreign_keys=[created_by_id])
     deleted_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(ForeignKey('users.id'), nullable=True)
     deleted_by: Mapped[Optional['User']] = relationship('User', foreign_keys=[deleted_by_id])
+    # Never loaded implicitly: firms can be large, so members are paged
+    # through /companies/{id}/members or loaded with an explicit option.
     members: Mapped[List['User']] = relationship(
         'User',
         secondary=company_user,
         back_populates='companies',
-        lazy='selectin'
+        lazy='raise'
     )
+    # Filled in by queries that ask for it, see use_cases.company.with_member_count
+    member_count: Mapped[Optional[int]] = query_expression()
 
 from .user import User
\ No newline at end of file
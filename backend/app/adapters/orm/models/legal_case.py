@@ -1,17 +1,86 @@
 from typing import List, Optional
 import uuid
-from sqlalchemy import JSON, UUID, ForeignKey, String, Text
+from sqlalchemy import JSON, UUID, Computed, ForeignKey, Index, SmallInteger, String, Text, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.adapters.orm.ids import uuid7
 from app.adapters.orm.models.user import User
 
-from .base import Base
+from .base import Base, LIVE_ROWS
+
+# Text search configuration of the search document and of search queries
+SEARCH_CONFIG = 'portuguese'
+
+# Party names weigh most, then the subject, then the attorney. Client names
+# are pulled out of the ``clients`` JSON list; every function involved is
+# immutable, as a generated column requires.
+SEARCH_DOCUMENT = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(defendant, '')), 'A') || "
+    f"setweight(jsonb_to_tsvector('{SEARCH_CONFIG}', "
+    "coalesce(jsonb_path_query_array(clients::jsonb, '$[*].name'), '[]'::jsonb), '[\"string\"]'), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(case_subject, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(attorney, '')), 'C')"
+)
 
 class LegalCase(Base):
     __tablename__ = 'legal_cases'
+    # Backs keyset pagination in creation order, see orm.pagination
+    __table_args__ = (
+        Index('ix_legal_cases_created_at_id', 'created_at', 'id', postgresql_where=LIVE_ROWS),
+        Index('ix_legal_cases_legal_case_number', 'legal_case_number', unique=True, postgresql_where=LIVE_ROWS),
+        # Listing filters, see use_cases.legal_case.legal_case_criteria. Each
+        # equality filter is followed by (created_at, id), so a filtered page
+        # comes straight off the index in listing order.
+        Index('ix_legal_cases_status_created_at_id', 'status', 'created_at', 'id', postgresql_where=LIVE_ROWS),
+        Index(
+            'ix_legal_cases_state_judicial_district_created_at_id',
+            'state', 'judicial_district', 'created_at', 'id',
+            postgresql_where=LIVE_ROWS,
+        ),
+        Index('ix_legal_cases_court_created_at_id', 'court', 'created_at', 'id', postgresql_where=LIVE_ROWS),
+        # Most cases have at most one assignee per team; unassigned rows stay out
+        Index(
+            'ix_legal_cases_commercial_assignee_created_at_id',
+            'assignee_from_commercial_team_id', 'created_at', 'id',
+            postgresql_where=text("is_deleted = false AND assignee_from_commercial_team_id IS NOT NULL"),
+        ),
+        Index(
+            'ix_legal_cases_litigation_assignee_created_at_id',
+            'assignee_from_litigation_team_id', 'created_at', 'id',
+            postgresql_where=text("is_deleted = false AND assignee_from_litigation_team_id IS NOT NULL"),
+        ),
+        Index(
+            'ix_legal_cases_case_value', 'case_value',
+            postgresql_where=text("is_deleted = false AND case_value IS NOT NULL"),
+        ),
+        # CNJ number components: year, and court as justice segment, tribunal
+        # and origin court, each prefix usable on its own
+        Index('ix_legal_cases_cnj_year_created_at_id', 'cnj_year', 'created_at', 'id', postgresql_where=LIVE_ROWS),
+        Index(
+            'ix_legal_cases_cnj_court_created_at_id',
+            'cnj_segment', 'cnj_tribunal', 'cnj_origin', 'created_at', 'id',
+            postgresql_where=LIVE_ROWS,
+        ),
+        # Full-text and partial case number search, see use_cases.legal_case_search
+        Index('ix_legal_cases_search_vector', 'search_vector', postgresql_using='gin', postgresql_where=LIVE_ROWS),
+        Index(
+            'ix_legal_cases_legal_case_number_trgm',
+            'legal_case_number',
+            postgresql_using='gin',
+            postgresql_ops={'legal_case_number': 'gin_trgm_ops'},
+            postgresql_where=LIVE_ROWS,
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    legal_case_number: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    legal_case_number: Mapped[str] = mapped_column(String(50))
+    # Parsed from legal_case_number on write (NNNNNNN-DD.AAAA.J.TR.OOOO), see
+    # value_objects.cnj; NULL for numbers predating the CNJ format
+    cnj_year: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
+    cnj_segment: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
+    cnj_tribunal: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
+    cnj_origin: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
     case_value: Mapped[Optional[float]] = mapped_column(nullable=True)
     attorney_fees_value: Mapped[Optional[float]] = mapped_column(nullable=True)
     percentage_court_awarded_attorney_fees: Mapped[Optional[float]] = mapped_column(nullable=True)
@@ -26,6 +95,10 @@ class LegalCase(Base):
     attorney: Mapped[Optional[str]] = mapped_column(String(200), nullable=True)
     clients: Mapped[Optional[list[dict]]] = mapped_column(JSON, nullable=True)
     status: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    # Maintained by Postgres; never loaded unless asked for
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed(SEARCH_DOCUMENT, persisted=True), deferred=True
+    )
     created_by_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     created_by: Mapped["User"] = relationship("User", foreign_keys=[created_by_id])
     deleted_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
@@ -1,15 +1,20 @@
 from typing import Any, Dict, List, Optional
-from sqlalchemy import String, JSON, Text
+from sqlalchemy import Index, String, JSON, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base
+from .base import Base, LIVE_ROWS
 from .association_tables import role_permissions, user_permissions
 
 
 class Permission(Base):
     __tablename__ = 'permissions'
+    # Backs keyset pagination in creation order, see orm.pagination
+    __table_args__ = (
+        Index('ix_permissions_created_at_id', 'created_at', 'id', postgresql_where=LIVE_ROWS),
+        Index('ix_permissions_name', 'name', unique=True, postgresql_where=LIVE_ROWS),
+    )
 
-    name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    name: Mapped[str] = mapped_column(String(100))
     resource: Mapped[str] = mapped_column(String(100))
     action: Mapped[str] = mapped_column(String(50))
     conditions: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
@@ -18,5 +23,8 @@ class Permission(Base):
     roles: Mapped[List["Role"]] = relationship(secondary=role_permissions, back_populates="permissions")
     users: Mapped[List["User"]] = relationship(secondary=user_permissions, back_populates="direct_permissions")
 
+    # Compiled form of `conditions`, see security.conditions; not persisted.
+    compiled_conditions = None
+
 from .role import Role
 from .user import User
\ No newline at end of file
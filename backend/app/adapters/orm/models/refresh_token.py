@@ -1,5 +1,7 @@
 from datetime import datetime
+from typing import Optional
 from sqlalchemy import TIMESTAMP, String, Boolean, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
@@ -8,8 +10,13 @@ from app.adapters.orm.models.base import Base
 class RefreshToken(Base):
     __tablename__ = 'refresh_tokens'
 
-    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('users.id'))
-    token: Mapped[str] = mapped_column(String, unique=True, nullable=False)
-    expires_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False)
+    user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey('users.id', ondelete='CASCADE'))
+    # SHA-256 hex digest of the JWT; the raw token is never stored
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    # All tokens rotated from the same login share a family, revoked together on reuse
+    family_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    replaced_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=False, index=True)
     revoked: Mapped[bool] = mapped_column(Boolean, default=False)
-    user = relationship('User')
\ No newline at end of file
+    user = relationship('User')
+
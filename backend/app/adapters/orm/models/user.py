@@ -1,20 +1,28 @@
 
 from typing import List
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base
+from .base import Base, LIVE_ROWS
 from .association_tables import user_groups, user_roles, user_permissions, company_user
 
 class User(Base):
 
     __tablename__ = 'users'
+    # Backs keyset pagination in creation order, see orm.pagination
+    # Lookups and uniqueness only cover live rows, so tombstones neither slow
+    # them down nor block reusing a username or email
+    __table_args__ = (
+        Index('ix_users_created_at_id', 'created_at', 'id', postgresql_where=LIVE_ROWS),
+        Index('ix_users_username', 'username', unique=True, postgresql_where=LIVE_ROWS),
+        Index('ix_users_email', 'email', unique=True, postgresql_where=LIVE_ROWS),
+    )
 
     first_name: Mapped[str] = mapped_column(String(50))
     last_name: Mapped[str] = mapped_column(String(50))
-    username: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    username: Mapped[str] = mapped_column(String(50))
     password_hash: Mapped[str] = mapped_column(String(255))
-    email: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    email: Mapped[str] = mapped_column(String(100))
 
     roles: Mapped[List["Role"]] = relationship(secondary=user_roles, back_populates="users")
     direct_permissions: Mapped[List["Permission"]] = relationship(secondary=user_permissions, back_populates="users")
@@ -24,6 +32,9 @@ class User(Base):
     is_active: Mapped[bool] = mapped_column(default=True)
     is_superuser: Mapped[bool] = mapped_column(default=False)
 
+    # Effective-permission index attached by get_current_user; not persisted.
+    permission_index = None
+
 from .company import Company
 from .role import Role
 from .permission import Permission
@@ -0,0 +1,154 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy import Select, inspect, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque, URL-safe cursor holding the sort key of the last row on a page."""
+    raw = json.dumps(jsonable_encoder(list(values)), separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return values
+
+
+def keyset_predicate(
+    columns: Sequence[ColumnElement],
+    values: Sequence[Any],
+    descending: bool = False,
+) -> ColumnElement:
+    """
+    Row-value comparison ``(a, b) > (:a, :b)`` (or ``<`` when descending),
+    which Postgres serves from a composite index on the same columns.
+    """
+    key = tuple_(*columns)
+    bound = tuple_(*values)
+    return key < bound if descending else key > bound
+
+
+def next_cursor(rows: Sequence[Any], limit: int, key: Any) -> Optional[str]:
+    """
+    Cursor for the page after ``rows``; callers fetch ``limit + 1`` rows so a
+    full page can be told apart from the last one.
+    """
+    if len(rows) <= limit:
+        return None
+    return encode_cursor(key(rows[limit - 1]))
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def creation_order(stmt: Select, model: Any, cursor: Optional[str], limit: int) -> Select:
+    """
+    Page ``stmt`` newest first on ``(created_at, id)``, the stable sort every
+    list endpoint shares and that the ``ix_<table>_created_at_id`` indexes serve.
+    Fetches ``limit + 1`` rows for ``next_cursor``.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor, 2)
+        try:
+            bound = (datetime.fromisoformat(created_at), uuid.UUID(row_id))
+        except (TypeError, ValueError):
+            raise _invalid_cursor()
+        stmt = stmt.where(keyset_predicate((model.created_at, model.id), bound, descending=True))
+    return stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+
+def rank_order(stmt: Select, rank: ColumnElement, model: Any, cursor: Optional[str], limit: int) -> Select:
+    """
+    Page ``stmt`` best match first on ``(rank, id)``. The rank is computed for
+    every matching row, so the match predicate should be index-served and
+    selective. Fetches ``limit + 1`` rows for ``next_cursor``.
+    """
+    if cursor:
+        score, row_id = decode_cursor(cursor, 2)
+        try:
+            bound = (float(score), uuid.UUID(row_id))
+        except (TypeError, ValueError):
+            raise _invalid_cursor()
+        stmt = stmt.where(keyset_predicate((rank, model.id), bound, descending=True))
+    return stmt.order_by(rank.desc(), model.id.desc()).limit(limit + 1)
+
+
+async def fetch_creation_page(
+    db: AsyncSession,
+    stmt: Select,
+    model: Any,
+    cursor: Optional[str],
+    limit: int,
+) -> Tuple[List[Any], Optional[str]]:
+    """Rows of one page of ``stmt`` in creation order, and the cursor for the next one."""
+    rows = (await db.execute(creation_order(stmt, model, cursor, limit))).scalars().all()
+    return rows[:limit], next_cursor(rows, limit, lambda row: (row.created_at, row.id))
+
+
+def project(stmt: Select, model: Any, response_type: Type[BaseModel], **expressions: Any) -> Select:
+    """
+    Narrow ``stmt`` to the columns ``response_type`` serialises, plus
+    ``created_at`` for the page cursor. Rows come back as plain tuples, so no
+    entity is hydrated or tracked in the identity map, and unused columns
+    (long text, relationships) never leave the database. Fields that are not
+    columns of ``model`` are taken from ``expressions``; the rest keep their
+    defaults.
+    """
+    mapped = inspect(model).column_attrs.keys()
+    columns = []
+    for name in response_type.model_fields:
+        if name in expressions:
+            columns.append(expressions[name].label(name))
+        elif name in mapped:
+            columns.append(getattr(model, name))
+    if "created_at" not in response_type.model_fields:
+        columns.append(model.created_at)
+    return stmt.with_only_columns(*columns)
+
+
+async def fetch_projected_page(
+    db: AsyncSession,
+    stmt: Select,
+    model: Any,
+    cursor: Optional[str],
+    limit: int,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Like ``fetch_creation_page`` for a ``project``-ed statement, returning row
+    mappings instead of entities; pydantic reads mappings much faster than it
+    reads attributes off ``Row`` objects.
+    """
+    rows = (await db.execute(creation_order(stmt, model, cursor, limit))).mappings().all()
+    return rows[:limit], next_cursor(rows, limit, lambda row: (row["created_at"], row["id"]))
+
+
+async def estimated_row_count(db: AsyncSession, table_name: str) -> Optional[int]:
+    """
+    Approximate row count from planner statistics (``pg_class.reltuples``),
+    which costs nothing compared to ``COUNT(*)``. ``None`` until the table has
+    been analyzed.
+    """
+    result = await db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name},
+    )
+    estimate = result.scalar()
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
@@ -0,0 +1,156 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .database import AsyncSessionLocal, ReadSessionLocal
+from app.infrastructure.config import settings
+from app.infrastructure.logger import logger
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_REPLICA_LAG = text(
+    "SELECT COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+)
+
+
+def client_key(request: Request) -> str:
+    """
+    Identify the caller for read-your-writes: the bearer token when there is
+    one (hashed, so raw tokens are never kept), the client address otherwise.
+    """
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return hashlib.sha256(authorization.encode()).hexdigest()
+    return request.client.host if request.client else ""
+
+
+class ReadYourWrites:
+    """
+    Remember clients that just wrote, so their reads stay on the primary until
+    the replica has had time to catch up. Bounded; oldest entries go first.
+    """
+
+    def __init__(self, window_seconds: float, max_entries: int = 10_000, clock: Callable[[], float] = time.monotonic):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._until: "OrderedDict[str, float]" = OrderedDict()
+
+    def record(self, key: str) -> None:
+        self._until[key] = self._clock() + self.window_seconds
+        self._until.move_to_end(key)
+        while len(self._until) > self.max_entries:
+            self._until.popitem(last=False)
+
+    def is_sticky(self, key: str) -> bool:
+        until = self._until.get(key)
+        if until is None:
+            return False
+        if until <= self._clock():
+            del self._until[key]
+            return False
+        return True
+
+    def __len__(self) -> int:
+        return len(self._until)
+
+
+class ReplicaRouter:
+    """
+    Hand out sessions for read-only work. Reads go to the replica unless there
+    is none, the caller wrote within the read-your-writes window, or the
+    replica recently failed a connection or lagged more than ``max_lag``; in
+    those cases they fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replica: Optional[async_sessionmaker],
+        read_your_writes: ReadYourWrites,
+        retry_seconds: float = 30.0,
+        max_lag_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.read_your_writes = read_your_writes
+        self.retry_seconds = retry_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self._clock = clock
+        self._down_until = 0.0
+        self._lag_checked_at: Optional[float] = None
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.fallbacks = 0
+
+    def replica_available(self) -> bool:
+        return self.replica is not None and self._clock() >= self._down_until
+
+    def mark_down(self, reason: str) -> None:
+        self._down_until = self._clock() + self.retry_seconds
+        self.fallbacks += 1
+        logger.warning(f"Read replica unavailable for {self.retry_seconds}s: {reason}")
+
+    async def _replica_session(self) -> Optional[AsyncSession]:
+        session = self.replica()
+        try:
+            # Check out a connection now, so a dead replica is noticed before
+            # the session is handed to the caller
+            connection = await session.connection()
+            now = self._clock()
+            if self._lag_checked_at is None or now - self._lag_checked_at >= self.retry_seconds:
+                self._lag_checked_at = now
+                lag = (await connection.execute(_REPLICA_LAG)).scalar()
+                if lag is not None and float(lag) > self.max_lag_seconds:
+                    self.mark_down(f"replication lag {float(lag):.1f}s")
+                    await session.close()
+                    return None
+            return session
+        except Exception as exc:
+            self.mark_down(repr(exc))
+            await session.close()
+            return None
+
+    async def open_session(self, key: Optional[str] = None) -> AsyncSession:
+        """A session for read-only work; the caller closes it."""
+        if self.replica_available() and not (key is not None and self.read_your_writes.is_sticky(key)):
+            session = await self._replica_session()
+            if session is not None:
+                self.replica_reads += 1
+                return session
+        self.primary_reads += 1
+        return self.primary()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "replica_configured": self.replica is not None,
+            "replica_available": self.replica_available(),
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "fallbacks": self.fallbacks,
+            "sticky_clients": len(self.read_your_writes),
+        }
+
+
+read_your_writes = ReadYourWrites(settings.read_your_writes_seconds)
+replica_router = ReplicaRouter(
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    read_your_writes,
+    retry_seconds=settings.read_replica_retry_seconds,
+    max_lag_seconds=settings.read_replica_max_lag_seconds,
+)
+
+
+async def get_read_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """Read-only counterpart of get_async_db, for GET routes and read use cases."""
+    session = await replica_router.open_session(client_key(request))
+    try:
+        yield session
+    finally:
+        await session.close()
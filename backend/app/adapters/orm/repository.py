@@ -0,0 +1,59 @@
+from typing import Any, Dict, Type, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models.base import Base
+
+ModelT = TypeVar("ModelT", bound=Base)
+
+
+async def insert_returning(db: AsyncSession, model: Type[ModelT], values: Dict[str, Any]) -> ModelT:
+    """INSERT the row and get it back, server defaults included, in one statement."""
+    result = await db.execute(insert(model).values(**values).returning(model))
+    return result.scalars().one()
+
+
+async def update_returning(
+    db: AsyncSession,
+    model: Type[ModelT],
+    pk: Any,
+    values: Dict[str, Any],
+    not_found: str = "Not found",
+) -> ModelT:
+    """
+    UPDATE the row with primary key ``pk`` and get it back in one statement;
+    no row coming back means it does not exist (404). With nothing to change
+    it degrades to a single SELECT.
+    """
+    if values:
+        stmt = (
+            update(model)
+            .where(model.id == pk)
+            .values(**values)
+            .returning(model)
+            .execution_options(populate_existing=True)
+        )
+    else:
+        stmt = select(model).where(model.id == pk)
+    instance = (await db.execute(stmt)).scalars().first()
+    if instance is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found)
+    return instance
+
+
+async def delete_returning(
+    db: AsyncSession,
+    model: Type[Base],
+    pk: Any,
+    *columns: Any,
+    not_found: str = "Not found",
+) -> Row:
+    """DELETE the row with primary key ``pk``, returning ``columns`` of it (404 if missing)."""
+    stmt = delete(model).where(model.id == pk).returning(*(columns or (model.id,)))
+    row = (await db.execute(stmt)).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found)
+    return row
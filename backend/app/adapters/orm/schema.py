@@ -0,0 +1,51 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.infrastructure.logger import logger
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+@lru_cache(maxsize=None)
+def head_revisions() -> Tuple[str, ...]:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return tuple(sorted(ScriptDirectory.from_config(config).get_heads()))
+
+
+def current_revisions(connection: Connection) -> Tuple[str, ...]:
+    return tuple(sorted(MigrationContext.configure(connection).get_current_heads()))
+
+
+async def check_schema_version(conn: AsyncConnection, mode: str = "strict") -> None:
+    """
+    Compare the revision stamped in ``alembic_version`` with the migrations
+    shipped in this build. Migrations themselves are applied out of band with
+    ``alembic upgrade head``; booting never touches the schema.
+    """
+    if mode == "off":
+        return
+
+    current = await conn.run_sync(current_revisions)
+    expected = head_revisions()
+    if current == expected:
+        return
+
+    message = (
+        f"Database schema is at {', '.join(current) or 'no revision'}, "
+        f"this build expects {', '.join(expected)}; run `alembic upgrade head`"
+    )
+    if mode == "strict":
+        raise SchemaVersionError(message)
+    logger.warning(message)
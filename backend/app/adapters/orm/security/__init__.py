@@ -8,6 +8,7 @@ from .auth import (
     verify_password,
     get_password_hash,
 )
+from .principal_cache import principal_cache
 from .permissions import (
     has_permission, 
     require_permission
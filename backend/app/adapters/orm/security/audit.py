@@ -1,27 +1,144 @@
-from typing import Any, Dict, Optional
+import asyncio
 import uuid
-from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert
+
+from ..database import AsyncSessionLocal
+from ..ids import uuid7
 from ..models.audit_log import AuditLog
+from app.infrastructure.config import settings
+from app.infrastructure.logger import logger
+
+_STOP = object()
+
+
+class AuditSink:
+    """
+    Application-level audit writer.
+
+    Callers enqueue rows; a single writer task drains the queue with its own
+    session and flushes them as one multi-row INSERT once ``batch_size`` rows
+    are pending or ``flush_interval`` seconds have passed since the first one.
+    The queue is bounded, so when the database falls behind callers wait on
+    ``enqueue`` instead of buffering without limit. ``stop`` drains whatever is
+    still queued before returning.
+    """
+
+    def __init__(self, max_queue_size: int = 10_000, batch_size: int = 500, flush_interval: float = 1.0):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self.enqueued = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+
+    def start(self) -> None:
+        if self._writer is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._writer = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._writer is None:
+            return
+        await self._queue.put(_STOP)
+        await self._writer
+        self._writer = None
+
+    async def enqueue(self, row: Dict[str, Any]) -> None:
+        if self._queue is None:
+            raise RuntimeError("Audit sink is not running")
+        await self._queue.put(row)
+        self.enqueued += 1
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is _STOP:
+                    stopping = True
+                    break
+                batch.append(row)
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(AuditLog), batch)
+                await session.commit()
+            self.written += len(batch)
+            self.batches += 1
+        except Exception:
+            self.failed += len(batch)
+            logger.exception(f"Failed to write {len(batch)} audit log entries")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_size": self.max_queue_size,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+
+audit_sink = AuditSink(
+    max_queue_size=settings.audit_queue_max_size,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_seconds,
+)
+
+
+def audit_log_row(
+    user_id: Optional[uuid.UUID],
+    action: str,
+    resource_type: str,
+    resource_id: Optional[uuid.UUID] = None,
+    details: Optional[Dict[str, Any]] = None,
+    ip_address: Optional[str] = None
+) -> Dict[str, Any]:
+    """Values for one ``AuditLog`` row, as written by the sink or a bulk insert."""
+    return {
+        "id": uuid7(),
+        "user_id": user_id,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "details": jsonable_encoder(details) if details is not None else None,
+        "ip_address": ip_address,
+        "timestamp": datetime.now(timezone.utc),
+    }
+
 
 async def create_audit_log(
-    db: AsyncSession,
     user_id: Optional[uuid.UUID],
     action: str,
     resource_type: str,
     resource_id: Optional[uuid.UUID] = None,
     details: Optional[Dict[str, Any]] = None,
     ip_address: Optional[str] = None
-) -> AuditLog:
-    audit_log = AuditLog(
-        user_id=user_id,
-        action=action,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        details=details,
-        ip_address=ip_address
+) -> None:
+    await audit_sink.enqueue(
+        audit_log_row(user_id, action, resource_type, resource_id, details, ip_address)
     )
-    db.add(audit_log)
-    await db.commit()
-    await db.refresh(audit_log)
-    return audit_log
\ No newline at end of file
@@ -0,0 +1,124 @@
+import asyncio
+import re
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from ..database import async_engine
+from ..models.audit_log import AuditLog
+from app.infrastructure.config import settings
+from app.infrastructure.logger import logger
+
+PARENT_TABLE = AuditLog.__tablename__
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+
+def _add_months(month_start: datetime, months: int) -> datetime:
+    index = month_start.year * 12 + (month_start.month - 1) + months
+    return month_start.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def month_start(moment: datetime) -> datetime:
+    moment = moment.astimezone(timezone.utc)
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+
+def partition_name(lower: datetime) -> str:
+    return f"{PARENT_TABLE}_p{lower.year:04d}_{lower.month:02d}"
+
+
+def monthly_partitions(first_month: datetime, count: int) -> Iterator[Tuple[str, datetime, datetime]]:
+    """Yield ``(name, lower, upper)`` for ``count`` consecutive months."""
+    lower = month_start(first_month)
+    for _ in range(count):
+        upper = _add_months(lower, 1)
+        yield partition_name(lower), lower, upper
+        lower = upper
+
+
+def partition_upper_bound(name: str) -> Optional[datetime]:
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    lower = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+    return _add_months(lower, 1)
+
+
+def expired_partitions(names: List[str], now: datetime, retention_months: int) -> List[str]:
+    """Partitions whose whole range is older than the retention window."""
+    if retention_months <= 0:
+        return []
+    cutoff = _add_months(month_start(now), -retention_months)
+    return sorted(
+        name for name in names
+        if (upper := partition_upper_bound(name)) is not None and upper <= cutoff
+    )
+
+
+async def ensure_audit_log_partitions(conn: AsyncConnection, months_ahead: int, now: Optional[datetime] = None) -> None:
+    """Create partitions for the current month and ``months_ahead`` following ones."""
+    now = now or datetime.now(timezone.utc)
+    for name, lower, upper in monthly_partitions(now, months_ahead + 1):
+        await conn.execute(text(
+            f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{PARENT_TABLE}" '
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        ))
+
+
+async def list_audit_log_partitions(conn: AsyncConnection) -> List[str]:
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "WHERE parent.relname = :parent"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return [row[0] for row in result]
+
+
+async def apply_audit_log_retention(
+    conn: AsyncConnection,
+    retention_months: int,
+    mode: str = "detach",
+    now: Optional[datetime] = None,
+) -> List[str]:
+    """
+    Detach (keeping the table around for archival) or drop partitions that
+    fall entirely outside the retention window. Either is a catalog operation,
+    never a mass DELETE.
+    """
+    if mode not in ("detach", "drop"):
+        raise ValueError(f"Unknown audit log retention mode: {mode}")
+
+    now = now or datetime.now(timezone.utc)
+    expired = expired_partitions(await list_audit_log_partitions(conn), now, retention_months)
+    for name in expired:
+        if mode == "drop":
+            await conn.execute(text(f'DROP TABLE "{name}"'))
+        else:
+            await conn.execute(text(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{name}"'))
+    return expired
+
+
+async def run_audit_log_partition_maintenance(interval_seconds: float) -> None:
+    """Periodically create upcoming partitions and apply the retention policy."""
+    while True:
+        try:
+            async with async_engine.begin() as conn:
+                await ensure_audit_log_partitions(conn, settings.audit_partition_months_ahead)
+                removed = await apply_audit_log_retention(
+                    conn,
+                    settings.audit_retention_months,
+                    settings.audit_retention_mode,
+                )
+            if removed:
+                logger.info(f"Audit log retention ({settings.audit_retention_mode}): {', '.join(removed)}")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Audit log partition maintenance failed")
+        await asyncio.sleep(interval_seconds)
@@ -1,31 +1,28 @@
+import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ...orm.database import get_async_db
+from ...orm.database import AsyncSessionLocal, get_async_db
+from ...orm.models.group import Group
+from ...orm.models.role import Role
 from ...orm.models.user import User
+from .hashing import get_password_hash, password_hasher, verify_password
+from .permission_index import PermissionIndex
+from .principal_cache import principal_cache
 
 # Security configuration
 SECRET_KEY = "secret-key"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-# Password utilities
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
-
 # JWT token functions
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
@@ -37,30 +34,40 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
 def create_refresh_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(days=7))
-    to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc)})
+    # jti keeps tokens issued within the same second distinct
+    to_encode.update({"exp": expire, "iat": datetime.now(timezone.utc), "jti": uuid.uuid4().hex})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 # User authentication
-async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
-    stmt = (
+def _principal_query(username: str):
+    return (
         select(User)
         .options(
             selectinload(User.direct_permissions),
-            selectinload(User.roles),
-            selectinload(User.groups),
+            selectinload(User.roles).selectinload(Role.permissions),
+            selectinload(User.groups).selectinload(Group.roles).selectinload(Role.permissions),
             selectinload(User.companies),
         )
         .where(User.username == username)
     )
-    result = await db.execute(stmt)
+
+async def authenticate_user(db: AsyncSession, username: str, password: str) -> Optional[User]:
+    result = await db.execute(_principal_query(username))
     user = result.scalars().first()
 
-    if not user or not verify_password(password, user.password_hash):
+    if not user or not await password_hasher.verify(password, user.password_hash):
         return None
     if not user.is_active:
         return None
     return user
 
+async def _load_principal(username: str) -> Optional[User]:
+    # Loaded in a dedicated session so the cached instance is never attached
+    # to (and mutated by) a request session.
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(_principal_query(username))
+        return result.scalars().first()
+
 # Get current user from token
 async def get_current_user(
     db: AsyncSession = Depends(get_async_db), 
@@ -73,30 +80,29 @@ async def get_current_user(
     )
     
     try:
-        print("Token received:", token)
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        print("Decoded payload:", payload)
         username: Optional[str] = payload.get("sub")
         if username is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    stmt = (
-        select(User)
-        .options(
-            selectinload(User.direct_permissions),
-            selectinload(User.roles),
-            selectinload(User.groups),
-            selectinload(User.companies),
+    cache_key = (username, payload.get("exp"))
+    cached = principal_cache.get(cache_key)
+    if cached is None:
+        principal = await _load_principal(username)
+        if principal is None:
+            raise credentials_exception
+        cached = principal_cache.set(
+            cache_key,
+            principal,
+            permissions=PermissionIndex.from_user(principal),
+            token_exp=payload.get("exp"),
         )
-        .where(User.username == username)
-    )
-    result = await db.execute(stmt)
-    user = result.scalars().first()
 
-    if user is None:
-        raise credentials_exception
+    user = await db.merge(cached.user, load=False)
+    user.permission_index = cached.permissions
+
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return user
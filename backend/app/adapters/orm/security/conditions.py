@@ -0,0 +1,205 @@
+import ipaddress
+from abc import ABC, abstractmethod
+from datetime import datetime, time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from sqlalchemy import event
+
+from app.adapters.orm.models.permission import Permission
+from app.infrastructure.logger import logger
+
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+class Condition(ABC):
+    """
+    A compiled ABAC predicate. Subclasses parse their raw JSON value once in
+    ``from_value`` and evaluate cheaply against the request context in
+    ``matches``.
+    """
+
+    name: str = ""
+
+    @classmethod
+    @abstractmethod
+    def from_value(cls, value: Any) -> "Condition":
+        ...
+
+    @abstractmethod
+    def matches(self, context: Dict[str, Any]) -> bool:
+        ...
+
+
+CONDITION_TYPES: Dict[str, Type[Condition]] = {}
+
+
+def register_condition(name: str) -> Callable[[Type[Condition]], Type[Condition]]:
+    """Register a Condition subclass under the JSON key it handles."""
+    def decorator(cls: Type[Condition]) -> Type[Condition]:
+        cls.name = name
+        CONDITION_TYPES[name] = cls
+        return cls
+    return decorator
+
+
+@register_condition("time_between")
+class TimeWindowCondition(Condition):
+    # Example condition: {"time_between": ["09:00", "17:00"]}
+    def __init__(self, start: time, end: time):
+        self.start = start
+        self.end = end
+
+    @classmethod
+    def from_value(cls, value: Any) -> "TimeWindowCondition":
+        try:
+            start, end = value
+            return cls(
+                datetime.strptime(start, "%H:%M").time(),
+                datetime.strptime(end, "%H:%M").time(),
+            )
+        except (TypeError, ValueError):
+            raise ValueError(f"time_between expects [\"HH:MM\", \"HH:MM\"], got {value!r}")
+
+    def matches(self, context: Dict[str, Any]) -> bool:
+        current_time = context.get("current_time") or datetime.now().time()
+        return self.start <= current_time <= self.end
+
+
+class IpPrefixTrie:
+    """
+    Binary prefix tree over address bits. Lookup cost is bounded by the
+    address width (32 or 128 steps) regardless of how many networks are stored.
+    """
+
+    def __init__(self, networks: Iterable[IPNetwork] = ()):
+        # node = [child_0, child_1, is_terminal]
+        self._roots: Dict[int, List[Any]] = {4: [None, None, False], 6: [None, None, False]}
+        for network in networks:
+            self.add(network)
+
+    def add(self, network: IPNetwork) -> None:
+        node = self._roots[network.version]
+        bits = int(network.network_address)
+        width = network.max_prefixlen
+        for i in range(network.prefixlen):
+            bit = (bits >> (width - 1 - i)) & 1
+            if node[bit] is None:
+                node[bit] = [None, None, False]
+            node = node[bit]
+        node[2] = True
+
+    def __contains__(self, address: IPAddress) -> bool:
+        node = self._roots[address.version]
+        if node[2]:
+            return True
+        bits = int(address)
+        width = address.max_prefixlen
+        for i in range(width):
+            node = node[(bits >> (width - 1 - i)) & 1]
+            if node is None:
+                return False
+            if node[2]:
+                return True
+        return False
+
+
+@register_condition("ip_range")
+class IpRangeCondition(Condition):
+    # Example condition: {"ip_range": ["10.0.0.0/8", "192.168.1.10"]}
+    def __init__(self, networks: Iterable[IPNetwork]):
+        self.trie = IpPrefixTrie(networks)
+
+    @classmethod
+    def from_value(cls, value: Any) -> "IpRangeCondition":
+        if isinstance(value, str):
+            value = [value]
+        try:
+            return cls(ipaddress.ip_network(entry, strict=False) for entry in value)
+        except (TypeError, ValueError):
+            raise ValueError(f"ip_range expects a list of IP addresses or CIDR networks, got {value!r}")
+
+    def matches(self, context: Dict[str, Any]) -> bool:
+        ip = context.get("ip_address")
+        if not ip:
+            return False
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        return address in self.trie
+
+
+class DenyCondition(Condition):
+    """Stands in for conditions that could not be compiled, failing closed."""
+
+    @classmethod
+    def from_value(cls, value: Any) -> "DenyCondition":
+        return cls()
+
+    def matches(self, context: Dict[str, Any]) -> bool:
+        return False
+
+
+class CompiledConditions:
+    """All conditions of a permission; matches when every one of them does."""
+
+    def __init__(self, conditions: Iterable[Condition] = ()):
+        self.conditions: Tuple[Condition, ...] = tuple(conditions)
+
+    def matches(self, context: Dict[str, Any]) -> bool:
+        for condition in self.conditions:
+            if not condition.matches(context):
+                return False
+        return True
+
+    def __bool__(self) -> bool:
+        return bool(self.conditions)
+
+
+def compile_conditions(conditions: Optional[Dict[str, Any]]) -> CompiledConditions:
+    """
+    Compile raw permission conditions. Raises ValueError on malformed values;
+    unknown condition types are ignored, as they always have been.
+    """
+    compiled = []
+    for condition_key, condition_value in (conditions or {}).items():
+        condition_type = CONDITION_TYPES.get(condition_key)
+        if condition_type is None:
+            logger.warning(f"Ignoring unknown permission condition '{condition_key}'")
+            continue
+        compiled.append(condition_type.from_value(condition_value))
+    return CompiledConditions(compiled)
+
+
+def compiled_conditions_for(permission: Permission) -> CompiledConditions:
+    compiled = permission.compiled_conditions
+    if compiled is None:
+        try:
+            compiled = compile_conditions(permission.conditions)
+        except ValueError as e:
+            logger.error(f"Permission '{permission.name}' has invalid conditions, denying: {e}")
+            compiled = CompiledConditions([DenyCondition()])
+        permission.compiled_conditions = compiled
+    return compiled
+
+
+# Compile once when a Permission is loaded, refreshed or has its conditions set
+@event.listens_for(Permission, "load")
+def _compile_on_load(target: Permission, context: Any) -> None:
+    target.compiled_conditions = None
+    compiled_conditions_for(target)
+
+
+@event.listens_for(Permission, "refresh")
+def _compile_on_refresh(target: Permission, context: Any, attrs: Optional[Iterable[str]]) -> None:
+    if attrs is None or "conditions" in attrs:
+        target.compiled_conditions = None
+        compiled_conditions_for(target)
+
+
+@event.listens_for(Permission.conditions, "set")
+def _invalidate_on_set(target: Permission, value: Any, oldvalue: Any, initiator: Any) -> None:
+    target.compiled_conditions = None
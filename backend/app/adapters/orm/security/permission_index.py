@@ -0,0 +1,65 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.adapters.orm.models.permission import Permission
+from app.adapters.orm.models.user import User
+from .conditions import CompiledConditions, compiled_conditions_for
+
+PermissionKey = Tuple[str, str]
+
+
+def iter_effective_permissions(user: User) -> Iterable[Permission]:
+    """
+    Yield every permission granted to the user: direct, through roles and
+    through groups' roles. Requires those relationships to be loaded.
+    """
+    yield from user.direct_permissions
+    for role in user.roles:
+        yield from role.permissions
+    for group in user.groups:
+        for role in group.roles:
+            yield from role.permissions
+
+
+class PermissionIndex:
+    """
+    A user's effective permissions flattened into a
+    ``(resource, action) -> [compiled conditions]`` map.
+
+    Built once when the principal is loaded, so a permission check is a dict
+    lookup plus evaluation of the (usually empty) conditions for that key.
+    """
+
+    def __init__(self, permissions: Iterable[Permission] = ()):
+        self._unconditional: Set[PermissionKey] = set()
+        self._conditional: Dict[PermissionKey, List[CompiledConditions]] = {}
+        for permission in permissions:
+            self.add(permission)
+
+    @classmethod
+    def from_user(cls, user: User) -> "PermissionIndex":
+        return cls(iter_effective_permissions(user))
+
+    def add(self, permission: Permission) -> None:
+        key = (permission.resource, permission.action)
+        conditions = compiled_conditions_for(permission)
+        if not conditions:
+            self._unconditional.add(key)
+            self._conditional.pop(key, None)
+        elif key not in self._unconditional:
+            self._conditional.setdefault(key, []).append(conditions)
+
+    def allows(self, resource: str, action: str, context: Optional[Dict[str, Any]] = None) -> bool:
+        key = (resource, action)
+        if key in self._unconditional:
+            return True
+        candidates = self._conditional.get(key)
+        if not candidates:
+            return False
+        context = context or {}
+        return any(conditions.matches(context) for conditions in candidates)
+
+    def __contains__(self, key: PermissionKey) -> bool:
+        return key in self._unconditional or key in self._conditional
+
+    def __len__(self) -> int:
+        return len(self._unconditional) + len(self._conditional)
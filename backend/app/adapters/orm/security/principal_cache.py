@@ -0,0 +1,135 @@
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set, Tuple
+
+from app.adapters.orm.models.user import User
+from app.infrastructure.config import settings
+from .permission_index import PermissionIndex
+
+# (username, token exp)
+PrincipalKey = Tuple[str, Optional[int]]
+
+
+@dataclass
+class CachedPrincipal:
+    user: User
+    permissions: PermissionIndex
+    expires_at: float
+
+
+class PrincipalCache:
+    """
+    Bounded in-process cache of authenticated principals.
+
+    Entries are keyed by ``(username, exp)`` so a new token always gets its
+    own entry, expire after ``ttl_seconds`` (or when the token itself expires,
+    whichever comes first) and are evicted in LRU order once ``max_size`` is
+    reached. Cached users are detached snapshots: callers must ``merge`` them
+    into their own session instead of using them directly.
+
+    The cache is per worker process, so invalidation only reaches the local
+    worker; the TTL bounds how stale other workers can be.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[PrincipalKey, CachedPrincipal]" = OrderedDict()
+        self._keys_by_user: Dict[uuid.UUID, Set[PrincipalKey]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: PrincipalKey) -> Optional[CachedPrincipal]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(
+        self,
+        key: PrincipalKey,
+        user: User,
+        permissions: Optional[PermissionIndex] = None,
+        token_exp: Optional[int] = None,
+    ) -> CachedPrincipal:
+        if permissions is None:
+            permissions = PermissionIndex.from_user(user)
+        if self.max_size <= 0:
+            return CachedPrincipal(user=user, permissions=permissions, expires_at=self._clock())
+
+        ttl = self.ttl_seconds
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+
+        if key in self._entries:
+            self._remove(key)
+        entry = CachedPrincipal(user=user, permissions=permissions, expires_at=self._clock() + ttl)
+        self._entries[key] = entry
+        self._keys_by_user.setdefault(user.id, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+        return entry
+
+    def invalidate_user(self, user_id: uuid.UUID) -> int:
+        keys = self._keys_by_user.pop(user_id, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._keys_by_user.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: PrincipalKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._keys_by_user.get(entry.user.id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[entry.user.id]
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.principal_cache_max_size,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
@@ -0,0 +1,113 @@
+import asyncio
+import hashlib
+import math
+from datetime import datetime, timezone
+from typing import Iterable
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.orm.database import AsyncSessionLocal
+from app.adapters.orm.models.refresh_token import RefreshToken
+from app.infrastructure.config import settings
+from app.infrastructure.logger import logger
+
+
+def hash_refresh_token(token: str) -> str:
+    """Fixed-size lookup key for a refresh token; the raw JWT is never stored."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class BloomFilter:
+    """
+    Bloom filter over token hashes. Membership may report false positives
+    (which callers confirm against the table) but never false negatives.
+    Entries cannot be removed; the filter is rebuilt from the table instead.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, token_hash: str) -> Iterable[int]:
+        # Token hashes are already uniformly distributed SHA-256 digests, so
+        # double hashing over two slices of them is enough.
+        digest = bytes.fromhex(token_hash)
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, token_hash: str) -> None:
+        for position in self._positions(token_hash):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, token_hash: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(token_hash))
+
+    def replace(self, other: "BloomFilter") -> None:
+        self._bits = other._bits
+        self.count = other.count
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+
+revoked_refresh_tokens = BloomFilter(
+    capacity=settings.refresh_token_bloom_capacity,
+    error_rate=settings.refresh_token_bloom_error_rate,
+)
+
+
+async def load_revoked_refresh_tokens(db: AsyncSession) -> int:
+    """Rebuild the revoked-token filter from revoked, still-unexpired rows."""
+    result = await db.stream_scalars(
+        select(RefreshToken.token_hash).where(
+            RefreshToken.revoked == True,
+            RefreshToken.expires_at > datetime.now(timezone.utc),
+        ).execution_options(yield_per=10_000)
+    )
+    rebuilt = BloomFilter(revoked_refresh_tokens.capacity, revoked_refresh_tokens.error_rate)
+    async for token_hash in result:
+        rebuilt.add(token_hash)
+    revoked_refresh_tokens.replace(rebuilt)
+    return rebuilt.count
+
+
+async def prune_expired_refresh_tokens(db: AsyncSession, batch_size: int = 10_000) -> int:
+    """Delete expired rows in bounded batches so no single statement holds long locks."""
+    deleted = 0
+    now = datetime.now(timezone.utc)
+    while True:
+        expired_ids = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at <= now)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        result = await db.execute(delete(RefreshToken).where(RefreshToken.id.in_(expired_ids)))
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+
+
+async def run_refresh_token_maintenance(interval_seconds: float) -> None:
+    """Periodically prune expired refresh tokens and rebuild the revoked filter."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as db:
+                pruned = await prune_expired_refresh_tokens(db, settings.refresh_token_prune_batch_size)
+                revoked = await load_revoked_refresh_tokens(db)
+            logger.info(f"Refresh tokens: pruned {pruned} expired, {revoked} revoked tracked")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Refresh token maintenance failed")
+        await asyncio.sleep(interval_seconds)
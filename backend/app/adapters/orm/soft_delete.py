@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from sqlalchemy import event, false
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from .models.base import Base
+
+# Execution option that lets a statement see soft-deleted rows:
+# select(Company).execution_options(include_deleted=True)
+INCLUDE_DELETED = "include_deleted"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(execute_state: ORMExecuteState) -> None:
+    """
+    Add ``is_deleted = false`` for every ``Base`` model to ORM SELECTs, UPDATEs
+    and DELETEs, unless the statement opts out with ``include_deleted``. Lazy
+    and column loads inherit the criteria from the statement that loaded the
+    parent, so they are left alone.
+    """
+    if execute_state.is_column_load or execute_state.is_relationship_load:
+        return
+    if not (execute_state.is_select or execute_state.is_update or execute_state.is_delete):
+        return
+    if execute_state.execution_options.get(INCLUDE_DELETED, False):
+        return
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(Base, lambda cls: cls.is_deleted == false(), include_aliases=True)
+    )
+
+
+def soft_delete_values() -> Dict[str, Any]:
+    """Column values that turn a row into a tombstone."""
+    return {"is_deleted": True, "deleted_at": datetime.now(timezone.utc)}
@@ -0,0 +1,60 @@
+"""
+Bulk-import legal cases from a CSV or XLSX file.
+
+Run from the backend directory:
+
+    python -m app.cli.import_legal_cases cases.xlsx --user admin [--report errors.csv]
+"""
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import select
+
+from app.adapters.orm.database import AsyncSessionLocal
+from app.adapters.orm.models.user import User
+from app.core.use_cases.legal_case_import import (
+    error_report_csv,
+    import_legal_cases_use_case,
+    read_import_rows,
+)
+
+
+async def run(path: str, username: str, report_path: str, batch_size: int) -> int:
+    async with AsyncSessionLocal() as db:
+        user_id = await db.scalar(select(User.id).where(User.username == username))
+        if user_id is None:
+            print(f"Unknown user: {username}", file=sys.stderr)
+            return 2
+        with open(path, "rb") as stream:
+            result = await import_legal_cases_use_case(
+                db,
+                read_import_rows(path, stream),
+                user_id,
+                source=path,
+                batch_size=batch_size,
+            )
+
+    print(
+        f"{result.total_rows} rows: {result.inserted} inserted, "
+        f"{result.updated} updated, {result.failed} failed"
+    )
+    if result.errors:
+        with open(report_path, "w", newline="") as report:
+            report.write(error_report_csv(result))
+        print(f"Error report written to {report_path}")
+    return 1 if result.failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help=".csv or .xlsx file to import")
+    parser.add_argument("--user", required=True, help="username recorded as creator and in the audit log")
+    parser.add_argument("--report", default="legal-case-import-errors.csv", help="where to write rejected rows")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.path, args.user, args.report, args.batch_size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import uuid
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.orm.models.audit_log import AuditLog
+from app.adapters.orm.pagination import _invalid_cursor, decode_cursor, keyset_predicate, next_cursor
+from app.adapters.orm.replica import replica_router
+from app.core.value_objects.audit_log import AuditLogFilters, AuditLogResponse
+from app.core.value_objects.pagination import CursorPage
+from app.core.value_objects.validation import validate_many
+
+def _filtered_audit_logs(filters: AuditLogFilters):
+    conditions = []
+    if filters.user_id is not None:
+        conditions.append(AuditLog.user_id == filters.user_id)
+    if filters.resource_type is not None:
+        conditions.append(AuditLog.resource_type == filters.resource_type)
+    if filters.resource_id is not None:
+        conditions.append(AuditLog.resource_id == filters.resource_id)
+    if filters.action is not None:
+        conditions.append(AuditLog.action == filters.action)
+    # Bounds on the partition key let Postgres prune whole monthly partitions
+    if filters.since is not None:
+        conditions.append(AuditLog.timestamp >= filters.since)
+    if filters.until is not None:
+        conditions.append(AuditLog.timestamp < filters.until)
+    return select(AuditLog).where(*conditions)
+
+async def list_audit_logs_use_case(
+    db: AsyncSession,
+    filters: AuditLogFilters,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> CursorPage[AuditLogResponse]:
+    stmt = _filtered_audit_logs(filters)
+    if cursor:
+        timestamp, log_id = decode_cursor(cursor, 2)
+        try:
+            bound = (datetime.fromisoformat(timestamp), uuid.UUID(log_id))
+        except (TypeError, ValueError):
+            raise _invalid_cursor()
+        stmt = stmt.where(keyset_predicate((AuditLog.timestamp, AuditLog.id), bound, descending=True))
+    stmt = stmt.order_by(AuditLog.timestamp.desc(), AuditLog.id.desc()).limit(limit + 1)
+
+    result = await db.execute(stmt)
+    logs: List[AuditLog] = result.scalars().all()
+
+    return CursorPage[AuditLogResponse](
+        items=validate_many(AuditLogResponse, logs[:limit]),
+        next_cursor=next_cursor(logs, limit, lambda log: (log.timestamp, log.id)),
+    )
+
+async def stream_audit_logs_use_case(filters: AuditLogFilters, batch_size: int = 1000) -> AsyncIterator[bytes]:
+    """
+    Yield matching audit logs as NDJSON, oldest first, through a server-side
+    cursor. Opens its own session because the response outlives the request's
+    dependencies.
+    """
+    stmt = (
+        _filtered_audit_logs(filters)
+        .order_by(AuditLog.timestamp, AuditLog.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async with await replica_router.open_session() as db:
+        result = await db.stream_scalars(stmt)
+        async for partition in result.partitions():
+            lines = [log.model_dump_json() for log in validate_many(AuditLogResponse, partition)]
+            # Identity map would otherwise keep every streamed row alive
+            db.expunge_all()
+            yield ("\n".join(lines) + "\n").encode()
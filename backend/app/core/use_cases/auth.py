@@ -1,20 +1,22 @@
 import uuid
-from fastapi import HTTPException, status, BackgroundTasks, Request
+from typing import Optional
+from fastapi import HTTPException, status, Request
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta, timezone
 from jose import JWTError, jwt
 
 from app.core.value_objects.token import Token
+from app.adapters.orm.ids import uuid7
 from app.adapters.orm.models.refresh_token import RefreshToken
 from app.adapters.orm.security.auth import ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, SECRET_KEY, authenticate_user, create_access_token, create_refresh_token
 from app.adapters.orm.security.audit import create_audit_log
+from app.adapters.orm.security.refresh_tokens import hash_refresh_token, revoked_refresh_tokens
 
 async def login_for_access_token_use_case(
     db: AsyncSession,
     form_data: OAuth2PasswordRequestForm,
-    background_tasks: BackgroundTasks,
     request: Request,
 ) -> Token:
     user = await authenticate_user(db, form_data.username, form_data.password)
@@ -37,9 +39,7 @@ async def login_for_access_token_use_case(
 
     await store_refresh_token(db, user.id, refresh_token)
 
-    background_tasks.add_task(
-        create_audit_log,
-        db=db,
+    await create_audit_log(
         user_id=user.id,
         action="login",
         resource_type="auth",
@@ -52,7 +52,6 @@ async def login_for_access_token_use_case(
 async def refresh_access_token_use_case(
     refresh_token: str,
     db: AsyncSession,
-    background_tasks: BackgroundTasks,
     request: Request,
 ) -> Token:
     try:
@@ -63,53 +62,130 @@ async def refresh_access_token_use_case(
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid refresh token")
 
-    # TODO: check token revocation/blacklist here
-    access_token = create_access_token(
-        data={"sub": str(username)},
-        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    )
     new_refresh_token = create_refresh_token(
         data={"sub": str(username)},
         expires_delta=timedelta(days=7)
     )
+    user_id = await rotate_refresh_token(db, refresh_token, new_refresh_token)
 
-    if background_tasks and request:
-        background_tasks.add_task(
-            create_audit_log,
-            db=db,
-            # user_id=user_id,
-            action="refresh_token",
-            resource_type="auth",
-            details={"success": True},
-            ip_address=request.client.host if request and request.client else None
-        )
+    access_token = create_access_token(
+        data={"sub": str(username)},
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+
+    await create_audit_log(
+        user_id=user_id,
+        action="refresh_token",
+        resource_type="auth",
+        details={"success": True},
+        ip_address=request.client.host if request and request.client else None
+    )
 
     return Token(access_token=access_token, refresh_token=new_refresh_token, token_type="Bearer")
 
-async def store_refresh_token(db: AsyncSession, user_id: uuid.UUID, token: str, expires_in_days: int = 7):
+async def store_refresh_token(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    token: str,
+    expires_in_days: int = 7,
+    family_id: Optional[uuid.UUID] = None,
+):
     expires_at = datetime.now(timezone.utc) + timedelta(days=expires_in_days)
-    db_token = RefreshToken(user_id=user_id, token=token, expires_at=expires_at)
+    db_token = RefreshToken(
+        user_id=user_id,
+        token_hash=hash_refresh_token(token),
+        family_id=family_id or uuid.uuid4(),
+        expires_at=expires_at,
+    )
     db.add(db_token)
     await db.commit()
-    await db.refresh(db_token)
 
     return db_token
 
+async def _revoke_family_if_reused(db: AsyncSession, token_hash: str) -> bool:
+    result = await db.execute(
+        select(RefreshToken.family_id, RefreshToken.revoked).where(RefreshToken.token_hash == token_hash)
+    )
+    existing = result.first()
+    if existing is None or not existing.revoked:
+        return False
+
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == existing.family_id, RefreshToken.revoked == False)
+        .values(revoked=True)
+    )
+    await db.commit()
+    revoked_refresh_tokens.add(token_hash)
+    return True
+
+async def rotate_refresh_token(db: AsyncSession, token: str, new_token: str) -> uuid.UUID:
+    """
+    Revoke ``token`` and issue ``new_token`` in its family. The happy path is a
+    single indexed UPDATE ... RETURNING on token_hash. Presenting a token that
+    was already rotated or revoked is treated as theft: the whole family is
+    revoked and the caller gets a 401.
+    """
+    invalid_token = HTTPException(status_code=401, detail="Invalid refresh token")
+    token_hash = hash_refresh_token(token)
+
+    # The filter can report false positives, so a hit is confirmed against the table
+    if token_hash in revoked_refresh_tokens and await _revoke_family_if_reused(db, token_hash):
+        raise invalid_token
+
+    new_id = uuid7()
+    result = await db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked == False,
+            RefreshToken.expires_at > datetime.now(timezone.utc),
+        )
+        .values(revoked=True, replaced_by_id=new_id)
+        .returning(RefreshToken.user_id, RefreshToken.family_id)
+    )
+    rotated = result.first()
+    if rotated is None:
+        # Unknown, expired, or revoked by another worker since the filter was built
+        await _revoke_family_if_reused(db, token_hash)
+        raise invalid_token
+
+    db.add(RefreshToken(
+        id=new_id,
+        user_id=rotated.user_id,
+        token_hash=hash_refresh_token(new_token),
+        family_id=rotated.family_id,
+        expires_at=datetime.now(timezone.utc) + timedelta(days=7),
+    ))
+    await db.commit()
+    revoked_refresh_tokens.add(token_hash)
+    return rotated.user_id
+
 async def revoke_refresh_token(db: AsyncSession, token: str):
-    result = await db.execute(select(RefreshToken).where(RefreshToken.token == token))
-    db_token = result.scalars().first()
-    if db_token:
-        db_token.revoked = True
+    if not token:
+        return
+    token_hash = hash_refresh_token(token)
+    result = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.token_hash == token_hash, RefreshToken.revoked == False)
+        .values(revoked=True)
+        .returning(RefreshToken.id)
+    )
+    if result.first() is not None:
         await db.commit()
+        revoked_refresh_tokens.add(token_hash)
 
-async def is_refresh_token_valid(db: AsyncSession, token: str, user_id: int):
+async def is_refresh_token_valid(db: AsyncSession, token: str, user_id: uuid.UUID):
+    # A revoked-filter hit may be a false positive and a miss proves nothing
+    # about expiry, so the table is the only answer here
+    token_hash = hash_refresh_token(token)
     result = await db.execute(
-        select(RefreshToken).where(
-            RefreshToken.token == token,
+        select(RefreshToken.id).where(
+            RefreshToken.token_hash == token_hash,
             RefreshToken.user_id == user_id,
             RefreshToken.revoked == False,
             RefreshToken.expires_at > datetime.now(timezone.utc)
         )
     )
 
-    return result.scalars().first() is not None
\ No newline at end of file
+    return result.first() is not None
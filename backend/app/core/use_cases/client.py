@@ -0,0 +1,114 @@
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, false, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.orm.ids import uuid7
+from app.adapters.orm.models.association_tables import legal_case_clients
+from app.adapters.orm.models.clients import Client
+from app.adapters.orm.models.legal_case import LegalCase
+from app.adapters.orm.pagination import fetch_projected_page, project
+from app.core.value_objects.client import normalize_cpf
+from app.core.value_objects.legal_case import LegalCaseResponse
+from app.core.value_objects.pagination import CursorPage
+from app.core.value_objects.validation import validate_many
+
+# Rows per multi-VALUES statement, well under Postgres' bind parameter limit
+CHUNK_SIZE = 1000
+
+CaseClients = Tuple[uuid.UUID, Optional[List[Dict[str, Any]]]]
+
+
+def client_links(cases: Iterable[CaseClients]) -> Tuple[Dict[str, str], Set[Tuple[uuid.UUID, str]]]:
+    """
+    Clients named by ``LegalCase.clients`` (CPF -> name, the last name seen
+    wins) and the (legal case, CPF) pairs linking them. Entries without a
+    valid CPF cannot be matched to anyone and are left out.
+    """
+    names: Dict[str, str] = {}
+    links: Set[Tuple[uuid.UUID, str]] = set()
+    for legal_case_id, clients in cases:
+        for client in clients or ():
+            if not isinstance(client, dict):
+                continue
+            cpf = normalize_cpf(client.get("cpf"))
+            if cpf is None:
+                continue
+            names[cpf] = (client.get("name") or "").strip()[:255] or names.get(cpf, "")
+            links.add((legal_case_id, cpf))
+    return names, links
+
+
+def _chunks(items: List[Any]) -> Iterable[List[Any]]:
+    for start in range(0, len(items), CHUNK_SIZE):
+        yield items[start:start + CHUNK_SIZE]
+
+
+async def sync_legal_case_clients(db: AsyncSession, cases: Iterable[CaseClients]) -> None:
+    """
+    Make ``legal_case_clients`` match the ``clients`` JSON of ``cases``:
+    clients are upserted on CPF and each case's links are replaced. Runs in the
+    caller's transaction.
+    """
+    cases = list(cases)
+    if not cases:
+        return
+    names, links = client_links(cases)
+
+    for chunk in _chunks([legal_case_id for legal_case_id, _ in cases]):
+        await db.execute(delete(legal_case_clients).where(legal_case_clients.c.legal_case_id.in_(chunk)))
+
+    client_ids: Dict[str, uuid.UUID] = {}
+    for chunk in _chunks(sorted(names)):
+        stmt = pg_insert(Client).values([
+            {"id": uuid7(), "cpf": cpf, "name": names[cpf], "is_deleted": False}
+            for cpf in chunk
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Client.cpf],
+            index_where=Client.is_deleted == false(),
+            set_={"name": stmt.excluded.name},
+        ).returning(Client.id, Client.cpf)
+        client_ids.update({row.cpf: row.id for row in await db.execute(stmt)})
+
+    rows = [{"legal_case_id": legal_case_id, "client_id": client_ids[cpf]} for legal_case_id, cpf in links]
+    for chunk in _chunks(rows):
+        await db.execute(insert(legal_case_clients), chunk)
+
+
+async def get_client_legal_cases_use_case(
+    cpf: str,
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> CursorPage[LegalCaseResponse]:
+    """
+    Legal cases of the client with this CPF, newest first: the unique CPF
+    index finds the client and the association index its cases.
+    """
+    normalized = normalize_cpf(cpf)
+    if normalized is None:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid CPF")
+
+    stmt = project(
+        select(LegalCase)
+        .join(legal_case_clients, legal_case_clients.c.legal_case_id == LegalCase.id)
+        .join(Client, Client.id == legal_case_clients.c.client_id)
+        .where(Client.cpf == normalized),
+        LegalCase,
+        LegalCaseResponse,
+    )
+    cases, next_page = await fetch_projected_page(db, stmt, LegalCase, cursor, limit)
+
+    # An empty first page may mean there is no such client at all
+    if not cases and not cursor:
+        if await db.scalar(select(Client.id).where(Client.cpf == normalized)) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Client not found")
+
+    return CursorPage[LegalCaseResponse](
+        items=validate_many(LegalCaseResponse, cases),
+        next_cursor=next_page,
+    )
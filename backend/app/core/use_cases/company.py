@@ -1,46 +1,47 @@
-from typing import Any
+from typing import Any, List, Optional
 import uuid
-from fastapi import HTTPException, status, BackgroundTasks, Request, Response
-from sqlalchemy import select
+from fastapi import HTTPException, status, Request, Response
+from sqlalchemy import Select, false, func, insert, select
+from sqlalchemy.orm import with_expression
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime, timezone
 
+from app.adapters.orm.models.association_tables import company_user
 from app.adapters.orm.models.company import Company
 from app.adapters.orm.models.user import User
+from app.adapters.orm.pagination import estimated_row_count, fetch_projected_page, project
+from app.adapters.orm.repository import insert_returning, update_returning
 from app.adapters.orm.security.audit import create_audit_log
+from app.adapters.orm.soft_delete import soft_delete_values
 from app.core.value_objects.company import CompanyCreate, CompanyResponse, CompanyUpdate
+from app.core.value_objects.pagination import CursorPage
+from app.core.value_objects.user import UserResponse
+from app.core.value_objects.validation import validate_many
 
 
 async def create_company_use_case(
     company: CompanyCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession,
     current_user: User
 ):
     try:
-        db_company = Company(**company.model_dump())
-        
-        db_company.owner_id = current_user.id
-        db_company.created_by_id = current_user.id
-        db_company.cnpj = company.cnpj
-        db_company.name = company.name
-        db_company.members = [current_user]
-        db_company.created_by = current_user
-        
-        db.add(db_company)
-        
+        db_company = await insert_returning(db, Company, {
+            **company.model_dump(),
+            "owner_id": current_user.id,
+            "created_by_id": current_user.id,
+        })
+        await db.execute(
+            insert(company_user).values(company_id=db_company.id, user_id=current_user.id)
+        )
+
         await db.commit()
-        await db.refresh(db_company)
     except IntegrityError:
         await db.rollback()
         
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="CNPJ already exists")
 
-    background_tasks.add_task(
-        create_audit_log,
-        db=db,
+    await create_audit_log(
         user_id=current_user.id,
         action="create",
         resource_type="companies",
@@ -49,36 +50,84 @@ async def create_company_use_case(
         ip_address=request.client.host if request and request.client else None
     )
 
-    return db_company
+    return await get_company_use_case(db_company.id, db)
+
+def member_count_subquery() -> Any:
+    """
+    Members of each company row, as a correlated count: it runs only for the
+    rows on the page and is served by the (company_id, user_id) index;
+    soft-deleted users are not counted.
+    """
+    return (
+        select(func.count())
+        .select_from(company_user)
+        .join(User, User.id == company_user.c.user_id)
+        # Loader criteria do not reach into column expressions, so filter here
+        .where(company_user.c.company_id == Company.id, User.is_deleted == false())
+        .correlate(Company)
+        .scalar_subquery()
+    )
+
+def with_member_count(stmt: Select) -> Select:
+    """Fill ``Company.member_count`` in the same query."""
+    return stmt.options(with_expression(Company.member_count, member_count_subquery()))
+
+def company_rows(stmt: Select) -> Select:
+    """``stmt`` narrowed to the ``CompanyResponse`` columns, member count included."""
+    return project(stmt, Company, CompanyResponse, member_count=member_count_subquery())
 
 async def get_companies_use_case(
     db: AsyncSession,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 10,
-    filters: list[Any] = []
-):
-    query = select(Company).where(*filters).offset(skip).limit(limit)
-    result = await db.execute(query)
-
-    return result.scalars().all()
+    filters: Optional[List[Any]] = None,
+    include_total: bool = False,
+) -> CursorPage[CompanyResponse]:
+    stmt = company_rows(select(Company).where(*(filters or [])))
+    companies, cursor = await fetch_projected_page(db, stmt, Company, cursor, limit)
+
+    return CursorPage[CompanyResponse](
+        items=validate_many(CompanyResponse, companies),
+        next_cursor=cursor,
+        total_estimate=await estimated_row_count(db, Company.__tablename__) if include_total else None,
+    )
 
 async def get_my_companies_use_case(
     db: AsyncSession,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 10,
     current_user: User = None,
-) -> list[CompanyResponse]:
-    await db.refresh(current_user, attribute_names=["companies"])
-
-    companies = current_user.companies[skip : skip + limit]
+) -> CursorPage[CompanyResponse]:
+    membership = company_user.c.user_id == current_user.id
+    stmt = company_rows(
+        select(Company)
+        .join(company_user, company_user.c.company_id == Company.id)
+        .where(membership)
+    )
+    companies, cursor = await fetch_projected_page(db, stmt, Company, cursor, limit)
+    total = await db.scalar(
+        select(func.count())
+        .select_from(company_user)
+        .join(Company, Company.id == company_user.c.company_id)
+        .where(membership)
+    )
 
-    return [CompanyResponse.model_validate(company) for company in companies]
+    return CursorPage[CompanyResponse](
+        items=validate_many(CompanyResponse, companies),
+        next_cursor=cursor,
+        total=total,
+    )
 
 async def get_company_use_case(
     company_id: int,
     db: AsyncSession
 ):
-    result = await db.execute(select(Company).where(Company.id == company_id))
+    # populate_existing: a company already in the session (just created or
+    # updated) would otherwise keep its unloaded member_count
+    result = await db.execute(
+        with_member_count(select(Company).where(Company.id == company_id))
+        .execution_options(populate_existing=True)
+    )
     company = result.scalars().first()
 
     if not company:
@@ -86,36 +135,51 @@ async def get_company_use_case(
 
     return company
 
+async def get_company_members_use_case(
+    company_id: uuid.UUID,
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+) -> CursorPage[UserResponse]:
+    stmt = project(
+        select(User)
+        .join(company_user, company_user.c.user_id == User.id)
+        .where(company_user.c.company_id == company_id),
+        User,
+        UserResponse,
+    )
+    members, next_page = await fetch_projected_page(db, stmt, User, cursor, limit)
+
+    # An empty first page may mean the company does not exist at all
+    if not members and not cursor:
+        if await db.scalar(select(Company.id).where(Company.id == company_id)) is None:
+            raise HTTPException(status_code=404, detail="Company not found")
+
+    return CursorPage[UserResponse](
+        items=validate_many(UserResponse, members),
+        next_cursor=next_page,
+    )
+
 async def update_company_use_case(
     company_id: uuid.UUID,
     company_update: CompanyUpdate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession,
     current_user: User
 ):
-    result = await db.execute(select(Company).where(Company.id == company_id))
-    db_company = result.scalars().first()
-
-    if not db_company:
-        raise HTTPException(status_code=404, detail="Company not found")
-    
     update_data = company_update.model_dump(exclude_unset=True)
     
     try:
-        for field, value in update_data.items():
-            setattr(db_company, field, value)
-        
+        db_company = await update_returning(
+            db, Company, company_id, update_data, not_found="Company not found"
+        )
         await db.commit()
-        await db.refresh(db_company)
     except IntegrityError:
         await db.rollback()
         
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="CNPJ already exists")
 
-    background_tasks.add_task(
-        create_audit_log,
-        db=db,
+    await create_audit_log(
         user_id=current_user.id,
         action="update",
         resource_type="companies",
@@ -123,26 +187,23 @@ async def update_company_use_case(
         details=update_data,
         ip_address=request.client.host if request and request.client else None
     )
-    return db_company
+    return await get_company_use_case(db_company.id, db)
 
 async def delete_company_use_case(
     company_id: uuid.UUID,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession,
     current_user: User
 ):
-    result = await db.execute(select(Company).where(Company.id == company_id))
-    db_company = result.scalars().first()
-    if not db_company:
-        raise HTTPException(status_code=404, detail="Company not found")
-
     try:
-        db_company.is_deleted = True
-        db_company.deleted_at = datetime.now(timezone.utc)
-
+        db_company = await update_returning(
+            db,
+            Company,
+            company_id,
+            {**soft_delete_values(), "deleted_by_id": current_user.id},
+            not_found="Company not found",
+        )
         await db.commit()
-        await db.refresh(db_company)
     except IntegrityError:
         await db.rollback()
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Could not delete company")
@@ -154,9 +215,7 @@ async def delete_company_use_case(
         "deleted_by_id": db_company.deleted_by_id,
     }
 
-    background_tasks.add_task(
-        create_audit_log,
-        db=db,
+    await create_audit_log(
         user_id=current_user.id,
         action="delete",
         resource_type="companies",
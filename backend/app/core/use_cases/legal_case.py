@@ -1,38 +1,39 @@
 from datetime import datetime, timezone
 import uuid
-from fastapi import BackgroundTasks, HTTPException, Request, status, Response
+from fastapi import HTTPException, Request, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select, update, delete
+from sqlalchemy import ColumnElement, Select, select
 from typing import Optional, List
 
 from app.adapters.orm.models.legal_case import LegalCase
+from app.adapters.orm.pagination import estimated_row_count, fetch_projected_page, project
+from app.adapters.orm.repository import insert_returning, update_returning
+from app.adapters.orm.soft_delete import soft_delete_values
 from app.adapters.orm.security import create_audit_log
-from app.core.value_objects.legal_case import LegalCaseCreate, LegalCaseResponse, LegalCaseUpdate
+from app.core.use_cases.client import sync_legal_case_clients
+from app.core.value_objects.cnj import INVALID_CNJ, CNJ_COLUMNS, CnjValidationResult, parse_cnj, validate_cnj_numbers
+from app.core.value_objects.legal_case import LegalCaseCreate, LegalCaseFilters, LegalCaseResponse, LegalCaseUpdate
+from app.core.value_objects.pagination import CursorPage
+from app.core.value_objects.validation import validate_many
 from app.adapters.orm.models.user import User
-from sqlalchemy.inspection import inspect
 
 async def create_legal_case_use_case(
     legal_case_in: LegalCaseCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession,
     current_user: User
 ) -> LegalCaseResponse:
     try:
-        legal_case = LegalCase(
-            id=uuid.uuid4(),
-            **legal_case_in.model_dump()
-        )
-        legal_case.created_by_id = current_user.id
-
-        db.add(legal_case)
+        legal_case = await insert_returning(db, LegalCase, {
+            **legal_case_in.model_dump(),
+            **parse_cnj(legal_case_in.legal_case_number).columns(),
+            "created_by_id": current_user.id,
+        })
+        await sync_legal_case_clients(db, [(legal_case.id, legal_case.clients)])
         await db.commit()
-        await db.refresh(legal_case)
 
-        background_tasks.add_task(
-            create_audit_log,
-            db=db,
+        await create_audit_log(
             action="create",
             user_id=current_user.id,
             resource_type="legal_cases",
@@ -41,10 +42,6 @@ async def create_legal_case_use_case(
             ip_address=request.client.host if request and request.client else None
         )
 
-        print(
-            "Created legal case:",
-            {c.key: getattr(legal_case, c.key) for c in inspect(legal_case).mapper.column_attrs}
-        )
         return LegalCaseResponse.model_validate(legal_case)
     except IntegrityError as e:
         await db.rollback()
@@ -64,49 +61,100 @@ async def get_legal_case_use_case(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Legal case not found")
     return legal_case
 
+# Filters compared for equality; each hot one leads an index that ends in
+# (created_at, id), so a filtered page is still one index range scan
+EQUALITY_FILTERS = (
+    "state",
+    "jurisdiction",
+    "judicial_district",
+    "court",
+    "status",
+    "assignee_from_commercial_team_id",
+    "assignee_from_litigation_team_id",
+    *CNJ_COLUMNS,
+)
+
+def legal_case_criteria(filters: LegalCaseFilters) -> List[ColumnElement]:
+    """WHERE clauses for the filters that are set; unset filters add nothing."""
+    conditions = [
+        getattr(LegalCase, name) == getattr(filters, name)
+        for name in EQUALITY_FILTERS
+        if getattr(filters, name) is not None
+    ]
+    if filters.case_value_min is not None:
+        conditions.append(LegalCase.case_value >= filters.case_value_min)
+    if filters.case_value_max is not None:
+        conditions.append(LegalCase.case_value <= filters.case_value_max)
+    if filters.created_since is not None:
+        conditions.append(LegalCase.created_at >= filters.created_since)
+    if filters.created_until is not None:
+        conditions.append(LegalCase.created_at < filters.created_until)
+    return conditions
+
+def legal_cases_query(filters: Optional[LegalCaseFilters] = None) -> Select:
+    """Base query shared by the listing, the search and the export."""
+    stmt = select(LegalCase)
+    if filters is not None:
+        stmt = stmt.where(*legal_case_criteria(filters))
+    return stmt
+
 async def list_legal_cases_use_case(
     db: AsyncSession,
-    skip: int = 0,
+    cursor: Optional[str] = None,
     limit: int = 100,
-) -> List[LegalCase]:
-    result = await db.execute(select(LegalCase).offset(skip).limit(limit))
-    return result.scalars().all()
+    include_total: bool = False,
+    filters: Optional[LegalCaseFilters] = None,
+) -> CursorPage[LegalCaseResponse]:
+    stmt = project(legal_cases_query(filters), LegalCase, LegalCaseResponse)
+    cases, cursor = await fetch_projected_page(db, stmt, LegalCase, cursor, limit)
+    return CursorPage[LegalCaseResponse](
+        items=validate_many(LegalCaseResponse, cases),
+        next_cursor=cursor,
+        total_estimate=await estimated_row_count(db, LegalCase.__tablename__) if include_total else None,
+    )
+
+def validate_legal_case_numbers_use_case(numbers: List[str]) -> CnjValidationResult:
+    """Check a batch of case numbers, e.g. a spreadsheet column, before importing it."""
+    valid = validate_cnj_numbers(numbers)
+    return CnjValidationResult(valid=valid, invalid_count=valid.count(False))
+
+async def _check_legacy_number(db: AsyncSession, legal_case_id: uuid.UUID, number: str) -> None:
+    """A non-CNJ number is only accepted as the case's own, unchanged, pre-CNJ number."""
+    stored = await db.scalar(select(LegalCase.legal_case_number).where(LegalCase.id == legal_case_id))
+    if stored is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Legal case not found")
+    if stored != number:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"legal_case_number: {INVALID_CNJ}",
+        )
 
 async def update_legal_case_use_case(
     legal_case_id: uuid.UUID,
     legal_case_update: LegalCaseUpdate,
-    background_tasks: BackgroundTasks,
     current_user: User,
     db: AsyncSession,
     request: Optional[Request] = None,
 ) -> LegalCase:
-    stmt = select(LegalCase).where(LegalCase.id == legal_case_id)
-    result = await db.execute(stmt)
-    legal_case = result.scalars().first()
-
-    if legal_case is None:
-        raise HTTPException(status_code=404, detail="Legal case not found")
-
     update_data = legal_case_update.model_dump(exclude_unset=True)
 
     try:
-        if update_data:
-            stmt = (
-                update(LegalCase)
-                .where(LegalCase.id == legal_case_id)
-                .values(**update_data)
-            )
-            await db.execute(stmt)
-            await db.commit()
-
-        # Refresh legal case data
-        stmt = select(LegalCase).where(LegalCase.id == legal_case_id)
-        result = await db.execute(stmt)
-        legal_case = result.scalars().first()
-
-        background_tasks.add_task(
-            create_audit_log,
-            db=db,
+        values = dict(update_data)
+        if "legal_case_number" in update_data:
+            number = parse_cnj(update_data["legal_case_number"])
+            if number is None:
+                await _check_legacy_number(db, legal_case_id, update_data["legal_case_number"])
+                values.update(dict.fromkeys(CNJ_COLUMNS))
+            else:
+                values.update(number.columns())
+        legal_case = await update_returning(
+            db, LegalCase, legal_case_id, values, not_found="Legal case not found"
+        )
+        if "clients" in update_data:
+            await sync_legal_case_clients(db, [(legal_case.id, legal_case.clients)])
+        await db.commit()
+
+        await create_audit_log(
             user_id=current_user.id,
             action="update",
             resource_type="legal_cases",
@@ -125,25 +173,16 @@ async def update_legal_case_use_case(
 
 async def delete_legal_case_use_case(
     legal_case_id: uuid.UUID,
-    background_tasks: BackgroundTasks,
     db: AsyncSession,
     current_user: User,
     request: Optional[Request] = None,
 ):
-    stmt = select(LegalCase).where(LegalCase.id == legal_case_id)
-    result = await db.execute(stmt)
-    legal_case = result.scalars().first()
-
-    if legal_case is None:
-        raise HTTPException(status_code=404, detail="Legal case not found")
-
-    stmt = delete(LegalCase).where(LegalCase.id == legal_case_id)
-    await db.execute(stmt)
+    legal_case = await update_returning(
+        db, LegalCase, legal_case_id, soft_delete_values(), not_found="Legal case not found"
+    )
     await db.commit()
 
-    background_tasks.add_task(
-        create_audit_log,
-        db=db,
+    await create_audit_log(
         user_id=current_user.id,
         action="delete",
         resource_type="legal_cases",
@@ -0,0 +1,124 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Sequence
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import Select
+
+from app.adapters.orm.models.legal_case import LegalCase
+from app.adapters.orm.replica import replica_router
+from app.core.value_objects.legal_case import LegalCaseResponse
+from app.infrastructure.xlsx import StreamingXlsxWriter
+
+EXPORT_COLUMNS = list(LegalCaseResponse.model_fields)
+
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def export_query(stmt: Select) -> Select:
+    """Plain columns of the listing query in creation order; no ORM objects are built."""
+    return stmt.with_only_columns(
+        *(getattr(LegalCase, column) for column in EXPORT_COLUMNS)
+    ).order_by(LegalCase.created_at, LegalCase.id)
+
+
+def _flat(value: Any) -> Any:
+    # Spreadsheet cells hold scalars; nested values (clients) go in as JSON
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class _CsvEncoder:
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _take(self) -> bytes:
+        data = self._buffer.getvalue().encode()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+    def header(self) -> bytes:
+        # BOM so Excel opens the UTF-8 file with accents intact
+        self._writer.writerow(EXPORT_COLUMNS)
+        return "\ufeff".encode() + self._take()
+
+    def rows(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        self._writer.writerows([[_flat(value) for value in row] for row in rows])
+        return self._take()
+
+    def close(self) -> bytes:
+        return b""
+
+
+class _NdjsonEncoder:
+    def header(self) -> bytes:
+        return b""
+
+    def rows(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        lines = [
+            json.dumps(jsonable_encoder(dict(zip(EXPORT_COLUMNS, row))), ensure_ascii=False)
+            for row in rows
+        ]
+        return ("\n".join(lines) + "\n").encode()
+
+    def close(self) -> bytes:
+        return b""
+
+
+class _XlsxEncoder:
+    def __init__(self):
+        self._writer = StreamingXlsxWriter("Legal cases")
+
+    def header(self) -> bytes:
+        self._writer.write_row(EXPORT_COLUMNS)
+        return self._writer.drain()
+
+    def rows(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        for row in rows:
+            self._writer.write_row([_flat(value) for value in row])
+        return self._writer.drain()
+
+    def close(self) -> bytes:
+        return self._writer.close()
+
+
+ENCODERS: Dict[str, Callable[[], Any]] = {
+    "csv": _CsvEncoder,
+    "ndjson": _NdjsonEncoder,
+    "xlsx": _XlsxEncoder,
+}
+
+
+async def stream_legal_cases_use_case(
+    stmt: Select,
+    export_format: str,
+    batch_size: int = 1000,
+) -> AsyncIterator[bytes]:
+    """
+    Encode the rows of ``stmt`` incrementally through a server-side cursor,
+    ``batch_size`` rows at a time, so memory does not grow with the export.
+    Opens its own (replica) session because the response outlives the
+    request's dependencies.
+    """
+    encoder = ENCODERS[export_format]()
+    yield encoder.header()
+    query = export_query(stmt).execution_options(yield_per=batch_size)
+    async with await replica_router.open_session() as db:
+        result = await db.stream(query)
+        async for partition in result.partitions():
+            chunk = encoder.rows(partition)
+            if chunk:
+                yield chunk
+    tail = encoder.close()
+    if tail:
+        yield tail
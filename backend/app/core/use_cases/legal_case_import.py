@@ -0,0 +1,252 @@
+import csv
+import io
+import json
+import uuid
+import zipfile
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import JSON, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.orm.bulk import copy_records, create_staging_table
+from app.adapters.orm.ids import uuid7
+from app.adapters.orm.models.audit_log import AuditLog
+from app.adapters.orm.models.legal_case import LegalCase
+from app.adapters.orm.security.audit import audit_log_row
+from app.core.use_cases.client import sync_legal_case_clients
+from app.core.value_objects.cnj import CNJ_COLUMNS, formatted_cnj, parse_cnj, validate_cnj_numbers
+from app.core.value_objects.legal_case import (
+    LegalCaseCreate,
+    LegalCaseImportError,
+    LegalCaseImportResult,
+)
+
+STAGING_TABLE = "legal_cases_import"
+DATA_COLUMNS = list(LegalCaseCreate.model_fields)
+STAGING_COLUMNS = ["id", "created_by_id", "is_deleted", *DATA_COLUMNS, *CNJ_COLUMNS]
+
+# Rows only ever reach the table through the staging copy, so every column
+# name below comes from LegalCaseCreate, never from the uploaded file.
+_UPSERT = text(
+    f"INSERT INTO {LegalCase.__tablename__} ({', '.join(STAGING_COLUMNS)}) "
+    f"SELECT {', '.join(STAGING_COLUMNS)} FROM {STAGING_TABLE} "
+    "ON CONFLICT (legal_case_number) WHERE is_deleted = false DO UPDATE SET "
+    + ", ".join(f"{column} = EXCLUDED.{column}" for column in [*DATA_COLUMNS, *CNJ_COLUMNS] if column != "legal_case_number")
+    + " RETURNING id, legal_case_number, clients, (xmax = 0) AS inserted"
+)
+
+NumberedRow = Tuple[int, Dict[str, Any]]
+
+
+def normalize_header(name: Any) -> str:
+    return str(name or "").strip().lower().replace(" ", "_").replace("-", "_")
+
+
+def read_csv_rows(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Rows of a UTF-8 (optionally BOM-prefixed) CSV file, read line by line."""
+    reader = csv.reader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    header = [normalize_header(name) for name in next(reader, [])]
+    for values in reader:
+        yield dict(zip(header, values))
+
+
+def read_xlsx_rows(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Rows of the first sheet of an XLSX workbook, streamed in read-only mode."""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="XLSX import requires openpyxl",
+        )
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [normalize_header(name) for name in next(rows, ())]
+        for values in rows:
+            yield dict(zip(header, (_cell_text(value) for value in values)))
+    finally:
+        workbook.close()
+
+
+def _cell_text(value: Any) -> Any:
+    # Spreadsheets store case numbers and amounts as numbers; validation
+    # decides what they become.
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if value is not None and not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def read_import_rows(filename: str, stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    name = filename.lower()
+    if name.endswith(".csv"):
+        return read_csv_rows(stream)
+    if name.endswith(".xlsx"):
+        return read_xlsx_rows(stream)
+    raise HTTPException(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail="Only .csv and .xlsx files can be imported",
+    )
+
+
+def _clean(raw: Dict[str, Any]) -> Dict[str, Any]:
+    values = {
+        key: value.strip() if isinstance(value, str) else value
+        for key, value in raw.items()
+        if key in LegalCaseCreate.model_fields
+    }
+    values = {key: value for key, value in values.items() if value not in (None, "")}
+    if isinstance(values.get("clients"), str):
+        values["clients"] = json.loads(values["clients"])
+    return values
+
+
+def validate_row(row_number: int, raw: Dict[str, Any]) -> Tuple[Optional[LegalCaseCreate], Optional[LegalCaseImportError]]:
+    number = raw.get("legal_case_number") or None
+    try:
+        return LegalCaseCreate.model_validate(_clean(raw)), None
+    except json.JSONDecodeError as e:
+        messages = [f"clients: invalid JSON ({e.msg})"]
+    except ValidationError as e:
+        messages = [
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        ]
+    return None, LegalCaseImportError(row=row_number, legal_case_number=number, errors=messages)
+
+
+def _number_error(number: str) -> str:
+    if not number.strip():
+        return "legal_case_number: Field required"
+    try:
+        formatted_cnj(number)
+    except ValueError as e:
+        return f"legal_case_number: {e}"
+    return "legal_case_number: invalid"
+
+
+def staging_record(case: LegalCaseCreate, created_by_id: uuid.UUID) -> Tuple[Any, ...]:
+    values = case.model_dump()
+    if values["clients"] is not None:
+        values["clients"] = json.dumps(values["clients"])
+    components = parse_cnj(case.legal_case_number).columns()
+    return (
+        uuid7(), created_by_id, False,
+        *(values[column] for column in DATA_COLUMNS),
+        *(components[column] for column in CNJ_COLUMNS),
+    )
+
+
+def prepare_batch(
+    rows: Iterator[NumberedRow],
+    batch_size: int,
+    created_by_id: uuid.UUID,
+    seen: Dict[str, int],
+) -> Tuple[int, List[Tuple[Any, ...]], List[LegalCaseImportError]]:
+    """
+    Parse and validate the next ``batch_size`` rows. Returns how many rows were
+    read, the staging records for the valid ones and the errors for the rest.
+    A legal case number repeated within the file keeps its first row; one
+    that is not a valid CNJ number fails its row without further validation.
+    """
+    batch = list(islice(rows, batch_size))
+    numbers = [str(raw.get("legal_case_number") or "") for _, raw in batch]
+    records: List[Tuple[Any, ...]] = []
+    errors: List[LegalCaseImportError] = []
+    for (row_number, raw), number, number_is_valid in zip(batch, numbers, validate_cnj_numbers(numbers)):
+        if not number_is_valid:
+            errors.append(LegalCaseImportError(
+                row=row_number,
+                legal_case_number=number.strip() or None,
+                errors=[_number_error(number)],
+            ))
+            continue
+        case, error = validate_row(row_number, raw)
+        if error is not None:
+            errors.append(error)
+            continue
+        first_row = seen.get(case.legal_case_number)
+        if first_row is not None:
+            errors.append(LegalCaseImportError(
+                row=row_number,
+                legal_case_number=case.legal_case_number,
+                errors=[f"legal_case_number: duplicate of row {first_row}"],
+            ))
+            continue
+        seen[case.legal_case_number] = row_number
+        records.append(staging_record(case, created_by_id))
+    return len(batch), records, errors
+
+
+async def import_legal_cases_use_case(
+    db: AsyncSession,
+    rows: Iterator[Dict[str, Any]],
+    current_user_id: uuid.UUID,
+    ip_address: Optional[str] = None,
+    source: Optional[str] = None,
+    batch_size: int = 1000,
+) -> LegalCaseImportResult:
+    """
+    Import legal cases in one transaction: rows are validated in batches off
+    the event loop, COPYed into a temporary staging table, then upserted on
+    ``legal_case_number`` with a single INSERT ... ON CONFLICT. Audit entries
+    go in as one multi-row insert and client links are synced in bulk.
+    Invalid rows are reported, not fatal.
+    """
+    result = LegalCaseImportResult()
+    # Spreadsheet line numbers: the header is line 1
+    numbered: Iterator[NumberedRow] = enumerate(rows, start=2)
+    seen: Dict[str, int] = {}
+
+    await create_staging_table(db, STAGING_TABLE, LegalCase.__tablename__)
+    while True:
+        try:
+            count, records, errors = await run_in_threadpool(
+                prepare_batch, numbered, batch_size, current_user_id, seen
+            )
+        except (UnicodeDecodeError, csv.Error, zipfile.BadZipFile) as e:
+            await db.rollback()
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Could not read file: {e}")
+        if count == 0:
+            break
+        result.total_rows += count
+        result.errors.extend(errors)
+        if records:
+            await copy_records(db, STAGING_TABLE, STAGING_COLUMNS, records)
+
+    # Typed so the returned clients JSON is decoded
+    upserted = (await db.execute(_UPSERT.columns(clients=JSON))).all() if seen else []
+    if upserted:
+        await db.execute(insert(AuditLog), [
+            audit_log_row(
+                user_id=current_user_id,
+                action="create" if row.inserted else "update",
+                resource_type="legal_cases",
+                resource_id=row.id,
+                details={"legal_case_number": row.legal_case_number, "import": source},
+                ip_address=ip_address,
+            )
+            for row in upserted
+        ])
+        await sync_legal_case_clients(db, [(row.id, row.clients) for row in upserted])
+    await db.commit()
+
+    result.inserted = sum(1 for row in upserted if row.inserted)
+    result.updated = len(upserted) - result.inserted
+    result.failed = len(result.errors)
+    return result
+
+
+def error_report_csv(result: LegalCaseImportResult) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["row", "legal_case_number", "errors"])
+    for error in result.errors:
+        writer.writerow([error.row, error.legal_case_number or "", "; ".join(error.errors)])
+    return buffer.getvalue()
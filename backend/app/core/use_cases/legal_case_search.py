@@ -0,0 +1,48 @@
+from typing import Optional, Tuple
+
+from sqlalchemy import ColumnElement, func, literal_column, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.orm.models.legal_case import SEARCH_CONFIG, LegalCase
+from app.adapters.orm.pagination import next_cursor, project, rank_order
+from app.core.use_cases.legal_case import legal_cases_query
+from app.core.value_objects.legal_case import LegalCaseFilters, LegalCaseSearchResult
+from app.core.value_objects.pagination import CursorPage
+from app.core.value_objects.validation import validate_many
+
+# Trigram indexes cannot serve patterns shorter than one trigram
+MIN_NUMBER_FRAGMENT = 3
+
+
+def search_criteria(q: str) -> Tuple[ColumnElement, ColumnElement]:
+    """
+    Match predicate and rank for a search string. Words go through
+    ``websearch_to_tsquery`` against the ``search_vector`` GIN index (quotes,
+    ``or`` and ``-word`` work as on web search engines); a query with digits
+    also matches case numbers containing it, through the trigram index.
+    """
+    q = q.strip()
+    tsquery = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), q)
+    match = LegalCase.search_vector.op("@@")(tsquery)
+    # Normalisation 32 maps the rank into [0, 1), alongside similarity()
+    rank = func.ts_rank_cd(LegalCase.search_vector, tsquery, 32)
+    if len(q) >= MIN_NUMBER_FRAGMENT and any(char.isdigit() for char in q):
+        match = or_(match, LegalCase.legal_case_number.icontains(q, autoescape=True))
+        rank = rank + func.similarity(LegalCase.legal_case_number, q)
+    return match, rank
+
+
+async def search_legal_cases_use_case(
+    db: AsyncSession,
+    q: str,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    filters: Optional[LegalCaseFilters] = None,
+) -> CursorPage[LegalCaseSearchResult]:
+    match, rank = search_criteria(q)
+    stmt = project(legal_cases_query(filters).where(match), LegalCase, LegalCaseSearchResult, rank=rank)
+    rows = (await db.execute(rank_order(stmt, rank, LegalCase, cursor, limit))).mappings().all()
+    return CursorPage[LegalCaseSearchResult](
+        items=validate_many(LegalCaseSearchResult, rows[:limit]),
+        next_cursor=next_cursor(rows, limit, lambda row: (row["rank"], row["id"])),
+    )
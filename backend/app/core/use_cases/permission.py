@@ -1,31 +1,43 @@
-from fastapi import BackgroundTasks, HTTPException, Request, Response, status
-from sqlalchemy import delete, select, update
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from app.adapters.orm.models.permission import Permission
 from app.adapters.orm.models.role import Role
 from app.adapters.orm.models.user import User
+from app.adapters.orm.pagination import estimated_row_count, fetch_projected_page, project
+from app.adapters.orm.repository import insert_returning, update_returning
 from app.adapters.orm.security.audit import create_audit_log
-from app.core.value_objects.permission import PermissionCreate
+from app.adapters.orm.security.conditions import compile_conditions
+from app.adapters.orm.security.principal_cache import principal_cache
+from app.adapters.orm.soft_delete import soft_delete_values
+from app.core.value_objects.pagination import CursorPage
+from app.core.value_objects.permission import PermissionCreate, PermissionResponse
+from app.core.value_objects.validation import validate_many
+
+def _validate_conditions(permission: PermissionCreate):
+    try:
+        compile_conditions(permission.conditions)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
 
 async def create_permission_use_case(
     permission: PermissionCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession,
     current_user: User
 ):
+    _validate_conditions(permission)
+
     try:
-        db_permission = Permission(**permission.model_dump())
-        db.add(db_permission)
+        db_permission = await insert_returning(db, Permission, permission.model_dump())
         await db.commit()
-        await db.refresh(db_permission)
 
-        # Log permission creation in background
-        background_tasks.add_task(
-            create_audit_log,
-            db=db,
+        # Log permission creation (queued, written by the audit sink)
+        await create_audit_log(
             user_id=current_user.id,
             action="create",
             resource_type="permissions",
@@ -44,13 +56,17 @@ async def create_permission_use_case(
 
 async def get_permissions_use_case(
     db: AsyncSession,
-    skip: int,
-    limit: int
-):
-    stmt = select(Permission).offset(skip).limit(limit)
-    result = await db.execute(stmt)
-    permissions = result.scalars().all()
-    return permissions
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    include_total: bool = False,
+) -> CursorPage[PermissionResponse]:
+    stmt = project(select(Permission), Permission, PermissionResponse)
+    permissions, cursor = await fetch_projected_page(db, stmt, Permission, cursor, limit)
+    return CursorPage[PermissionResponse](
+        items=validate_many(PermissionResponse, permissions),
+        next_cursor=cursor,
+        total_estimate=await estimated_row_count(db, Permission.__tablename__) if include_total else None,
+    )
 
 async def get_permission_use_case(
     permission_id: int,
@@ -67,38 +83,23 @@ async def get_permission_use_case(
 async def update_permission_use_case(
     permission_id: int,
     permission_update: PermissionCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession,
     current_user: User
 ):
-    stmt = select(Permission).where(Permission.id == permission_id)
-    result = await db.execute(stmt)
-    db_permission = result.scalars().first()
-
-    if db_permission is None:
-        raise HTTPException(status_code=404, detail="Permission not found")
-
+    _validate_conditions(permission_update)
     update_data = permission_update.model_dump()
 
     try:
-        stmt = (
-            update(Permission)
-            .where(Permission.id == permission_id)
-            .values(**update_data)
+        db_permission = await update_returning(
+            db, Permission, permission_id, update_data, not_found="Permission not found"
         )
-        await db.execute(stmt)
         await db.commit()
+        # Any cached principal may hold this permission through a role or group
+        principal_cache.clear()
 
-        # Refresh permission data
-        stmt = select(Permission).where(Permission.id == permission_id)
-        result = await db.execute(stmt)
-        db_permission = result.scalars().first()
-
-        # Log permission update in background
-        background_tasks.add_task(
-            create_audit_log,
-            db=db,
+        # Log permission update (queued, written by the audit sink)
+        await create_audit_log(
             user_id=current_user.id,
             action="update",
             resource_type="permissions",
@@ -115,41 +116,29 @@ async def update_permission_use_case(
             detail="Permission with this resource and action already exists"
         )
     
-## TODO: implement soft delete, review all delete from all resources
 async def delete_permission_use_case(
     permission_id: int,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession,
     current_user: User
 ):
-    stmt = select(Permission).where(Permission.id == permission_id)
-    result = await db.execute(stmt)
-    db_permission = result.scalars().first()
-
-    if db_permission is None:
-        raise HTTPException(status_code=404, detail="Permission not found")
-
-    # Store permission details for audit log
-    permission_details = {
-        "name": db_permission.name,
-        "resource": db_permission.resource,
-        "action": db_permission.action
-    }
-
-    stmt = delete(Permission).where(Permission.id == permission_id)
-    await db.execute(stmt)
+    db_permission = await update_returning(
+        db, Permission, permission_id, soft_delete_values(), not_found="Permission not found"
+    )
     await db.commit()
+    principal_cache.clear()
 
-    # Log permission deletion in background
-    background_tasks.add_task(
-        create_audit_log,
-        db=db,
+    # Log permission deletion (queued, written by the audit sink)
+    await create_audit_log(
         user_id=current_user.id,
         action="delete",
         resource_type="permissions",
         resource_id=permission_id,
-        details=permission_details,
+        details={
+            "name": db_permission.name,
+            "resource": db_permission.resource,
+            "action": db_permission.action
+        },
         ip_address=request.client.host if request and request.client else None
     )
 
@@ -158,7 +147,6 @@ async def delete_permission_use_case(
 async def assign_permission_to_role_use_case(
     permission_id: int,
     role_id: int,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession,
     current_user: User
@@ -183,11 +171,10 @@ async def assign_permission_to_role_use_case(
     if permission not in role.permissions:
         role.permissions.append(permission)
         await db.commit()
+        principal_cache.clear()
 
-        # Log assignment in background
-        background_tasks.add_task(
-            create_audit_log,
-            db=db,
+        # Log assignment (queued, written by the audit sink)
+        await create_audit_log(
             user_id=current_user.id,
             action="assign",
             resource_type="permissions",
@@ -1,28 +1,24 @@
-from fastapi import HTTPException, status, BackgroundTasks, Request
+from fastapi import HTTPException, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from app.adapters.orm.models.role import Role
 from app.adapters.orm.models.user import User
+from app.adapters.orm.repository import insert_returning
 from app.adapters.orm.security.audit import create_audit_log
 from app.core.value_objects.role import RoleCreate
 
 async def create_role_use_case(
     role: RoleCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession,
     current_user: User
 ):
     try:
-        db_role = Role(**role.model_dump())
-        db.add(db_role)
+        db_role = await insert_returning(db, Role, role.model_dump())
         await db.commit()
-        await db.refresh(db_role)
 
-        background_tasks.add_task(
-            create_audit_log,
-            db=db,
+        await create_audit_log(
             user_id=current_user.id,
             action="create",
             resource_type="roles",
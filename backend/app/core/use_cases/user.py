@@ -1,35 +1,36 @@
 import uuid
-from fastapi import BackgroundTasks, HTTPException, Request, status, Response
+from fastapi import HTTPException, Request, status, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import select, update, delete
+from sqlalchemy import select
 from typing import Optional
 
 from ...adapters.orm.models.user import User
-from ...adapters.orm.security.auth import get_password_hash
+from ...adapters.orm.pagination import estimated_row_count, fetch_projected_page, project
+from ...adapters.orm.repository import insert_returning, update_returning
+from ...adapters.orm.security.hashing import password_hasher
+from ...adapters.orm.soft_delete import soft_delete_values
 from ...adapters.orm.security import create_audit_log
-from ..value_objects import UserUpdate
+from ...adapters.orm.security.principal_cache import principal_cache
+from ..value_objects import UserResponse, UserUpdate
+from ..value_objects.pagination import CursorPage
+from ..value_objects.validation import validate_many
 from ..value_objects import UserCreate
 
-async def create_user_use_case(db: AsyncSession, user: UserCreate, background_tasks: BackgroundTasks, request: Request) -> User:
+async def create_user_use_case(db: AsyncSession, user: UserCreate, request: Request) -> User:
     try:
-        hashed_password = get_password_hash(user.password)
-        db_user = User(
-            id=uuid.uuid4(),
-            username=user.username,
-            email=user.email,
-            password_hash=hashed_password,
-            first_name=user.first_name,
-            last_name=user.last_name,
-        )
-        db.add(db_user)
+        hashed_password = await password_hasher.hash(user.password)
+        db_user = await insert_returning(db, User, {
+            "username": user.username,
+            "email": user.email,
+            "password_hash": hashed_password,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+        })
         await db.commit()
-        await db.refresh(db_user)
 
-        # Log user creation in background
-        background_tasks.add_task(
-            create_audit_log,
-            db=db,
+        # Log user creation (queued, written by the audit sink)
+        await create_audit_log(
             action="create",
             user_id=db_user.id,
             resource_type="users",
@@ -39,18 +40,26 @@ async def create_user_use_case(db: AsyncSession, user: UserCreate, background_ta
         )
 
         return db_user
-    except IntegrityError as e:
-        print("IntegrityError:", e)
+    except IntegrityError:
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Username or email already exists"
         )
 
-async def get_users_use_case(db: AsyncSession, skip: int, limit: int):
-    result = await db.execute(select(User).offset(skip).limit(limit))
-    users = result.scalars().all()
-    return users
+async def get_users_use_case(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    include_total: bool = False,
+) -> CursorPage[UserResponse]:
+    stmt = project(select(User), User, UserResponse)
+    users, cursor = await fetch_projected_page(db, stmt, User, cursor, limit)
+    return CursorPage[UserResponse](
+        items=validate_many(UserResponse, users),
+        next_cursor=cursor,
+        total_estimate=await estimated_row_count(db, User.__tablename__) if include_total else None,
+    )
 
 async def get_user_use_case(user_id: int, db: AsyncSession):
     stmt = select(User).where(User.id == user_id)
@@ -73,39 +82,20 @@ async def get_user_me_use_case(user_id: int, db: AsyncSession) -> User:
 async def update_user_use_case(
     user_id: int,
     user_update: UserUpdate,
-    background_tasks: BackgroundTasks,
     current_user: User,
     db: AsyncSession,
     request: Optional[Request] = None,
 ):
-    stmt = select(User).where(User.id == user_id)
-    result = await db.execute(stmt)
-    db_user = result.scalars().first()
-
-    if db_user is None:
-        raise HTTPException(status_code=404, detail="User not found")
-
     update_data = user_update.model_dump(exclude_unset=True)
 
     try:
+        db_user = await update_returning(db, User, user_id, update_data, not_found="User not found")
+        await db.commit()
         if update_data:
-            stmt = (
-                update(User)
-                .where(User.id == user_id)
-                .values(**update_data)
-            )
-            await db.execute(stmt)
-            await db.commit()
-
-        # Refresh user data
-        stmt = select(User).where(User.id == user_id)
-        result = await db.execute(stmt)
-        db_user = result.scalars().first()
-
-        # Log user update in background
-        background_tasks.add_task(
-            create_audit_log,
-            db=db,
+            principal_cache.invalidate_user(db_user.id)
+
+        # Log user update (queued, written by the audit sink)
+        await create_audit_log(
             user_id=current_user.id,
             action="update",
             resource_type="users",
@@ -124,34 +114,21 @@ async def update_user_use_case(
 
 async def delete_user_use_case(
     user_id: int,
-    background_tasks: BackgroundTasks,
     db: AsyncSession,
     current_user: User,
     request: Optional[Request] = None,
 ):
-    stmt = select(User).where(User.id == user_id)
-    result = await db.execute(stmt)
-    db_user = result.scalars().first()
-
-    if db_user is None:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # Store username for audit log
-    username = db_user.username
-
-    stmt = delete(User).where(User.id == user_id)
-    await db.execute(stmt)
+    db_user = await update_returning(db, User, user_id, soft_delete_values(), not_found="User not found")
     await db.commit()
+    principal_cache.invalidate_user(db_user.id)
 
-    # Log user deletion in background
-    background_tasks.add_task(
-        create_audit_log,
-        db=db,
+    # Log user deletion (queued, written by the audit sink)
+    await create_audit_log(
         user_id=current_user.id,
         action="delete",
         resource_type="users",
         resource_id=user_id,
-        details={"username": username},
+        details={"username": db_user.username},
         ip_address=request.client.host if request and request.client else None
     )
 
@@ -0,0 +1,24 @@
+import uuid
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Dict, Optional
+
+class AuditLogResponse(BaseModel):
+    id: uuid.UUID
+    timestamp: datetime
+    user_id: Optional[uuid.UUID] = None
+    action: str
+    resource_type: str
+    resource_id: Optional[uuid.UUID] = None
+    details: Optional[Dict[str, Any]] = None
+    ip_address: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class AuditLogFilters(BaseModel):
+    user_id: Optional[uuid.UUID] = None
+    resource_type: Optional[str] = None
+    resource_id: Optional[uuid.UUID] = None
+    action: Optional[str] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
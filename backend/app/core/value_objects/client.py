@@ -0,0 +1,33 @@
+import re
+import uuid
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+_NON_DIGITS = re.compile(r"\D")
+
+
+def normalize_cpf(value: Any) -> Optional[str]:
+    """
+    The 11 digits of a CPF, without punctuation, or ``None`` when ``value`` is
+    not a valid CPF (wrong length, repeated digit or bad check digits).
+    Leading zeros lost to spreadsheets are put back.
+    """
+    digits = _NON_DIGITS.sub("", str(value or ""))
+    if 9 <= len(digits) < 11:
+        digits = digits.zfill(11)
+    if len(digits) != 11 or digits == digits[0] * 11:
+        return None
+    for size in (9, 10):
+        total = sum(int(digit) * weight for digit, weight in zip(digits, range(size + 1, 1, -1)))
+        if total * 10 % 11 % 10 != int(digits[size]):
+            return None
+    return digits
+
+
+class ClientResponse(BaseModel):
+    id: uuid.UUID
+    name: str
+    cpf: str
+
+    model_config = ConfigDict(from_attributes=True)
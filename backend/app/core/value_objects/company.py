@@ -20,6 +20,7 @@ class CompanyResponse(BaseModel):
     name: str
     cnpj: str
     is_active: bool
+    member_count: Optional[int] = None
 
     model_config = ConfigDict(from_attributes=True)
 
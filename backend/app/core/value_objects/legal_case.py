@@ -1,6 +1,9 @@
 import uuid
+from datetime import datetime
 from typing import Optional, List, Dict
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from app.core.value_objects.cnj import formatted_cnj, parse_cnj
 
 class LegalCaseBase(BaseModel):
     legal_case_number: str
@@ -23,11 +26,63 @@ class LegalCaseBase(BaseModel):
     assignee_from_litigation_team_id: Optional[uuid.UUID] = None
 
 class LegalCaseCreate(LegalCaseBase):
-    pass
+    @field_validator("legal_case_number")
+    @classmethod
+    def cnj_number(cls, value: str) -> str:
+        return formatted_cnj(value)
 
 class LegalCaseUpdate(LegalCaseBase):
-    pass
+    @field_validator("legal_case_number")
+    @classmethod
+    def cnj_number(cls, value: str) -> str:
+        # A number predating the CNJ format may come back unchanged; the use
+        # case rejects it if it differs from the stored one
+        number = parse_cnj(value)
+        return value if number is None else number.formatted
 
 class LegalCaseResponse(LegalCaseBase):
     id: uuid.UUID = Field(...)
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class LegalCaseFilters(BaseModel):
+    state: Optional[str] = Field(None, max_length=50)
+    jurisdiction: Optional[str] = Field(None, max_length=100)
+    judicial_district: Optional[str] = Field(None, max_length=100)
+    court: Optional[str] = Field(None, max_length=100)
+    status: Optional[str] = Field(None, max_length=50)
+    assignee_from_commercial_team_id: Optional[uuid.UUID] = None
+    assignee_from_litigation_team_id: Optional[uuid.UUID] = None
+    case_value_min: Optional[float] = Field(None, ge=0)
+    case_value_max: Optional[float] = Field(None, ge=0)
+    created_since: Optional[datetime] = None
+    created_until: Optional[datetime] = None
+    cnj_year: Optional[int] = Field(None, ge=0, le=9999)
+    cnj_segment: Optional[int] = Field(None, ge=1, le=9)
+    cnj_tribunal: Optional[int] = Field(None, ge=0, le=99)
+    cnj_origin: Optional[int] = Field(None, ge=0, le=9999)
+
+    @model_validator(mode="after")
+    def ranges_are_ordered(self) -> "LegalCaseFilters":
+        if self.case_value_min is not None and self.case_value_max is not None \
+                and self.case_value_min > self.case_value_max:
+            raise ValueError("case_value_min must not exceed case_value_max")
+        if self.created_since is not None and self.created_until is not None \
+                and self.created_since >= self.created_until:
+            raise ValueError("created_since must be before created_until")
+        return self
+
+class LegalCaseSearchResult(LegalCaseResponse):
+    # Text search rank plus case number similarity; higher is better
+    rank: float
+
+class LegalCaseImportError(BaseModel):
+    row: int
+    legal_case_number: Optional[str] = None
+    errors: List[str]
+
+class LegalCaseImportResult(BaseModel):
+    total_rows: int = 0
+    inserted: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: List[LegalCaseImportError] = []
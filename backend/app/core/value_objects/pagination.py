@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    # Exact count, where an index makes it cheap
+    total: Optional[int] = None
+    # Planner estimate of the unfiltered total, only when asked for
+    total_estimate: Optional[int] = None
@@ -0,0 +1,17 @@
+from functools import lru_cache
+from typing import Any, Iterable, List, Type, TypeVar
+
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """One TypeAdapter per type; building them is far costlier than using them."""
+    return TypeAdapter(tp)
+
+
+def validate_many(item_type: Type[T], rows: Iterable[Any]) -> List[T]:
+    """Validate ORM rows into ``item_type`` in a single pydantic-core call."""
+    return type_adapter(List[item_type]).validate_python(rows, from_attributes=True)
@@ -1,11 +1,15 @@
 import logging
 import sys
 
+from .config import settings
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-for name in ("sqlalchemy.engine", "sqlalchemy.engine.Engine", "sqlalchemy.pool", "sqlalchemy.orm"):
-    logger.setLevel(logging.WARNING)
+# SQL echo is driven by settings.database_echo; otherwise keep SQLAlchemy quiet
+if not settings.database_echo:
+    for name in ("sqlalchemy.engine", "sqlalchemy.engine.Engine", "sqlalchemy.pool", "sqlalchemy.orm"):
+        logging.getLogger(name).setLevel(logging.WARNING)
 
 stream_handler = logging.StreamHandler(sys.stdout)
 log_formatter = logging.Formatter("%(asctime)s [%(processName)s: %(process)d] [%(threadName)s: %(thread)d] [%(levelname)s] %(name)s: %(message)s")
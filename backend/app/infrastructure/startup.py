@@ -0,0 +1,31 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class StartupTimer:
+    """Wall-clock durations of the startup phases, reported once the app is ready."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    def mark(self, phase: str) -> None:
+        """Record the time elapsed since the timer was created."""
+        self.phases[phase] = time.perf_counter() - self.started
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[phase] = time.perf_counter() - started
+
+    def report(self) -> str:
+        total = time.perf_counter() - self.started
+        phases = ", ".join(f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in self.phases.items())
+        return f"Startup took {total * 1000:.1f}ms ({phases})"
+
+
+startup_timer = StartupTimer()
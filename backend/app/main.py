@@ -1,23 +1,53 @@
-from fastapi import FastAPI
+from .infrastructure.startup import startup_timer
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+import asyncio
 
-from app.adapters.orm.models.base import Base
-from app.adapters.orm.database import async_engine
+from app.adapters.orm.database import async_engine, describe_engine
+from app.adapters.orm.replica import SAFE_METHODS, client_key, read_your_writes
+from app.adapters.orm.schema import check_schema_version
+from app.adapters.orm.security.audit import audit_sink
+from app.adapters.orm.security.audit_partitions import run_audit_log_partition_maintenance
+from app.adapters.orm.security.hashing import password_hasher
+from app.adapters.orm.security.refresh_tokens import run_refresh_token_maintenance
 from .infrastructure.config import settings
 from .infrastructure.logger import logger
 from .adapters.api import router as api_router
 
+startup_timer.mark("imports")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with async_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    logger.info("Database tables created (if not exist)")
+    # Schema changes are applied out of band (`alembic upgrade head`); boot only checks the version
+    with startup_timer.measure("first_connection"):
+        conn = await async_engine.connect()
+    try:
+        with startup_timer.measure("schema_check"):
+            await check_schema_version(conn, settings.schema_check)
+    finally:
+        await conn.close()
+    logger.info(f"Database engine ({settings.environment}): {describe_engine(async_engine)}")
+    audit_sink.start()
+    audit_partition_maintenance = asyncio.create_task(
+        run_audit_log_partition_maintenance(settings.audit_partition_maintenance_interval_seconds)
+    )
+    refresh_token_maintenance = asyncio.create_task(
+        run_refresh_token_maintenance(settings.refresh_token_prune_interval_seconds)
+    )
+    logger.info(startup_timer.report())
     yield
+    for task in (refresh_token_maintenance, audit_partition_maintenance):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await audit_sink.stop()
+    password_hasher.shutdown()
 
 app = FastAPI(lifespan=lifespan)
 
-origins = settings.get("ALLOWED_ORIGINS")
+origins = settings.allowed_origins
 
 logger.info('API is starting up')
 
@@ -29,4 +59,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def route_reads_after_writes(request: Request, call_next):
+    response = await call_next(request)
+    # Keep the caller's next reads on the primary so it sees its own write
+    if request.method not in SAFE_METHODS and response.status_code < 400:
+        read_your_writes.record(client_key(request))
+    return response
+
 app.include_router(api_router)
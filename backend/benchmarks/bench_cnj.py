@@ -0,0 +1,48 @@
+"""
+Benchmark: bulk CNJ check-digit validation vs. parsing each number.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_cnj
+"""
+import random
+import time
+from typing import List
+
+from app.core.value_objects.cnj import cnj_check_digits, parse_cnj, validate_cnj_numbers
+
+
+def numbers(count: int, seed: int = 0) -> List[str]:
+    """Formatted CNJ numbers, one in ten with a wrong check digit."""
+    rng = random.Random(seed)
+    result = []
+    for i in range(count):
+        sequence = f"{rng.randrange(10 ** 7):07d}"
+        year, segment, tribunal, origin = rng.randrange(1990, 2027), rng.randrange(1, 10), rng.randrange(100), rng.randrange(10000)
+        check = cnj_check_digits(sequence, year, segment, tribunal, origin)
+        if i % 10 == 0:
+            check = f"{(int(check) + 1) % 100:02d}"
+        result.append(f"{sequence}-{check}.{year:04d}.{segment}.{tribunal:02d}.{origin:04d}")
+    return result
+
+
+def run(count: int = 1_000_000) -> None:
+    data = numbers(count)
+
+    start = time.perf_counter()
+    per_number = [parse_cnj(number) is not None for number in data]
+    parsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = validate_cnj_numbers(data)
+    validated = time.perf_counter() - start
+
+    assert bulk == per_number
+    print(f"{'method':24} {'total s':>9} {'ns/number':>11}")
+    print(f"{'parse_cnj per number':24} {parsed:9.3f} {parsed / count * 1e9:11.0f}")
+    print(f"{'validate_cnj_numbers':24} {validated:9.3f} {validated / count * 1e9:11.0f}")
+    print(f"speedup: {parsed / validated:.1f}x, invalid: {bulk.count(False)}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,86 @@
+"""
+Time and peak memory of one 100-row legal-case page read as ORM entities
+versus as projected rows, against an in-memory SQLite database.
+
+    python -m benchmarks.bench_projection [pages]
+"""
+import sys
+import time
+import tracemalloc
+import uuid
+
+from sqlalchemy import Column, MetaData, Table, Uuid, create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.adapters.orm import soft_delete  # noqa: F401
+from app.adapters.orm.models.legal_case import LegalCase
+from app.adapters.orm.pagination import creation_order, project
+from app.core.value_objects.legal_case import LegalCaseResponse
+from app.core.value_objects.validation import validate_many
+
+PAGE = 100
+
+
+def setup() -> Session:
+    engine = create_engine("sqlite://")
+    # SQLite has no text search, so the table is created without its search_vector
+    metadata = MetaData()
+    Table("users", metadata, Column("id", Uuid, primary_key=True))
+    Table(
+        LegalCase.__tablename__,
+        metadata,
+        *(column._copy() for column in LegalCase.__table__.columns if column.name != "search_vector"),
+    )
+    metadata.create_all(engine)
+    session = Session(engine)
+    created_by_id = uuid.uuid4()
+    session.execute(insert(LegalCase), [
+        {
+            "created_by_id": created_by_id,
+            "legal_case_number": f"{i:07d}-12.2024.8.26.0100",
+            "case_value": 15000.0 + i,
+            "case_subject": "Revisão de benefício " * 50,
+            "status": "open",
+        }
+        for i in range(PAGE * 2)
+    ])
+    session.commit()
+    return session
+
+
+def entities(session: Session):
+    rows = session.execute(creation_order(select(LegalCase), LegalCase, None, PAGE)).scalars().all()
+    page = validate_many(LegalCaseResponse, rows[:PAGE])
+    session.expunge_all()
+    return page
+
+
+def projected(session: Session):
+    stmt = project(select(LegalCase), LegalCase, LegalCaseResponse)
+    rows = session.execute(creation_order(stmt, LegalCase, None, PAGE)).mappings().all()
+    return validate_many(LegalCaseResponse, rows[:PAGE])
+
+
+def measure(session: Session, read, pages: int):
+    read(session)
+    start = time.perf_counter()
+    for _ in range(pages):
+        read(session)
+    elapsed = (time.perf_counter() - start) / pages
+    tracemalloc.start()
+    read(session)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(pages: int = 200) -> None:
+    session = setup()
+    print(f"{'read':<10} {'time/page':>10} {'peak memory':>12}")
+    for name, read in (("entities", entities), ("projected", projected)):
+        elapsed, peak = measure(session, read, pages)
+        print(f"{name:<10} {elapsed * 1000:>8.3f}ms {peak / 1024:>10.1f}KiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,83 @@
+"""
+Per-request CPU of the 100-row legal-case listing, before and after the
+single-validation response path.
+
+    python -m benchmarks.bench_responses [requests]
+
+"before" builds the page item by item with ``model_validate`` and lets
+FastAPI validate and encode it again against ``response_model``; "after"
+validates the rows in one call and returns pydantic-core JSON bytes.
+"""
+import sys
+import time
+import uuid
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.adapters.api.responses import model_response
+from app.core.value_objects.legal_case import LegalCaseResponse
+from app.core.value_objects.pagination import CursorPage
+from app.core.value_objects.validation import validate_many
+
+ROWS = [
+    SimpleNamespace(
+        id=uuid.uuid4(),
+        legal_case_number=f"{i:07d}-12.2024.8.26.0100",
+        case_value=15000.0 + i,
+        attorney_fees_value=1500.0,
+        percentage_court_awarded_attorney_fees=10.0,
+        proportion_court_awarded_attorney_fees=None,
+        percentage_contractual_attorney_fees=30.0,
+        case_subject="Revisão de benefício",
+        state="SP",
+        jurisdiction="Federal",
+        judicial_district="São Paulo",
+        court="1ª Vara",
+        defendant="INSS",
+        attorney="Fulano de Tal",
+        clients=[{"name": "Cliente", "cpf": "12345678909"}],
+        status="open",
+        assignee_from_commercial_team_id=uuid.uuid4(),
+        assignee_from_litigation_team_id=None,
+    )
+    for i in range(100)
+]
+
+app = FastAPI()
+
+
+@app.get("/before", response_model=CursorPage[LegalCaseResponse])
+def before():
+    return CursorPage[LegalCaseResponse](items=[LegalCaseResponse.model_validate(row) for row in ROWS])
+
+
+@app.get("/after", response_model=CursorPage[LegalCaseResponse])
+def after():
+    page = CursorPage[LegalCaseResponse](items=validate_many(LegalCaseResponse, ROWS))
+    return model_response(CursorPage[LegalCaseResponse], page)
+
+
+def cpu_per_request(client: TestClient, path: str, requests: int) -> float:
+    for _ in range(20):
+        client.get(path)
+    start = time.process_time()
+    for _ in range(requests):
+        client.get(path)
+    return (time.process_time() - start) / requests
+
+
+def main(requests: int = 500) -> None:
+    with TestClient(app) as client:
+        assert client.get("/before").json() == client.get("/after").json()
+        before_cpu = cpu_per_request(client, "/before", requests)
+        after_cpu = cpu_per_request(client, "/after", requests)
+    print(f"{'path':<8} {'cpu/request':>12}")
+    print(f"{'before':<8} {before_cpu * 1000:>10.3f}ms")
+    print(f"{'after':<8} {after_cpu * 1000:>10.3f}ms")
+    print(f"speedup  {before_cpu / after_cpu:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,58 @@
+"""
+Insert benchmark: random UUIDv4 primary keys vs. time-ordered UUIDv7 keys.
+
+Rows go into a SQLite ``WITHOUT ROWID`` table, whose primary key B-tree holds
+the rows themselves, with a page cache much smaller than the table, the same
+situation as a Postgres primary key index that has outgrown shared buffers.
+Run from the backend directory:
+
+    python -m benchmarks.bench_uuid_keys
+"""
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from typing import Callable, Tuple
+
+from app.adapters.orm.ids import uuid7
+
+
+def insert_rows(new_id: Callable[[], uuid.UUID], rows: int, batch_size: int, directory: str) -> Tuple[float, int]:
+    """Seconds taken to insert ``rows`` rows batch by batch, and the resulting file size."""
+    path = os.path.join(directory, f"{new_id.__name__}.sqlite")
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA cache_size = -2000")  # 2 MiB
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("CREATE TABLE legal_cases (id BLOB PRIMARY KEY, number TEXT, created_at REAL) WITHOUT ROWID")
+    payload = "0001234-71.2024.8.26.0100"
+    start = time.perf_counter()
+    for _ in range(rows // batch_size):
+        with conn:
+            conn.executemany(
+                "INSERT INTO legal_cases VALUES (?, ?, ?)",
+                [(new_id().bytes, payload, time.time()) for _ in range(batch_size)],
+            )
+    elapsed = time.perf_counter() - start
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+    return elapsed, os.path.getsize(path)
+
+
+def run(rows: int = 500_000, batch_size: int = 1000) -> None:
+    print(f"{'key':8} {'generate us':>12} {'insert s':>9} {'rows/s':>9} {'size MiB':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for new_id in (uuid.uuid4, uuid7):
+            start = time.perf_counter()
+            for _ in range(100_000):
+                new_id()
+            generate = (time.perf_counter() - start) / 100_000
+            elapsed, size = insert_rows(new_id, rows, batch_size, directory)
+            print(
+                f"{new_id.__name__:8} {generate * 1e6:12.2f} {elapsed:9.2f} "
+                f"{rows / elapsed:9.0f} {size / 2 ** 20:9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    run()
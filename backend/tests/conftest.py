@@ -0,0 +1,70 @@
+from typing import Any, Callable, Iterable, List, Optional
+
+from sqlalchemy.dialects import postgresql
+
+
+def sql(statement) -> str:
+    """``statement`` as Postgres would receive it, bound values left as placeholders."""
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class FakeResult:
+    """Stands in for the Result accessors the use cases call, all over the same rows."""
+
+    def __init__(self, rows: Iterable[Any] = ()):
+        self.rows = list(rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return self
+
+    def all(self) -> List[Any]:
+        return self.rows
+
+    def first(self) -> Any:
+        return self.rows[0] if self.rows else None
+
+    def one(self) -> Any:
+        (row,) = self.rows
+        return row
+
+
+class FakeSession:
+    """
+    AsyncSession stand-in that records every statement (and its parameters).
+    ``execute`` answers with ``rows``, or with ``respond(statement)`` when
+    given; ``scalar`` answers with ``scalar``.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[Any] = (),
+        scalar: Any = None,
+        respond: Optional[Callable[[Any], Iterable[Any]]] = None,
+    ):
+        self.rows = list(rows)
+        self.scalar_value = scalar
+        self.respond = respond
+        self.statements: List[Any] = []
+        self.params: List[Any] = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        self.params.append(params)
+        return FakeResult(self.respond(statement) if self.respond else self.rows)
+
+    async def scalar(self, statement):
+        self.statements.append(statement)
+        self.params.append(None)
+        return self.scalar_value
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+
+from app.adapters.orm.security.audit_partitions import (
+    expired_partitions,
+    monthly_partitions,
+    partition_upper_bound,
+)
+
+
+def utc(year, month, day=1):
+    return datetime(year, month, day, tzinfo=timezone.utc)
+
+
+def test_monthly_partitions_cross_year_boundary():
+    partitions = list(monthly_partitions(utc(2026, 11, 18), 3))
+
+    assert partitions == [
+        ("audit_logs_p2026_11", utc(2026, 11), utc(2026, 12)),
+        ("audit_logs_p2026_12", utc(2026, 12), utc(2027, 1)),
+        ("audit_logs_p2027_01", utc(2027, 1), utc(2027, 2)),
+    ]
+
+
+def test_partition_upper_bound_ignores_foreign_tables():
+    assert partition_upper_bound("audit_logs_p2026_12") == utc(2027, 1)
+    assert partition_upper_bound("audit_logs_archive") is None
+
+
+def test_expired_partitions_only_include_fully_expired_months():
+    names = ["audit_logs_p2025_09", "audit_logs_p2025_10", "audit_logs_p2025_11", "audit_logs_default"]
+
+    # 12 months before October 2026 is October 2025, which is still retained
+    assert expired_partitions(names, utc(2026, 10, 18), 12) == ["audit_logs_p2025_09"]
+    assert expired_partitions(names, utc(2026, 10, 18), 0) == []
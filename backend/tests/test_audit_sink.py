@@ -0,0 +1,58 @@
+import asyncio
+
+from app.adapters.orm.security.audit import AuditSink
+
+
+class RecordingAuditSink(AuditSink):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.flushed = []
+
+    async def _flush(self, batch):
+        self.flushed.append(list(batch))
+        self.written += len(batch)
+
+
+def test_audit_sink_flushes_by_batch_size_and_drains_on_stop():
+    sink = RecordingAuditSink(max_queue_size=100, batch_size=3, flush_interval=60)
+
+    async def main():
+        sink.start()
+        for i in range(7):
+            await sink.enqueue({"action": str(i)})
+        await sink.stop()
+
+    asyncio.run(main())
+
+    assert [len(batch) for batch in sink.flushed] == [3, 3, 1]
+    assert sink.written == 7
+
+
+def test_audit_sink_flushes_by_time():
+    sink = RecordingAuditSink(max_queue_size=100, batch_size=100, flush_interval=0.01)
+
+    async def main():
+        sink.start()
+        await sink.enqueue({"action": "login"})
+        await asyncio.sleep(0.05)
+        flushed_before_stop = len(sink.flushed)
+        await sink.stop()
+        return flushed_before_stop
+
+    assert asyncio.run(main()) == 1
+
+
+def test_audit_sink_applies_backpressure_when_full():
+    sink = RecordingAuditSink(max_queue_size=1, batch_size=10, flush_interval=60)
+
+    async def main():
+        sink._queue = asyncio.Queue(maxsize=1)
+        await sink.enqueue({"action": "first"})
+        blocked = asyncio.ensure_future(sink.enqueue({"action": "second"}))
+        await asyncio.sleep(0.01)
+        was_blocked = not blocked.done()
+        sink._queue.get_nowait()
+        await blocked
+        return was_blocked
+
+    assert asyncio.run(main())
@@ -0,0 +1,91 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from app.core.use_cases.client import client_links, get_client_legal_cases_use_case, sync_legal_case_clients
+from app.core.value_objects.client import normalize_cpf
+from tests.conftest import FakeSession, sql
+
+CPF = "52998224725"
+
+
+def upserting_session(cpfs):
+    """Session whose client upsert returns a fresh id for each of ``cpfs``."""
+    return FakeSession(respond=lambda statement: [
+        SimpleNamespace(id=uuid.uuid4(), cpf=cpf) for cpf in cpfs
+    ] if "INSERT INTO clients" in sql(statement) else [])
+
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("529.982.247-25", CPF),
+    (CPF, CPF),
+    (" 529 982 247 25 ", CPF),
+    ("1234567890", "01234567890"),
+    ("52998224726", None),
+    ("111.111.111-11", None),
+    ("123", None),
+    (None, None),
+])
+def test_normalize_cpf(value, expected):
+    assert normalize_cpf(value) == expected
+
+
+def test_client_links_dedupe_by_cpf_and_skip_invalid_entries():
+    first, second = uuid.uuid4(), uuid.uuid4()
+
+    names, links = client_links([
+        (first, [{"name": "Maria", "cpf": "529.982.247-25"}, {"name": "No CPF"}, "junk"]),
+        (second, [{"name": "Maria Silva", "cpf": CPF}, {"name": "Bad", "cpf": "000"}]),
+        (uuid.uuid4(), None),
+    ])
+
+    assert names == {CPF: "Maria Silva"}
+    assert links == {(first, CPF), (second, CPF)}
+
+
+def test_sync_replaces_links_and_upserts_clients_on_cpf():
+    db = upserting_session([CPF])
+    legal_case_id = uuid.uuid4()
+
+    asyncio.run(sync_legal_case_clients(db, [(legal_case_id, [{"name": "Maria", "cpf": CPF}])]))
+
+    statements = [sql(statement) for statement in db.statements]
+    assert statements[0].startswith("DELETE FROM legal_case_clients")
+    assert "ON CONFLICT (cpf) WHERE is_deleted = false DO UPDATE SET name = excluded.name" in statements[1]
+    assert statements[2].startswith("INSERT INTO legal_case_clients")
+    assert db.params[2][0]["legal_case_id"] == legal_case_id
+
+
+def test_sync_without_clients_only_clears_links():
+    db = FakeSession()
+
+    asyncio.run(sync_legal_case_clients(db, [(uuid.uuid4(), [])]))
+
+    assert len(db.statements) == 1
+
+
+def test_lookup_joins_through_the_cpf_index():
+    db = FakeSession(scalar=uuid.uuid4())
+
+    page = asyncio.run(get_client_legal_cases_use_case("529.982.247-25", db))
+
+    compiled = db.statements[0].compile(dialect=postgresql.dialect())
+    assert "JOIN legal_case_clients ON legal_case_clients.legal_case_id = legal_cases.id" in str(compiled)
+    assert "clients.cpf = " in str(compiled)
+    assert CPF in compiled.params.values()
+    assert page.items == []
+
+
+def test_lookup_rejects_invalid_cpf_and_unknown_clients():
+    with pytest.raises(HTTPException) as invalid:
+        asyncio.run(get_client_legal_cases_use_case("123", FakeSession()))
+    with pytest.raises(HTTPException) as missing:
+        asyncio.run(get_client_legal_cases_use_case(CPF, FakeSession()))
+
+    assert invalid.value.status_code == 422
+    assert missing.value.status_code == 404
@@ -0,0 +1,121 @@
+import asyncio
+import random
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.core.use_cases.legal_case import update_legal_case_use_case, validate_legal_case_numbers_use_case
+from app.core.value_objects.cnj import cnj_check_digits, parse_cnj, validate_cnj_numbers
+from app.core.value_objects.legal_case import LegalCaseCreate, LegalCaseFilters, LegalCaseUpdate
+from tests.conftest import FakeSession
+
+VALID = "0001234-71.2024.8.26.0100"
+
+
+def test_parse_cnj_reads_components():
+    number = parse_cnj(" 00012347120248260100 ")
+
+    assert number.formatted == VALID
+    assert number.columns() == {"cnj_year": 2024, "cnj_segment": 8, "cnj_tribunal": 26, "cnj_origin": 100}
+    assert cnj_check_digits("0001234", 2024, 8, 26, 100) == "71"
+
+
+@pytest.mark.parametrize("value", [
+    "0001234-56.2024.8.26.0100",  # wrong check digits
+    "0001234-71.2024.8.26.010",
+    "0001234-71/2024.8.26.0100",
+    "٠٠٠١٢٣٤-71.2024.8.26.0100",  # non-ASCII digits
+    "",
+])
+def test_parse_cnj_rejects_invalid_numbers(value):
+    assert parse_cnj(value) is None
+
+
+def test_bulk_validation_matches_parse_cnj():
+    rng = random.Random(1)
+    mixed = []
+    for _ in range(2000):
+        sequence, year, tribunal = f"{rng.randrange(10 ** 7):07d}", rng.randrange(1990, 2027), rng.randrange(100)
+        check = cnj_check_digits(sequence, year, 8, tribunal, 100)
+        mixed.append(f"{sequence}-{check}.{year}.8.{tribunal:02d}.0100")
+    for i in range(0, len(mixed), 7):
+        characters = list(mixed[i])
+        characters[rng.randrange(len(characters))] = rng.choice("0123456789-.x ")
+        mixed[i] = "".join(characters)
+    mixed += ["00012347120248260100", " " + VALID, "", "é" * 25, VALID + "0"]
+
+    assert validate_cnj_numbers(mixed) == [parse_cnj(value) is not None for value in mixed]
+    assert validate_cnj_numbers([]) == []
+
+
+@pytest.mark.parametrize("mixed_lengths", [True, False])
+def test_bulk_validation_strips_like_parse_cnj(mixed_lengths):
+    edge = [
+        "  00012347120248260100   ",  # 25 characters once padded
+        "\t" + VALID,
+        VALID + "\n",
+        " " + VALID[:-1] + " ",  # 25 characters, one digit short
+        "0001234-71.2024.8.26.0100"[::-1],
+        "00012347120248260100",
+        "0001234-71.2024.8.26.0100 ",
+    ]
+    # Without an odd-length entry every number is 25 characters and the
+    # bulk path skips the per-number normalisation
+    numbers = [value for value in edge if mixed_lengths or len(value) == 25]
+
+    assert validate_cnj_numbers(numbers) == [parse_cnj(value) is not None for value in numbers]
+    assert [validate_cnj_numbers([value]) == [parse_cnj(value) is not None] for value in edge] == [True] * len(edge)
+
+
+def test_validate_legal_case_numbers_counts_invalid():
+    result = validate_legal_case_numbers_use_case([VALID, "0001234-56.2024.8.26.0100"])
+
+    assert result.valid == [True, False]
+    assert result.invalid_count == 1
+
+
+def test_legal_case_number_is_normalized_and_checked():
+    assert LegalCaseCreate(legal_case_number="00012347120248260100").legal_case_number == VALID
+    with pytest.raises(ValidationError):
+        LegalCaseCreate(legal_case_number="0001234-56.2024.8.26.0100")
+
+
+def test_cnj_component_filters_are_bounded():
+    assert LegalCaseFilters(cnj_segment=8, cnj_tribunal=26).cnj_tribunal == 26
+    with pytest.raises(ValidationError):
+        LegalCaseFilters(cnj_segment=0)
+
+
+async def _no_audit(**kwargs):
+    pass
+
+
+def test_update_keeps_an_unchanged_pre_cnj_number(monkeypatch):
+    from app.core.use_cases import legal_case as use_cases
+
+    monkeypatch.setattr(use_cases, "create_audit_log", _no_audit)
+    case = SimpleNamespace(id=uuid.uuid4(), clients=None)
+    db = FakeSession(rows=[case], scalar="123/2019")
+    update = LegalCaseUpdate(legal_case_number="123/2019", status="closed")
+
+    assert asyncio.run(use_cases.update_legal_case_use_case(case.id, update, SimpleNamespace(id=None), db)) is case
+
+    params = db.statements[-1].compile().params
+    assert params["legal_case_number"] == "123/2019"
+    assert params["cnj_year"] is None
+
+
+def test_update_rejects_a_changed_non_cnj_number():
+    db = FakeSession(scalar="123/2019")
+    update = LegalCaseUpdate(legal_case_number="124/2019")
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(update_legal_case_use_case(uuid.uuid4(), update, SimpleNamespace(id=None), db))
+    assert exc_info.value.status_code == 422
+
+
+def test_update_normalizes_cnj_numbers():
+    assert LegalCaseUpdate(legal_case_number="00012347120248260100").legal_case_number == VALID
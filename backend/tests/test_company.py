@@ -0,0 +1,97 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.use_cases import company as use_cases
+from app.core.use_cases.company import (
+    get_companies_use_case,
+    get_company_members_use_case,
+    get_my_companies_use_case,
+)
+from app.core.value_objects.company import CompanyCreate, CompanyUpdate
+from tests.conftest import FakeSession, sql
+
+
+def test_my_companies_pages_through_memberships_in_sql():
+    db = FakeSession(scalar=3)
+    user = SimpleNamespace(id=uuid.uuid4())
+
+    page = asyncio.run(get_my_companies_use_case(db, None, 10, user))
+
+    assert page.total == 3
+    assert page.items == [] and page.next_cursor is None
+    page_sql, count_sql = (sql(statement) for statement in db.statements)
+    assert "JOIN company_user ON company_user.company_id = company.id" in page_sql
+    assert "WHERE company_user.user_id = " in page_sql
+    assert "LIMIT" in page_sql
+    assert count_sql.startswith("SELECT count(*) AS count_1 \nFROM company_user")
+
+
+def test_company_listing_is_one_query_with_member_counts():
+    db = FakeSession()
+
+    asyncio.run(get_companies_use_case(db, None, 10))
+
+    assert len(db.statements) == 1
+    listing = sql(db.statements[0])
+    assert (
+        "(SELECT count(*) AS count_1 \nFROM company_user JOIN users ON users.id = company_user.user_id \n"
+        "WHERE company_user.company_id = company.id AND users.is_deleted = false)"
+    ) in listing
+
+
+def test_company_members_page_joins_memberships():
+    db = FakeSession(scalar=uuid.uuid4())
+    company_id = uuid.uuid4()
+
+    page = asyncio.run(get_company_members_use_case(company_id, db))
+
+    assert page.items == []
+    members_sql = sql(db.statements[0])
+    assert "JOIN company_user ON company_user.user_id = users.id" in members_sql
+    assert "WHERE company_user.company_id = " in members_sql
+    assert "ORDER BY users.created_at DESC, users.id DESC" in members_sql
+
+
+def test_company_members_of_missing_company_is_404():
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(get_company_members_use_case(uuid.uuid4(), FakeSession()))
+    assert exc_info.value.status_code == 404
+
+
+
+async def _no_audit(**kwargs):
+    pass
+
+
+def _assert_read_back_with_member_count(db, company, returned):
+    assert returned is company
+    read_back = db.statements[-1]
+    assert read_back.get_execution_options()["populate_existing"] is True
+    assert "(SELECT count(*) AS count_1 \nFROM company_user" in sql(read_back)
+
+
+def test_created_company_is_read_back_with_member_count(monkeypatch):
+    monkeypatch.setattr(use_cases, "create_audit_log", _no_audit)
+    company = SimpleNamespace(id=uuid.uuid4())
+    db = FakeSession(rows=[company])
+    create = CompanyCreate(name="Acme", cnpj="12345678000190")
+
+    returned = asyncio.run(use_cases.create_company_use_case(create, None, db, SimpleNamespace(id=uuid.uuid4())))
+
+    _assert_read_back_with_member_count(db, company, returned)
+
+
+def test_updated_company_is_read_back_with_member_count(monkeypatch):
+    monkeypatch.setattr(use_cases, "create_audit_log", _no_audit)
+    company = SimpleNamespace(id=uuid.uuid4())
+    db = FakeSession(rows=[company])
+
+    returned = asyncio.run(
+        use_cases.update_company_use_case(company.id, CompanyUpdate(name="Acme"), None, db, SimpleNamespace(id=uuid.uuid4()))
+    )
+
+    _assert_read_back_with_member_count(db, company, returned)
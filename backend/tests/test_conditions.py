@@ -0,0 +1,85 @@
+import ipaddress
+from datetime import time
+
+import pytest
+
+from app.adapters.orm.security.conditions import (
+    Condition,
+    IpPrefixTrie,
+    compile_conditions,
+    register_condition,
+    CONDITION_TYPES,
+)
+
+
+def test_time_window_is_parsed_once():
+    compiled = compile_conditions({"time_between": ["09:00", "17:00"]})
+
+    assert compiled.matches({"current_time": time(9, 0)})
+    assert compiled.matches({"current_time": time(17, 0)})
+    assert not compiled.matches({"current_time": time(17, 1)})
+
+
+def test_ip_range_supports_literal_ips_and_cidr():
+    compiled = compile_conditions({"ip_range": ["192.168.1.10", "10.0.0.0/8", "2001:db8::/32"]})
+
+    assert compiled.matches({"ip_address": "192.168.1.10"})
+    assert not compiled.matches({"ip_address": "192.168.1.11"})
+    assert compiled.matches({"ip_address": "10.255.3.4"})
+    assert compiled.matches({"ip_address": "2001:db8::1"})
+    assert compiled.matches({"ip_address": "::ffff:10.1.2.3"})
+    assert not compiled.matches({"ip_address": "not-an-ip"})
+    assert not compiled.matches({})
+
+
+def test_prefix_trie_matches_longest_and_shortest_prefixes():
+    trie = IpPrefixTrie([ipaddress.ip_network("172.16.0.0/12")])
+
+    assert ipaddress.ip_address("172.31.255.255") in trie
+    assert ipaddress.ip_address("172.32.0.0") not in trie
+    assert ipaddress.ip_address("::1") not in trie
+
+
+def test_all_conditions_must_match():
+    compiled = compile_conditions({"time_between": ["09:00", "17:00"], "ip_range": ["10.0.0.0/8"]})
+
+    assert compiled.matches({"current_time": time(10, 0), "ip_address": "10.0.0.1"})
+    assert not compiled.matches({"current_time": time(10, 0), "ip_address": "11.0.0.1"})
+
+
+def test_malformed_conditions_raise_value_error():
+    with pytest.raises(ValueError):
+        compile_conditions({"time_between": ["9am"]})
+    with pytest.raises(ValueError):
+        compile_conditions({"ip_range": ["10.0.0.0/33"]})
+
+
+def test_custom_condition_types_can_be_registered():
+    @register_condition("weekday_in")
+    class WeekdayCondition(Condition):
+        def __init__(self, days):
+            self.days = frozenset(days)
+
+        @classmethod
+        def from_value(cls, value):
+            return cls(value)
+
+        def matches(self, context):
+            return context.get("weekday") in self.days
+
+    try:
+        compiled = compile_conditions({"weekday_in": [0, 1]})
+        assert compiled.matches({"weekday": 1})
+        assert not compiled.matches({"weekday": 5})
+    finally:
+        CONDITION_TYPES.pop("weekday_in")
+
+
+def test_incomplete_condition_types_fail_on_instantiation():
+    class NoMatches(Condition):
+        @classmethod
+        def from_value(cls, value):
+            return cls()
+
+    with pytest.raises(TypeError):
+        NoMatches.from_value(None)
@@ -0,0 +1,38 @@
+from app.infrastructure.config import Settings
+
+
+def test_settings_defaults_depend_on_environment():
+    development = Settings.from_env({"ENVIRONMENT": "development"})
+    production = Settings.from_env({"ENVIRONMENT": "production"})
+
+    assert development.database_echo is True
+    assert production.database_echo is False
+    assert production.database_pool_size > development.database_pool_size
+
+
+def test_explicit_environment_variables_override_environment_defaults():
+    settings = Settings.from_env({
+        "ENVIRONMENT": "production",
+        "DATABASE_ECHO": "true",
+        "DATABASE_POOL_SIZE": "7",
+        "DATABASE_STATEMENT_CACHE_SIZE": "0",
+    })
+
+    assert settings.database_echo is True
+    assert settings.database_pool_size == 7
+    assert settings.database_statement_cache_size == 0
+
+
+def test_allowed_origins_accept_comma_separated_and_json_lists():
+    assert Settings.from_env({"ALLOWED_ORIGINS": "https://a.example, https://b.example"}).allowed_origins == [
+        "https://a.example",
+        "https://b.example",
+    ]
+    assert Settings.from_env({"ALLOWED_ORIGINS": '["https://a.example"]'}).allowed_origins == ["https://a.example"]
+
+
+def test_unset_environment_is_production_without_sql_echo():
+    settings = Settings.from_env({})
+
+    assert settings.environment == "production"
+    assert settings.database_echo is False
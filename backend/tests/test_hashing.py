@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from app.adapters.orm.security.hashing import PasswordHasher
+
+
+def test_password_hasher_runs_off_loop_and_records_timings():
+    hasher = PasswordHasher(workers=2, max_queue=0)
+
+    async def main():
+        return await hasher.run(lambda: threading.current_thread().name)
+
+    try:
+        thread_name = asyncio.run(main())
+    finally:
+        hasher.shutdown()
+
+    assert thread_name.startswith("password-hasher")
+    stats = hasher.stats()
+    assert stats["execution_time"]["count"] == 1
+    assert stats["wait_time"]["count"] == 1
+    assert stats["in_flight"] == 0
+
+
+def test_password_hasher_rejects_when_queue_is_full():
+    hasher = PasswordHasher(workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def main():
+        pending = [asyncio.ensure_future(hasher.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc_info:
+            await hasher.run(release.wait)
+        release.set()
+        await asyncio.gather(*pending)
+        return exc_info.value
+
+    try:
+        error = asyncio.run(main())
+    finally:
+        hasher.shutdown()
+
+    assert error.status_code == 503
+    assert hasher.rejected == 1
+
+
+def test_password_hasher_rejects_unknown_executor_kind():
+    with pytest.raises(ValueError):
+        PasswordHasher(kind="fiber")
@@ -0,0 +1,35 @@
+import time
+import uuid
+
+from app.adapters.orm.ids import uuid7
+from app.adapters.orm.models.base import Base
+
+
+def test_uuid7_layout():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    # The counter may run a few milliseconds ahead of the clock
+    assert before <= value.int >> 80 <= after + 2
+
+
+def test_uuid7_is_strictly_increasing():
+    values = [uuid7() for _ in range(20000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_primary_keys_are_uuid7_without_duplicate_unique_index():
+    for table in Base.metadata.sorted_tables:
+        if "id" not in table.c or not table.c.id.primary_key:
+            continue
+        assert table.c.id.default.arg.__name__ == "uuid7", table.name
+        assert not table.c.id.unique, table.name
+        assert not [
+            constraint for constraint in table.constraints
+            if constraint.__class__.__name__ == "UniqueConstraint" and list(constraint.columns.keys()) == ["id"]
+        ], table.name
@@ -0,0 +1,78 @@
+import csv
+import io
+import json
+import uuid
+import zipfile
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.use_cases.legal_case import legal_cases_query
+from app.core.use_cases.legal_case_export import ENCODERS, EXPORT_COLUMNS, export_query
+from app.infrastructure.xlsx import StreamingXlsxWriter
+
+
+def make_row(number="0001234-56.2024.8.26.0100"):
+    values = {column: None for column in EXPORT_COLUMNS}
+    values.update(
+        id=uuid.uuid4(),
+        legal_case_number=number,
+        case_value=1500.5,
+        clients=[{"name": "Ana & Cia", "cpf": "123"}],
+    )
+    return tuple(values[column] for column in EXPORT_COLUMNS)
+
+
+def encode(export_format, batches):
+    encoder = ENCODERS[export_format]()
+    return encoder.header() + b"".join(encoder.rows(batch) for batch in batches) + encoder.close()
+
+
+def test_export_query_selects_plain_columns_in_creation_order():
+    sql = str(export_query(legal_cases_query()).compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("SELECT legal_cases.legal_case_number,")
+    assert "legal_cases.created_by_id" not in sql
+    assert sql.endswith("ORDER BY legal_cases.created_at, legal_cases.id")
+
+
+def test_csv_export():
+    data = encode("csv", [[make_row("1")], [make_row("2")]])
+
+    assert data.startswith("\ufeff".encode())
+    rows = list(csv.DictReader(io.StringIO(data.decode("utf-8-sig"))))
+    assert [row["legal_case_number"] for row in rows] == ["1", "2"]
+    assert json.loads(rows[0]["clients"]) == [{"name": "Ana & Cia", "cpf": "123"}]
+
+
+def test_ndjson_export():
+    lines = encode("ndjson", [[make_row("1"), make_row("2")]]).decode().splitlines()
+
+    assert [json.loads(line)["legal_case_number"] for line in lines] == ["1", "2"]
+    assert json.loads(lines[0])["case_value"] == 1500.5
+
+
+def test_xlsx_export_is_a_valid_workbook():
+    data = encode("xlsx", [[make_row("1")], [make_row("2")]])
+
+    with zipfile.ZipFile(io.BytesIO(data)) as workbook:
+        assert workbook.testzip() is None
+        assert "xl/workbook.xml" in workbook.namelist()
+        sheet = workbook.read("xl/worksheets/sheet1.xml").decode()
+    assert sheet.count("<row>") == 3
+    assert "<v>1500.5</v>" in sheet
+    assert "Ana &amp; Cia" in sheet
+
+
+def test_xlsx_writer_drains_incrementally():
+    writer = StreamingXlsxWriter()
+    chunks = [writer.drain()]
+    for i in range(5000):
+        writer.write_row([f"case-{i}", i, uuid.uuid4().hex])
+        if i % 500 == 0:
+            chunks.append(writer.drain())
+    chunks.append(writer.close())
+
+    assert sum(1 for chunk in chunks[:-1] if chunk) > 1
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as workbook:
+        sheet = workbook.read("xl/worksheets/sheet1.xml").decode()
+    assert sheet.count("<row>") == 5000
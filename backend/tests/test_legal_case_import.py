@@ -0,0 +1,88 @@
+import io
+import json
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.use_cases.legal_case_import import (
+    DATA_COLUMNS,
+    STAGING_COLUMNS,
+    _UPSERT,
+    error_report_csv,
+    prepare_batch,
+    read_csv_rows,
+    read_import_rows,
+)
+from app.core.value_objects.legal_case import LegalCaseImportResult
+
+CSV = (
+    "\ufeffLegal Case Number,Case Value,Clients,Status\n"
+    '0001234-71.2024.8.26.0100,1500.50,"[{""name"": ""Ana"", ""cpf"": ""123""}]",open\n'
+    "0001235-56.2024.8.26.0100,not a number,,open\n"
+    "0001234-71.2024.8.26.0100,10,,closed\n"
+    ",,,\n"
+)
+
+
+def rows():
+    return enumerate(read_csv_rows(io.BytesIO(CSV.encode())), start=2)
+
+
+def test_csv_headers_are_normalized_and_bom_stripped():
+    first = next(read_csv_rows(io.BytesIO(CSV.encode())))
+
+    assert first["legal_case_number"] == "0001234-71.2024.8.26.0100"
+    assert first["case_value"] == "1500.50"
+
+
+def test_prepare_batch_validates_and_reports_per_row():
+    user_id = uuid.uuid4()
+    seen = {}
+
+    count, records, errors = prepare_batch(rows(), 100, user_id, seen)
+
+    assert count == 4
+    assert len(records) == 1
+    record = dict(zip(STAGING_COLUMNS, records[0]))
+    assert record["created_by_id"] == user_id
+    assert record["is_deleted"] is False
+    assert record["case_value"] == 1500.5
+    assert json.loads(record["clients"]) == [{"name": "Ana", "cpf": "123"}]
+
+    assert [error.row for error in errors] == [3, 4, 5]
+    assert errors[0].errors[0].startswith("case_value:")
+    assert errors[1].errors == ["legal_case_number: duplicate of row 2"]
+    assert errors[2].errors[0].startswith("legal_case_number:")
+
+
+def test_prepare_batch_reads_in_batches():
+    numbered = rows()
+    seen = {}
+
+    assert prepare_batch(numbered, 2, uuid.uuid4(), seen)[0] == 2
+    assert prepare_batch(numbered, 2, uuid.uuid4(), seen)[0] == 2
+    assert prepare_batch(numbered, 2, uuid.uuid4(), seen)[0] == 0
+
+
+def test_upsert_targets_live_rows_and_keeps_case_number():
+    sql = _UPSERT.text
+
+    assert "ON CONFLICT (legal_case_number) WHERE is_deleted = false DO UPDATE SET" in sql
+    assert "legal_case_number = EXCLUDED.legal_case_number" not in sql
+    assert all(f"{column} = EXCLUDED.{column}" in sql for column in DATA_COLUMNS if column != "legal_case_number")
+
+
+def test_unsupported_file_type_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        read_import_rows("cases.pdf", io.BytesIO())
+    assert exc_info.value.status_code == 415
+
+
+def test_error_report_csv():
+    _, _, errors = prepare_batch(rows(), 100, uuid.uuid4(), {})
+    report = error_report_csv(LegalCaseImportResult(errors=errors, failed=len(errors)))
+
+    lines = report.splitlines()
+    assert lines[0] == "row,legal_case_number,errors"
+    assert lines[2] == "4,0001234-71.2024.8.26.0100,legal_case_number: duplicate of row 2"
@@ -0,0 +1,67 @@
+import asyncio
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from app.adapters.orm.models.legal_case import LegalCase
+from app.adapters.orm.pagination import encode_cursor
+from app.core.use_cases.legal_case_search import search_criteria, search_legal_cases_use_case
+from app.main import app
+from tests.conftest import FakeSession, sql
+
+
+def row(rank):
+    values = {name: None for name in LegalCase.__table__.columns.keys()}
+    values.update(id=uuid.uuid4(), legal_case_number="0001234-56.2024.8.26.0100", rank=rank)
+    return values
+
+
+def test_search_vector_is_a_generated_column():
+    ddl = str(CreateTable(LegalCase.__table__).compile(dialect=postgresql.dialect()))
+
+    assert "search_vector TSVECTOR GENERATED ALWAYS AS (" in ddl
+    assert "jsonb_path_query_array(clients::jsonb, '$[*].name')" in ddl
+
+
+def test_words_only_use_full_text_search():
+    match, _ = search_criteria("maria silva")
+
+    assert "@@ websearch_to_tsquery('portuguese'::regconfig" in sql(match)
+    assert "ILIKE" not in sql(match)
+
+
+def test_number_fragments_also_match_case_numbers():
+    match, rank = search_criteria(" 1234-56 ")
+
+    assert "legal_cases.legal_case_number ILIKE" in sql(match)
+    assert "similarity(legal_cases.legal_case_number" in sql(rank)
+
+
+def test_search_pages_by_rank_then_id():
+    rows = [row(0.9), row(0.5), row(0.1)]
+    db = FakeSession(rows)
+
+    page = asyncio.run(search_legal_cases_use_case(db, "silva", limit=2))
+
+    statement = sql(db.statements[0])
+    assert "AS rank" in statement
+    assert "DESC, legal_cases.id DESC" in statement
+    assert [item.rank for item in page.items] == [0.9, 0.5]
+    assert page.next_cursor == encode_cursor((0.5, rows[1]["id"]))
+
+
+def test_search_rejects_malformed_cursor():
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(search_legal_cases_use_case(FakeSession(), "silva", cursor=encode_cursor(("high", "x"))))
+
+    assert exc_info.value.status_code == 400
+
+
+def test_search_requires_authentication():
+    response = TestClient(app).get("/api/v1/legal-cases/search", params={"q": "acme"})
+
+    assert response.status_code == 401
@@ -0,0 +1,113 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import column
+from sqlalchemy.dialects import postgresql
+
+from app.adapters.orm.pagination import decode_cursor, encode_cursor, keyset_predicate, next_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 10, 18, 12, 30, tzinfo=timezone.utc)
+    row_id = uuid.uuid4()
+
+    cursor = encode_cursor((created_at, row_id))
+    timestamp, decoded_id = decode_cursor(cursor, 2)
+
+    assert datetime.fromisoformat(timestamp) == created_at
+    assert uuid.UUID(decoded_id) == row_id
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", encode_cursor([1]), encode_cursor({"a": 1})])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, 2)
+    assert exc_info.value.status_code == 400
+
+
+def test_keyset_predicate_uses_row_value_comparison():
+    predicate = keyset_predicate((column("created_at"), column("id")), (1, 2), descending=True)
+    sql = str(predicate.compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("(created_at, id) < (")
+
+
+def test_next_cursor_only_when_more_rows_exist():
+    assert next_cursor([1, 2], 2, lambda row: (row,)) is None
+    assert decode_cursor(next_cursor([1, 2, 3], 2, lambda row: (row,)), 1) == [2]
+
+
+def test_creation_order_pages_newest_first_after_cursor():
+    from sqlalchemy import select
+    from app.adapters.orm.models.user import User
+    from app.adapters.orm.pagination import creation_order
+
+    cursor = encode_cursor((datetime(2026, 1, 1, tzinfo=timezone.utc), uuid.uuid4()))
+    sql = str(creation_order(select(User), User, cursor, 50).compile(dialect=postgresql.dialect()))
+
+    assert "(users.created_at, users.id) < (" in sql
+    assert "ORDER BY users.created_at DESC, users.id DESC" in sql
+
+
+def test_creation_order_rejects_malformed_cursor_values():
+    from sqlalchemy import select
+    from app.adapters.orm.models.user import User
+    from app.adapters.orm.pagination import creation_order
+
+    with pytest.raises(HTTPException) as exc_info:
+        creation_order(select(User), User, encode_cursor(("yesterday", "not-a-uuid")), 50)
+    assert exc_info.value.status_code == 400
+
+
+def test_project_selects_only_response_columns():
+    from sqlalchemy import select
+    from app.adapters.orm.models.user import User
+    from app.adapters.orm.pagination import project
+    from app.core.value_objects.user import UserResponse
+
+    sql = str(project(select(User), User, UserResponse).compile(dialect=postgresql.dialect()))
+    selected = sql.split("FROM")[0]
+
+    assert "users.username" in selected and "users.created_at" in selected
+    assert "password_hash" not in selected and "is_deleted" not in selected
+
+
+def test_projected_rows_are_not_tracked_and_skip_soft_deleted():
+    from sqlalchemy import create_engine, select, update
+    from sqlalchemy.orm import Session
+    from app.adapters.orm import soft_delete
+    from app.adapters.orm.models.base import Base
+    from app.adapters.orm.models.user import User
+    from app.adapters.orm.pagination import creation_order, project
+    from app.core.value_objects.user import UserResponse
+    from app.core.value_objects.validation import validate_many
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    with Session(engine) as session:
+        session.add_all([
+            User(username=name, email=f"{name}@example.com", first_name=name, last_name=name,
+                 password_hash="x", is_active=True, is_superuser=False)
+            for name in ("alice", "bob")
+        ])
+        session.commit()
+        session.execute(update(User).where(User.username == "bob").values(**soft_delete.soft_delete_values()))
+        session.commit()
+        session.expunge_all()
+
+        rows = session.execute(creation_order(project(select(User), User, UserResponse), User, None, 10)).mappings().all()
+
+        assert len(session.identity_map) == 0
+        assert [user.username for user in validate_many(UserResponse, rows)] == ["alice"]
+
+
+def test_audit_log_listing_rejects_malformed_cursor_values():
+    import asyncio
+    from app.core.use_cases.audit_log import list_audit_logs_use_case
+    from app.core.value_objects.audit_log import AuditLogFilters
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(list_audit_logs_use_case(None, AuditLogFilters(), encode_cursor(("not-a-date", "x"))))
+    assert exc_info.value.status_code == 400
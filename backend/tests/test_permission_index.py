@@ -0,0 +1,53 @@
+from datetime import time
+from types import SimpleNamespace
+
+from app.adapters.orm.security.permission_index import PermissionIndex
+
+
+def make_permission(resource, action, conditions=None):
+    return SimpleNamespace(
+        name=f"{resource}:{action}",
+        resource=resource,
+        action=action,
+        conditions=conditions,
+        compiled_conditions=None,
+    )
+
+
+def make_user(direct=(), role_permissions=(), group_role_permissions=()):
+    return SimpleNamespace(
+        direct_permissions=list(direct),
+        roles=[SimpleNamespace(permissions=list(role_permissions))],
+        groups=[SimpleNamespace(roles=[SimpleNamespace(permissions=list(group_role_permissions))])],
+    )
+
+
+def test_permission_index_flattens_direct_role_and_group_permissions():
+    user = make_user(
+        direct=[make_permission("users", "list")],
+        role_permissions=[make_permission("companies", "create")],
+        group_role_permissions=[make_permission("permissions", "delete")],
+    )
+    index = PermissionIndex.from_user(user)
+
+    assert index.allows("users", "list")
+    assert index.allows("companies", "create")
+    assert index.allows("permissions", "delete")
+    assert not index.allows("users", "delete")
+
+
+def test_permission_index_conditions():
+    business_hours = {"time_between": ["09:00", "17:00"]}
+    index = PermissionIndex([make_permission("users", "update", business_hours)])
+
+    assert index.allows("users", "update", {"current_time": time(10, 0)})
+    assert not index.allows("users", "update", {"current_time": time(20, 0)})
+
+
+def test_permission_index_unconditional_grant_wins():
+    index = PermissionIndex([
+        make_permission("users", "update", {"ip_range": ["10.0.0.1"]}),
+        make_permission("users", "update"),
+    ])
+
+    assert index.allows("users", "update", {"ip_address": "192.168.0.1"})
@@ -0,0 +1,69 @@
+import uuid
+from types import SimpleNamespace
+
+from app.adapters.orm.security.principal_cache import PrincipalCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_user(username="alice"):
+    return SimpleNamespace(
+        id=uuid.uuid4(), username=username, direct_permissions=[], roles=[], groups=[]
+    )
+
+
+def test_principal_cache_hit_and_miss():
+    cache = PrincipalCache(max_size=10, ttl_seconds=60)
+    user = make_user()
+
+    assert cache.get(("alice", 1)) is None
+    cache.set(("alice", 1), user)
+
+    assert cache.get(("alice", 1)).user is user
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_principal_cache_ttl_expiry():
+    clock = FakeClock()
+    cache = PrincipalCache(max_size=10, ttl_seconds=5, clock=clock)
+    cache.set(("alice", None), make_user())
+
+    clock.now = 4.9
+    assert cache.get(("alice", None)) is not None
+    clock.now = 5.0
+    assert cache.get(("alice", None)) is None
+    assert len(cache) == 0
+
+
+def test_principal_cache_lru_eviction():
+    cache = PrincipalCache(max_size=2, ttl_seconds=60)
+    cache.set(("a", 1), make_user("a"))
+    cache.set(("b", 1), make_user("b"))
+    cache.get(("a", 1))
+    cache.set(("c", 1), make_user("c"))
+
+    assert cache.get(("b", 1)) is None
+    assert cache.get(("a", 1)) is not None
+    assert cache.get(("c", 1)) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_principal_cache_invalidate_user():
+    cache = PrincipalCache(max_size=10, ttl_seconds=60)
+    alice = make_user("alice")
+    bob = make_user("bob")
+    cache.set(("alice", 1), alice)
+    cache.set(("alice", 2), alice)
+    cache.set(("bob", 1), bob)
+
+    assert cache.invalidate_user(alice.id) == 2
+    assert cache.get(("alice", 1)) is None
+    assert cache.get(("alice", 2)) is None
+    assert cache.get(("bob", 1)) is not None
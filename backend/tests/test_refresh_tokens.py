@@ -0,0 +1,40 @@
+from app.adapters.orm.security.refresh_tokens import BloomFilter, hash_refresh_token
+
+
+def test_hash_refresh_token_is_fixed_size_and_stable():
+    token_hash = hash_refresh_token("header.payload.signature" * 20)
+
+    assert len(token_hash) == 64
+    assert token_hash == hash_refresh_token("header.payload.signature" * 20)
+    assert token_hash != hash_refresh_token("another.token")
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    hashes = [hash_refresh_token(f"token-{i}") for i in range(1000)]
+    for token_hash in hashes:
+        bloom.add(token_hash)
+
+    assert all(token_hash in bloom for token_hash in hashes)
+
+
+def test_bloom_filter_false_positive_rate_is_bounded():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(hash_refresh_token(f"revoked-{i}"))
+
+    false_positives = sum(hash_refresh_token(f"live-{i}") in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_bloom_filter_replace_and_clear():
+    bloom = BloomFilter(capacity=100)
+    token_hash = hash_refresh_token("token")
+    bloom.add(token_hash)
+
+    bloom.replace(BloomFilter(capacity=100))
+    assert token_hash not in bloom
+
+    bloom.add(token_hash)
+    bloom.clear()
+    assert token_hash not in bloom
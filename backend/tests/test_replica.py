@@ -0,0 +1,126 @@
+import asyncio
+
+from app.adapters.orm.replica import ReadYourWrites, ReplicaRouter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class FakeConnection:
+    def __init__(self, lag):
+        self.lag = lag
+
+    async def execute(self, statement):
+        return FakeResult(self.lag)
+
+
+class FakeSession:
+    def __init__(self, name, healthy=True, lag=0.0):
+        self.name = name
+        self.healthy = healthy
+        self.lag = lag
+        self.closed = False
+
+    async def connection(self):
+        if not self.healthy:
+            raise ConnectionRefusedError("replica down")
+        return FakeConnection(self.lag)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeSessionmaker:
+    def __init__(self, name, healthy=True, lag=0.0):
+        self.name = name
+        self.healthy = healthy
+        self.lag = lag
+
+    def __call__(self):
+        return FakeSession(self.name, self.healthy, self.lag)
+
+
+def make_router(replica=None, clock=None):
+    clock = clock or FakeClock()
+    return ReplicaRouter(
+        FakeSessionmaker("primary"),
+        replica,
+        ReadYourWrites(window_seconds=5, clock=clock),
+        retry_seconds=30,
+        max_lag_seconds=10,
+        clock=clock,
+    )
+
+
+def test_read_your_writes_window_expires():
+    clock = FakeClock()
+    tracker = ReadYourWrites(window_seconds=5, clock=clock)
+    tracker.record("alice")
+
+    assert tracker.is_sticky("alice")
+    assert not tracker.is_sticky("bob")
+    clock.now = 5
+    assert not tracker.is_sticky("alice")
+    assert len(tracker) == 0
+
+
+def test_read_your_writes_is_bounded():
+    tracker = ReadYourWrites(window_seconds=5, max_entries=2)
+    for key in ("a", "b", "c"):
+        tracker.record(key)
+
+    assert len(tracker) == 2
+    assert not tracker.is_sticky("a")
+
+
+def test_reads_go_to_primary_without_replica():
+    router = make_router()
+
+    session = asyncio.run(router.open_session("alice"))
+
+    assert session.name == "primary"
+    assert router.stats()["replica_configured"] is False
+
+
+def test_reads_go_to_replica_unless_client_just_wrote():
+    router = make_router(FakeSessionmaker("replica"))
+
+    assert asyncio.run(router.open_session("alice")).name == "replica"
+    router.read_your_writes.record("alice")
+    assert asyncio.run(router.open_session("alice")).name == "primary"
+    assert asyncio.run(router.open_session("bob")).name == "replica"
+
+
+def test_unhealthy_replica_falls_back_and_is_retried_later():
+    clock = FakeClock()
+    replica = FakeSessionmaker("replica", healthy=False)
+    router = make_router(replica, clock)
+
+    assert asyncio.run(router.open_session()).name == "primary"
+    assert not router.replica_available()
+    assert router.stats()["fallbacks"] == 1
+
+    replica.healthy = True
+    assert asyncio.run(router.open_session()).name == "primary"
+    clock.now = 30
+    assert asyncio.run(router.open_session()).name == "replica"
+
+
+def test_lagging_replica_falls_back():
+    router = make_router(FakeSessionmaker("replica", lag=60.0))
+
+    assert asyncio.run(router.open_session()).name == "primary"
+    assert not router.replica_available()
@@ -0,0 +1,60 @@
+import asyncio
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.adapters.orm.models.legal_case import LegalCase
+from app.adapters.orm.repository import delete_returning, insert_returning, update_returning
+from tests.conftest import FakeSession, sql
+
+
+def test_insert_returning_is_one_statement():
+    db = FakeSession(rows=["legal case"])
+
+    result = asyncio.run(insert_returning(db, LegalCase, {"legal_case_number": "1"}))
+
+    assert result == "legal case"
+    assert len(db.statements) == 1
+    assert sql(db.statements[0]).startswith("INSERT INTO legal_cases")
+    assert "RETURNING" in sql(db.statements[0])
+
+
+def test_update_returning_is_one_statement():
+    db = FakeSession(rows=["legal case"])
+
+    asyncio.run(update_returning(db, LegalCase, uuid.uuid4(), {"status": "closed"}))
+
+    assert len(db.statements) == 1
+    statement = sql(db.statements[0])
+    assert statement.startswith("UPDATE legal_cases SET status=")
+    assert "RETURNING" in statement
+
+
+def test_update_returning_without_changes_selects():
+    db = FakeSession(rows=["legal case"])
+
+    asyncio.run(update_returning(db, LegalCase, uuid.uuid4(), {}))
+
+    assert sql(db.statements[0]).startswith("SELECT")
+
+
+def test_update_and_delete_returning_raise_404_when_missing():
+    with pytest.raises(HTTPException) as update_error:
+        asyncio.run(update_returning(FakeSession(), LegalCase, uuid.uuid4(), {"status": "x"}, not_found="Legal case not found"))
+    with pytest.raises(HTTPException) as delete_error:
+        asyncio.run(delete_returning(FakeSession(), LegalCase, uuid.uuid4(), LegalCase.legal_case_number))
+
+    assert update_error.value.status_code == 404
+    assert update_error.value.detail == "Legal case not found"
+    assert delete_error.value.status_code == 404
+
+
+def test_delete_returning_returns_requested_columns():
+    db = FakeSession(rows=[("123",)])
+
+    asyncio.run(delete_returning(db, LegalCase, uuid.uuid4(), LegalCase.legal_case_number))
+
+    statement = sql(db.statements[0])
+    assert statement.startswith("DELETE FROM legal_cases")
+    assert statement.endswith("RETURNING legal_cases.legal_case_number")
@@ -0,0 +1,39 @@
+import json
+import uuid
+from types import SimpleNamespace
+
+from app.adapters.api.responses import model_response
+from app.core.value_objects.legal_case import LegalCaseResponse
+from app.core.value_objects.pagination import CursorPage
+from app.core.value_objects.validation import type_adapter, validate_many
+
+
+def legal_case(number):
+    values = dict.fromkeys(LegalCaseResponse.model_fields)
+    values.update(id=uuid.uuid4(), legal_case_number=number)
+    return SimpleNamespace(**values)
+
+
+def test_type_adapters_are_cached():
+    assert type_adapter(CursorPage[LegalCaseResponse]) is type_adapter(CursorPage[LegalCaseResponse])
+
+
+def test_validate_many_reads_attributes():
+    rows = [legal_case(str(i)) for i in range(3)]
+
+    items = validate_many(LegalCaseResponse, rows)
+
+    assert [item.legal_case_number for item in items] == ["0", "1", "2"]
+    assert all(isinstance(item, LegalCaseResponse) for item in items)
+
+
+def test_model_response_serialises_once_to_json_bytes():
+    page = CursorPage[LegalCaseResponse](items=validate_many(LegalCaseResponse, [legal_case("1")]))
+
+    response = model_response(CursorPage[LegalCaseResponse], page, status_code=201)
+
+    assert response.status_code == 201
+    assert response.media_type == "application/json"
+    body = json.loads(response.body)
+    assert body["items"][0]["legal_case_number"] == "1"
+    assert body["next_cursor"] is None
@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import Session
+
+from app.adapters.orm import soft_delete  # noqa: F401
+from app.adapters.orm.models import User
+from app.adapters.orm.models.base import Base
+from app.adapters.orm.soft_delete import soft_delete_values
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[User.__table__])
+    with Session(engine) as session:
+        session.add_all([
+            User(username="alice", email="alice@example.com", first_name="A", last_name="A", password_hash="x"),
+            User(username="bob", email="bob@example.com", first_name="B", last_name="B", password_hash="x"),
+        ])
+        session.commit()
+        session.execute(update(User).where(User.username == "bob").values(**soft_delete_values()))
+        session.commit()
+        yield session
+
+
+def test_selects_skip_soft_deleted_rows(session):
+    assert session.scalars(select(User.username)).all() == ["alice"]
+    assert session.scalar(select(User).where(User.username == "bob")) is None
+
+
+def test_include_deleted_escape_hatch(session):
+    usernames = session.scalars(select(User.username).execution_options(include_deleted=True)).all()
+
+    assert sorted(usernames) == ["alice", "bob"]
+
+
+def test_updates_do_not_touch_soft_deleted_rows(session):
+    result = session.execute(
+        update(User).where(User.username == "bob").values(first_name="Robert").returning(User.id)
+    )
+
+    assert result.all() == []
+
+
+def test_soft_delete_values_mark_a_tombstone():
+    values = soft_delete_values()
+
+    assert values["is_deleted"] is True
+    assert values["deleted_at"].tzinfo is not None
@@ -0,0 +1,19 @@
+from app.adapters.orm.schema import head_revisions
+from app.infrastructure.startup import StartupTimer
+
+
+def test_startup_timer_records_phases():
+    timer = StartupTimer()
+    with timer.measure("engine_creation"):
+        pass
+    timer.mark("imports")
+
+    assert set(timer.phases) == {"engine_creation", "imports"}
+    assert all(seconds >= 0 for seconds in timer.phases.values())
+    report = timer.report()
+    assert report.startswith("Startup took")
+    assert "engine_creation=" in report and "imports=" in report
+
+
+def test_migrations_have_a_single_head():
+    assert len(head_revisions()) == 1
@@ -4,6 +4,7 @@ import { Button } from "@/components/ui/button";
 import { Card } from "@/components/ui/card";
 import { useState } from "react";
 import { Company } from "@/types/company";
+import { CursorPage } from "@/types/pagination";
 // import { API_URL } from "@/common/config";
 import { CreateCompanyForm } from "@/components/forms/CreateCompanyForm";
 import { Avatar } from "@radix-ui/react-avatar";
@@ -22,10 +23,18 @@ export function Companies() {
     enabled: !loadingAuth, // don't run until AuthProvider finished
     queryFn: async () => {
       try {
-        const res = await axios.get("/api/v1/companies/me", {
-          withCredentials: true,
-        });
-        return res.data as Company[];
+        // The endpoint is cursor-paginated; a user belongs to few companies, so read every page
+        const companies: Company[] = [];
+        let cursor: string | null = null;
+        do {
+          const res = await axios.get<CursorPage<Company>>("/api/v1/companies/me", {
+            params: cursor ? { cursor } : undefined,
+            withCredentials: true,
+          });
+          companies.push(...res.data.items);
+          cursor = res.data.next_cursor;
+        } while (cursor);
+        return companies;
       } catch (err: any) {
         throw new Error(err?.response?.data?.detail || "Failed to fetch companies");
       }
@@ -8,25 +8,37 @@ import { Button } from "@/components/ui/button"
 import { useNavigate } from "@tanstack/react-router"
 import { useCompany } from "@/common/CompanyProvider"
 
-import { useQuery } from "@tanstack/react-query"
+import { useInfiniteQuery } from "@tanstack/react-query"
 import axios from "axios"
+import { CursorPage } from "@/types/pagination"
 
 export function LegalCases() {
   const navigate = useNavigate();
   const { currentCompany } = useCompany();
 
-  const { data: cases, isLoading, error } = useQuery({
+  const {
+    data: pages,
+    isLoading,
+    error,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
     queryKey: ["legal-cases", currentCompany?.id],
-    queryFn: async () => {
+    queryFn: async ({ pageParam }) => {
       // request backend; include company_id to scope results if available
-      const url = currentCompany?.id
-        ? `/api/v1/legal-cases/?company_id=${currentCompany.id}`
-        : `/api/v1/legal-cases/`
-      const res = await axios.get(url, { withCredentials: true })
-      return res.data as any[]
+      const params = new URLSearchParams()
+      if (currentCompany?.id) params.set("company_id", currentCompany.id)
+      if (pageParam) params.set("cursor", pageParam)
+      const res = await axios.get(`/api/v1/legal-cases/?${params}`, { withCredentials: true })
+      return res.data as CursorPage<any>
     },
+    initialPageParam: null as string | null,
+    // the backend sends next_cursor: null on the last page
+    getNextPageParam: (lastPage) => lastPage.next_cursor,
     enabled: !!currentCompany?.id,
   })
+  const cases = pages?.pages.flatMap((page) => page.items)
 
   // map backend shape to DataTable schema
   if (!currentCompany?.id) {
@@ -93,7 +105,21 @@ export function LegalCases() {
               ) : error ? (
                 <div className="p-4 text-sm text-red-600">Erro ao carregar processos</div>
               ) : (
-                <DataTable data={tableData} />
+                <>
+                  <DataTable data={tableData} />
+                  {hasNextPage && (
+                    <div className="flex justify-center">
+                      <Button
+                        variant="outline"
+                        size="sm"
+                        disabled={isFetchingNextPage}
+                        onClick={() => fetchNextPage()}
+                      >
+                        {isFetchingNextPage ? "Carregando…" : "Carregar mais processos"}
+                      </Button>
+                    </div>
+                  )}
+                </>
               )}
             </div>
           </div>
@@ -0,0 +1,7 @@
+// Keyset-paginated list responses; pass next_cursor back as ?cursor= for the next page
+export interface CursorPage<T> {
+  items: T[];
+  next_cursor: string | null;
+  total?: number | null;
+  total_estimate?: number | null;
+}